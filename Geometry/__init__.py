@@ -3,12 +3,6 @@
 
 """
 
-try:
-    __import__('pkg_resources').declare_namespace(__name__)
-except:
-    from pkgutil import extend_path
-    __path__ = extend_path(__path__, __name__)
-
 __author__ = '\n'.join(["Erik O'Shaughnessy",
                         'erik.oshaughnessy@gmail.com',
                         'https://github.com/JnyJny/Geometry'])
@@ -19,19 +13,54 @@ from .exceptions import (ZeroSlope, InfiniteSlope, CollinearPoints,
                          InfiniteLength, ParallelLines, CollinearLines)
 from .point import Point, PointSequence, MutablePointSequence
 from .line import Line, Segment, Ray
-from .ellipse import Ellipse, Circle
-from .polygon import Polygon, MutablePolygon
-from .triangle2 import Triangle
-from .rectangle import Rectangle
-from .graph import Node, Edge, Graph
+from .polygon import Polygon, MutablePolygon, PreparedPolygon
+
+# Names below are imported from their modules on first use, so that
+# 'import Geometry' does not pay for numpy or the less used shapes.
+
+_lazy = {'PointArray': 'pointarray',
+         'Transform': 'transform',
+         'Ellipse': 'ellipse',
+         'Circle': 'ellipse',
+         'Triangle': 'triangle2',
+         'Rectangle': 'rectangle',
+         'Node': 'graph',
+         'Edge': 'graph',
+         'Graph': 'graph',
+         'convexHull': 'hull',
+         'IncrementalHull': 'hull',
+         'triangulate': 'triangulation',
+         'segmentIntersections': 'sweep',
+         'PackedPointSequence': 'packed',
+         'PackedPolygon': 'packed'}
+
+
+def __getattr__(name):
+    try:
+        module = _lazy[name]
+    except KeyError:
+        msg = "module '{}' has no attribute '{}'".format(__name__, name)
+        raise AttributeError(msg) from None
+
+    from importlib import import_module
+    value = getattr(import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
 
 
-__all__ = ['Point', 'PointSequence', 'MutablePointSequence',
-           'Polygon','MutablePolygon',
+__all__ = ['Point', 'PointSequence', 'MutablePointSequence', 'PointArray',
+           'Polygon','MutablePolygon', 'PreparedPolygon',
+           'PackedPointSequence', 'PackedPolygon',
            'Ellipse', 'Circle',
            'Line', 'Segment', 'Ray',
            'Triangle', 'Rectangle',
            'Graph', 'Node', 'Edge',
+           'Transform', 'convexHull', 'IncrementalHull', 'triangulate',
+           'segmentIntersections',
            'ZeroSlope', 'InfiniteSlope', 'CollinearPoints',
            'InfiniteLength', 'ParallelLines', 'CollinearLines',
            '__author__', '__version__']
@@ -0,0 +1,182 @@
+'''rotating calipers in the XY plane
+
+The farthest pair of points, the minimum width and the minimum area
+bounding rectangle of a point set are all found on its convex hull.
+Each function computes the hull in O(n log n) and then turns a set
+of calipers once around it in O(h) for a hull of h vertices:
+
+ - diameter: for each hull edge, the vertex farthest from the edge
+   line is antipodal to both of its ends; the farthest pair is among
+   the antipodal pairs.
+
+ - minimumWidth: the narrowest strip holding the points has one side
+   along a hull edge, its width is the distance from that edge to
+   the farthest vertex.
+
+ - minimumAreaRectangle: the smallest rectangle holding the points
+   has one side along a hull edge (Freeman and Shapira, 1975). The
+   vertices touching the other three sides only move forward as the
+   edges turn.
+'''
+
+import math
+
+from .point import Point
+
+
+def _hull(points):
+    '''
+    :points: PointArray, PointSequence or iterable of point equivalents
+    :return: list of (x, y) tuples
+
+    Module private function, the counter-clockwise convex hull
+    without collinear vertices. Raises ValueError if there are no
+    points.
+    '''
+    from .hull import convexHull
+
+    xy = convexHull(points).xy
+    if not xy:
+        raise ValueError('no points')
+    return xy
+
+
+def _cross(a, b, c):
+    '''
+    :a: (x, y) tuple
+    :b: (x, y) tuple
+    :c: (x, y) tuple
+    :return: float, twice the signed area of the triangle a, b, c
+    '''
+    return ((b[0] - a[0]) * (c[1] - a[1])) - ((b[1] - a[1]) * (c[0] - a[0]))
+
+
+def _antipodes(xy):
+    '''
+    :xy: list of (x, y) tuples, a convex counter-clockwise polygon
+         with at least three vertices
+    :return: generator of (integer, integer) pairs
+
+    Module private function, for each edge i from xy[i] to xy[i + 1]
+    the index of the vertex farthest from the edge line, found by
+    walking forward from the vertex of the previous edge.
+    '''
+    n = len(xy)
+    j = 1
+    for i in range(n):
+        a, b = xy[i], xy[(i + 1) % n]
+        while _cross(a, b, xy[(j + 1) % n]) > _cross(a, b, xy[j]):
+            j = (j + 1) % n
+        yield i, j
+
+
+def diameter(points):
+    '''
+    :points: PointArray, PointSequence or iterable of point equivalents
+    :return: Segment
+
+    The segment between the two points farthest apart in the XY
+    plane. A single point gives a segment of length zero. Raises
+    ValueError if there are no points.
+    '''
+    from .line import Segment
+
+    xy = _hull(points)
+    n = len(xy)
+
+    if n < 3:
+        best = (xy[0], xy[-1])
+    else:
+        best, longest = None, -1.0
+        for i, j in _antipodes(xy):
+            p = xy[j]
+            for q in (xy[i], xy[(i + 1) % n]):
+                d = ((p[0] - q[0]) ** 2) + ((p[1] - q[1]) ** 2)
+                if d > longest:
+                    best, longest = (q, p), d
+
+    return Segment(Point(best[0]), Point(best[1]))
+
+
+def minimumWidth(points):
+    '''
+    :points: PointArray, PointSequence or iterable of point equivalents
+    :return: float
+
+    The width of the narrowest strip between two parallel lines
+    which holds all of the points in the XY plane. Collinear points
+    have width zero. Raises ValueError if there are no points.
+    '''
+    xy = _hull(points)
+    n = len(xy)
+    if n < 3:
+        return 0.0
+
+    width = math.inf
+    for i, j in _antipodes(xy):
+        a, b = xy[i], xy[(i + 1) % n]
+        d = _cross(a, b, xy[j]) / math.hypot(b[0] - a[0], b[1] - a[1])
+        width = min(width, d)
+    return width
+
+
+def minimumAreaRectangle(points):
+    '''
+    :points: PointArray, PointSequence or iterable of point equivalents
+    :return: Rectangle
+
+    The rotated rectangle with the smallest area which holds all of
+    the points in the XY plane. The side AB of the result lies along
+    an edge of the convex hull and the rectangle extends to the left
+    of AB, so width and height are never negative. Collinear points
+    give a rectangle of height zero along the line. Raises ValueError
+    if there are no points.
+    '''
+    from .rectangle import Rectangle
+
+    xy = _hull(points)
+    n = len(xy)
+
+    if n < 3:
+        (ax, ay), (bx, by) = xy[0], xy[-1]
+        theta = math.degrees(math.atan2(by - ay, bx - ax))
+        return Rectangle(Point(ax, ay), math.hypot(bx - ax, by - ay), 0,
+                         theta)
+
+    def along(k, ex, ey):
+        return (xy[k][0] * ex) + (xy[k][1] * ey)
+
+    best = None
+    right = left = top = 0
+    for i in range(n):
+        (ax, ay), (bx, by) = xy[i], xy[(i + 1) % n]
+        length = math.hypot(bx - ax, by - ay)
+        ex, ey = (bx - ax) / length, (by - ay) / length
+
+        if i == 0:
+            right = 1
+        while along((right + 1) % n, ex, ey) > along(right, ex, ey):
+            right = (right + 1) % n
+
+        if i == 0:
+            top = right
+        while (along((top + 1) % n, -ey, ex) >
+               along(top, -ey, ex)):
+            top = (top + 1) % n
+
+        if i == 0:
+            left = top
+        while along((left + 1) % n, ex, ey) < along(left, ex, ey):
+            left = (left + 1) % n
+
+        lo = along(left, ex, ey)
+        width = along(right, ex, ey) - lo
+        height = along(top, -ey, ex) - along(i, -ey, ex)
+        area = width * height
+        if best is None or area < best[0]:
+            shift = lo - along(i, ex, ey)
+            best = (area, ax + (shift * ex), ay + (shift * ey),
+                    width, height, math.degrees(math.atan2(ey, ex)))
+
+    area, x, y, width, height, theta = best
+    return Rectangle(Point(x, y), width, height, theta)
@@ -0,0 +1,548 @@
+'''boolean operations on polygons
+
+intersection, union, difference and xor overlay two simple polygons
+in the XY plane and return the result as a list of Polygons. Outer
+boundaries are counter-clockwise and holes are clockwise.
+
+The overlay works on edges, in the manner of Greiner and Hormann:
+
+1. Edges of one polygon are tested against edges of the other with
+   a sweep over X, so only edges whose X ranges overlap are compared.
+
+2. Every edge is cut where the other polygon crosses or touches it,
+   so no piece crosses the other polygon's boundary.
+
+3. Each piece is inside or outside of the other polygon, decided by
+   the winding number of its midpoint, or lies on an edge of the
+   other polygon going the same or the opposite direction. Pieces
+   between two points where the polygons meet share their fate, so
+   only one midpoint per run of pieces is located.
+
+4. The operation keeps pieces by their classification, reversing
+   some of them, and the kept pieces are chained into rings.
+
+Intersections of two small convex polygons skip all of this and use
+the Sutherland-Hodgman algorithm, see clipConvex. Polygons whose
+bounds do not overlap skip the first three steps, every edge is
+outside of the other polygon.
+'''
+
+import math
+
+from .point import Point
+
+
+def _cross(a, b, c):
+    '''
+    :a: (x, y) tuple
+    :b: (x, y) tuple
+    :c: (x, y) tuple
+    :return: float, positive if a, b, c turn counter-clockwise
+    '''
+    return ((b[0] - a[0]) * (c[1] - a[1])) - ((b[1] - a[1]) * (c[0] - a[0]))
+
+
+def _ring(polygon):
+    '''
+    :polygon: Polygon or iterable of point equivalents
+    :return: list of (x, y) tuples
+
+    Module private function, the vertices in counter-clockwise order
+    without repeated consecutive points. Empty if the polygon has no
+    area.
+    '''
+    try:
+        xy = polygon.xy
+    except AttributeError:
+        points = [Point._convert(v) for v in polygon]
+        xy = [(p.x, p.y) for p in points]
+
+    xy = [xy[i] for i in range(len(xy)) if xy[i] != xy[i - 1]]
+
+    area = 0.0
+    for (ax, ay), (bx, by) in zip(xy, xy[1:] + xy[:1]):
+        area += (ax * by) - (bx * ay)
+
+    if area == 0:
+        return []
+    if area < 0:
+        xy.reverse()
+    return xy
+
+
+def _box(polygon, xy):
+    '''
+    :polygon: Polygon or iterable of point equivalents
+    :xy: list of (x, y) tuples, the ring of polygon
+    :return: (xmin, ymin, xmax, ymax) tuple or None if xy is empty
+
+    Module private function, uses the cached bounds of a Polygon.
+    '''
+    if not xy:
+        return None
+    try:
+        (xmin, ymin, _), (xmax, ymax, _) = polygon.bounds
+    except AttributeError:
+        xs = [p[0] for p in xy]
+        ys = [p[1] for p in xy]
+        return min(xs), min(ys), max(xs), max(ys)
+    return xmin, ymin, xmax, ymax
+
+
+def _apart(boxes):
+    '''
+    :boxes: pair of (xmin, ymin, xmax, ymax) tuples or None
+    :return: boolean, True if the boxes have no point in common
+    '''
+    a, b = boxes
+    if a is None or b is None:
+        return True
+    return a[2] < b[0] or b[2] < a[0] or a[3] < b[1] or b[3] < a[1]
+
+
+def _simplified(xy):
+    '''
+    :xy: list of (x, y) tuples
+    :return: list of (x, y) tuples
+
+    Module private function, removes repeated points and vertices
+    in the middle of straight edges.
+    '''
+    while len(xy) >= 3:
+        xy = [xy[i] for i in range(len(xy)) if xy[i] != xy[i - 1]]
+        n = len(xy)
+        keep = [xy[i] for i in range(n)
+                if _cross(xy[i - 1], xy[i], xy[(i + 1) % n]) != 0]
+        if len(keep) == n:
+            break
+        xy = keep
+    return xy
+
+
+def _isConvex(xy):
+    '''
+    :xy: list of (x, y) tuples, counter-clockwise without repeats
+    :return: boolean
+
+    Module private function, True if every turn is to the left and
+    the boundary goes around only once.
+    '''
+    n = len(xy)
+    if n < 3:
+        return False
+
+    flips = 0
+    previous = 0
+    for i in range(n):
+        a, b, c = xy[i - 2], xy[i - 1], xy[i]
+        if _cross(a, b, c) < 0:
+            return False
+        dx = c[0] - b[0]
+        direction = (dx > 0) - (dx < 0)
+        if direction:
+            if previous and direction != previous:
+                flips += 1
+            previous = direction
+    return flips <= 2
+
+
+def clipConvex(subject, clip):
+    '''
+    :subject: Polygon or iterable of point equivalents
+    :clip:    convex Polygon or iterable of point equivalents
+    :return: list of (x, y) tuples
+
+    The part of subject inside clip with the Sutherland-Hodgman
+    algorithm, which trims subject by each edge of clip in turn in
+    O(n * m) time with no setup.
+
+    If a concave subject is cut into several pieces they come back
+    as a single ring joined by zero width edges along the boundary
+    of clip.
+
+    Raises ValueError if clip is not convex.
+    '''
+    output = _ring(subject)
+    window = _ring(clip)
+
+    if not _isConvex(window):
+        raise ValueError('clip polygon is not convex')
+
+    for a, b in zip(window, window[1:] + window[:1]):
+        vertices, output = output, []
+        if not vertices:
+            break
+        s = vertices[-1]
+        ds = _cross(a, b, s)
+        for e in vertices:
+            de = _cross(a, b, e)
+            if (de >= 0) != (ds >= 0):
+                t = ds / (ds - de)
+                output.append((s[0] + (t * (e[0] - s[0])),
+                               s[1] + (t * (e[1] - s[1]))))
+            if de >= 0:
+                output.append(e)
+            s, ds = e, de
+
+    return output
+
+
+def _crossings(edges):
+    '''
+    :edges: list of (p, q, owner) with p, q (x, y) tuples and owner 0
+            or 1
+    :return: list of lists of (x, y) tuples
+
+    Module private function, the points where each edge meets an
+    edge of the other owner, including its own end points.
+
+    Edges are visited in order of their smallest X coordinate and
+    compared only with the edges of the other owner which are still
+    active, those whose X range has not been passed.
+    '''
+    splits = [[p, q] for p, q, owner in edges]
+    boxes = [(min(p[0], q[0]), max(p[0], q[0]),
+              min(p[1], q[1]), max(p[1], q[1])) for p, q, owner in edges]
+    order = sorted(range(len(edges)), key=lambda k: boxes[k][0])
+
+    active = ([], [])
+    for i in order:
+        p1, p2, owner = edges[i]
+        xmin, xmax, ymin, ymax = boxes[i]
+
+        current = []
+        for j in active[1 - owner]:
+            qxmin, qxmax, qymin, qymax = boxes[j]
+            if qxmax < xmin:
+                continue
+            current.append(j)
+            if qymax < ymin or qymin > ymax:
+                continue
+
+            q1, q2, other = edges[j]
+            d1 = _cross(q1, q2, p1)
+            d2 = _cross(q1, q2, p2)
+            d3 = _cross(p1, p2, q1)
+            d4 = _cross(p1, p2, q2)
+
+            if ((d1 > 0 > d2) or (d1 < 0 < d2)) and \
+               ((d3 > 0 > d4) or (d3 < 0 < d4)):
+                t = d1 / (d1 - d2)
+                x = (p1[0] + (t * (p2[0] - p1[0])),
+                     p1[1] + (t * (p2[1] - p1[1])))
+                splits[i].append(x)
+                splits[j].append(x)
+                continue
+
+            # end points lying on the other edge, which includes
+            # overlapping collinear edges.
+            for d, p in ((d1, p1), (d2, p2)):
+                if d == 0 and _within(p, q1, q2):
+                    splits[j].append(p)
+            for d, q in ((d3, q1), (d4, q2)):
+                if d == 0 and _within(q, p1, p2):
+                    splits[i].append(q)
+
+        active[1 - owner][:] = current
+        active[owner].append(i)
+
+    return splits
+
+
+def _within(p, a, b):
+    '''
+    :p: (x, y) tuple
+    :a: (x, y) tuple
+    :b: (x, y) tuple
+    :return: boolean, True if p is in the bounding box of a and b
+    '''
+    return (min(a[0], b[0]) <= p[0] <= max(a[0], b[0]) and
+            min(a[1], b[1]) <= p[1] <= max(a[1], b[1]))
+
+
+def _pieces(p, q, points):
+    '''
+    :p: (x, y) tuple, start of the edge
+    :q: (x, y) tuple, end of the edge
+    :points: list of (x, y) tuples on the edge
+    :return: list of (start, end) tuples
+
+    Module private function, the edge cut at each of the points.
+    '''
+    if len(points) == 2:
+        return [(p, q)]
+
+    if abs(q[0] - p[0]) >= abs(q[1] - p[1]):
+        axis = 0
+    else:
+        axis = 1
+    points.sort(key=lambda v: v[axis], reverse=q[axis] < p[axis])
+
+    pieces = []
+    for a, b in zip(points, points[1:]):
+        if a != b:
+            pieces.append((a, b))
+    return pieces
+
+
+# Sutherland-Hodgman does n * m work with almost no overhead and
+# is used for intersections of convex polygons up to this size.
+
+_ConvexLimit = 4096
+
+# Above this many point and edge pairs, pieces are located in the
+# other polygon with a PreparedPolygon rather than edge by edge.
+
+_WindingLimit = 1 << 24
+
+
+# For each operation, which pieces of the first (A) and second (B)
+# polygon are kept: pieces inside or outside of the other polygon
+# and pieces of A on an edge of B going the same or the opposite way.
+# Pieces kept as -1 are reversed.
+
+_Rules = {'intersection': {'A': {'inside': 1, 'same': 1},
+                           'B': {'inside': 1}},
+          'union': {'A': {'outside': 1, 'same': 1},
+                    'B': {'outside': 1}},
+          'difference': {'A': {'outside': 1, 'opposite': 1},
+                         'B': {'inside': -1}},
+          'xor': {'A': {'outside': 1, 'inside': -1},
+                  'B': {'outside': 1, 'inside': -1}}}
+
+
+def _winding(xy, points):
+    '''
+    :xy: list of (x, y) tuples, a counter-clockwise polygon
+    :points: list of (x, y) tuples
+    :return: list of booleans, True for points inside the polygon
+
+    Module private function, the non-zero winding rule evaluated for
+    blocks of points against every edge at once. Many points are
+    located with a PreparedPolygon instead.
+    '''
+    import numpy
+
+    if len(points) * len(xy) > _WindingLimit:
+        from .polygon import PreparedPolygon
+        queries = numpy.array(points, dtype=float)
+        return PreparedPolygon(xy).containsPoints(queries).tolist()
+
+    a = numpy.array(xy, dtype=float)
+    b = numpy.roll(a, -1, axis=0)
+    up = a[:, 1] <= b[:, 1]
+    lo = numpy.where(up[:, numpy.newaxis], a, b)
+    hi = numpy.where(up[:, numpy.newaxis], b, a)
+    direction = numpy.where(up, 1, -1)
+    ax, ay, bx, by = lo[:, 0], lo[:, 1], hi[:, 0], hi[:, 1]
+
+    queries = numpy.array(points, dtype=float).reshape(-1, 2)
+    block = max(1, (1 << 22) // len(xy))
+    inside = []
+    for start in range(0, len(queries), block):
+        px = queries[start:start + block, 0, numpy.newaxis]
+        py = queries[start:start + block, 1, numpy.newaxis]
+        cross = ((bx - ax) * (py - ay)) - ((px - ax) * (by - ay))
+        crossing = (ay <= py) & (py < by) & (cross > 0)
+        winding = numpy.dot(crossing, direction)
+        inside.extend((winding != 0).tolist())
+    return inside
+
+
+def _classify(pieces, cuts, other, otherPieces):
+    '''
+    :pieces: list of (p, q) tuples of one polygon, in order
+    :cuts: set of (x, y) tuples where the polygons meet
+    :other: list of (x, y) tuples, the other polygon
+    :otherPieces: set of (p, q) tuples of the other polygon
+    :return: list of strings
+
+    Module private function, 'inside', 'outside', 'same' or
+    'opposite' for each piece.
+
+    The pieces between two points where the polygons meet are all
+    inside or all outside, so only the first piece of each such run
+    is located in the other polygon.
+    '''
+    labels = [None] * len(pieces)
+    runs = []
+    for k, (p, q) in enumerate(pieces):
+        if (p, q) in otherPieces:
+            labels[k] = 'same'
+        elif (q, p) in otherPieces:
+            labels[k] = 'opposite'
+        elif k == 0 or p in cuts or labels[k - 1] is not None:
+            runs.append(k)
+
+    if runs:
+        midpoints = [((pieces[k][0][0] + pieces[k][1][0]) / 2,
+                      (pieces[k][0][1] + pieces[k][1][1]) / 2)
+                     for k in runs]
+        located = _winding(other, midpoints)
+        runs.append(len(pieces))
+        for first, end, inside in zip(runs, runs[1:], located):
+            label = 'inside' if inside else 'outside'
+            for k in range(first, end):
+                if labels[k] is None:
+                    labels[k] = label
+
+    return labels
+
+
+def _rings(edges):
+    '''
+    :edges: list of (p, q) tuples, directed edges
+    :return: list of lists of (x, y) tuples
+
+    Module private function, chains the edges into closed rings. Where
+    several edges leave a point the ring takes the first one clockwise
+    from the edge it arrived on, so rings touching at a point are
+    kept apart.
+    '''
+    leaving = {}
+    for k, (p, q) in enumerate(edges):
+        leaving.setdefault(p, []).append(k)
+
+    used = [False] * len(edges)
+    rings = []
+    for k in range(len(edges)):
+        if used[k]:
+            continue
+        start = edges[k][0]
+        ring = []
+        while True:
+            used[k] = True
+            p, q = edges[k]
+            ring.append(p)
+            if q == start:
+                break
+            choices = [c for c in leaving.get(q, ()) if not used[c]]
+            if not choices:
+                break
+            if len(choices) == 1:
+                k = choices[0]
+                continue
+            back = math.atan2(p[1] - q[1], p[0] - q[0])
+
+            def clockwise(c):
+                r = edges[c][1]
+                angle = math.atan2(r[1] - q[1], r[0] - q[0])
+                return (back - angle) % (2 * math.pi) or 2 * math.pi
+
+            k = min(choices, key=clockwise)
+
+        rings.append(ring)
+
+    return rings
+
+
+def _polygons(rings):
+    '''
+    :rings: list of lists of (x, y) tuples
+    :return: list of Polygons
+    '''
+    from .polygon import Polygon
+
+    polygons = []
+    for xy in rings:
+        xy = _simplified(xy)
+        if len(xy) >= 3:
+            polygons.append(Polygon([Point(x, y) for x, y in xy]))
+    return polygons
+
+
+def _overlay(a, b, operation):
+    '''
+    :a: Polygon or iterable of point equivalents
+    :b: Polygon or iterable of point equivalents
+    :operation: string, key of _Rules
+    :return: list of Polygons
+
+    Module private function.
+    '''
+    rings = (_ring(a), _ring(b))
+
+    if (operation == 'intersection' and
+            len(rings[0]) * len(rings[1]) <= _ConvexLimit and
+            all(map(_isConvex, rings))):
+        subject, clip = sorted(rings, key=len, reverse=True)
+        return _polygons([clipConvex(subject, clip)])
+
+    edges = []
+    for owner, xy in enumerate(rings):
+        edges.extend((p, q, owner) for p, q in zip(xy, xy[1:] + xy[:1]))
+
+    pieces = ([], [])
+    apart = _apart([_box(*args) for args in zip((a, b), rings)])
+    if apart:
+        # no edges meet and neither polygon is inside the other
+        for p, q, owner in edges:
+            pieces[owner].append((p, q))
+    else:
+        cuts = set()
+        for (p, q, owner), points in zip(edges, _crossings(edges)):
+            cuts.update(points[2:])
+            pieces[owner].extend(_pieces(p, q, points))
+
+    rules = _Rules[operation]
+    kept = []
+    for owner, name in enumerate('AB'):
+        other = 1 - owner
+        if apart:
+            labels = ['outside'] * len(pieces[owner])
+        else:
+            labels = _classify(pieces[owner], cuts, rings[other],
+                               set(pieces[other]))
+        rule = rules[name]
+        for (p, q), label in zip(pieces[owner], labels):
+            direction = rule.get(label)
+            if direction == 1:
+                kept.append((p, q))
+            elif direction == -1:
+                kept.append((q, p))
+
+    return _polygons(_rings(kept))
+
+
+def intersection(a, b):
+    '''
+    :a: Polygon or iterable of point equivalents
+    :b: Polygon or iterable of point equivalents
+    :return: list of Polygons
+
+    The regions inside both a and b.
+    '''
+    return _overlay(a, b, 'intersection')
+
+
+def union(a, b):
+    '''
+    :a: Polygon or iterable of point equivalents
+    :b: Polygon or iterable of point equivalents
+    :return: list of Polygons
+
+    The regions inside a or b or both.
+    '''
+    return _overlay(a, b, 'union')
+
+
+def difference(a, b):
+    '''
+    :a: Polygon or iterable of point equivalents
+    :b: Polygon or iterable of point equivalents
+    :return: list of Polygons
+
+    The regions inside a and not inside b.
+    '''
+    return _overlay(a, b, 'difference')
+
+
+def xor(a, b):
+    '''
+    :a: Polygon or iterable of point equivalents
+    :b: Polygon or iterable of point equivalents
+    :return: list of Polygons
+
+    The regions inside exactly one of a and b.
+    '''
+    return _overlay(a, b, 'xor')
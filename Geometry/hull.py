@@ -0,0 +1,209 @@
+'''convex hulls in the XY plane
+
+convexHull computes the hull of a collection of points at once with
+Andrew's monotone chain algorithm in O(n log n). IncrementalHull keeps
+the hull of a stream of points current as each point arrives.
+
+Both describe the hull with the same vertices in the same order:
+counter-clockwise starting from the vertex with the smallest X
+(and then Y) coordinate, without collinear points.
+'''
+
+import bisect
+
+from .point import Point
+from .polygon import Polygon
+
+
+def _coordinates(points):
+    '''
+    :points: PointArray, PointSequence or iterable of point equivalents
+    :return: list of (x, y) tuples, sorted and without duplicates
+
+    Module private function.
+    '''
+    from .pointarray import PointArray
+
+    if isinstance(points, PointArray):
+        import numpy
+        xy = numpy.unique(points.xy, axis=0)
+        return [tuple(p) for p in xy.tolist()]
+
+    points = [Point._convert(p) for p in points]
+    return sorted(set((p.x, p.y) for p in points))
+
+
+def _chain(xy, sign):
+    '''
+    :xy:   sorted list of (x, y) tuples
+    :sign: 1 for the lower chain, -1 for the upper chain
+    :return: list of (x, y) tuples
+
+    Module private function, one half of the monotone chain hull
+    from the first to the last point of xy.
+    '''
+    chain = []
+    for p in xy:
+        px, py = p
+        while len(chain) >= 2:
+            (ax, ay), (bx, by) = chain[-2], chain[-1]
+            if sign * (((bx - ax) * (py - ay)) - ((by - ay) * (px - ax))) > 0:
+                break
+            chain.pop()
+        chain.append(p)
+    return chain
+
+
+def _polygon(lower, upper):
+    '''
+    :lower: lower chain, list of (x, y) tuples
+    :upper: upper chain, list of (x, y) tuples
+    :return: Polygon
+
+    Module private function, joins the two chains into a counter
+    clockwise polygon.
+    '''
+    if len(lower) < 2:
+        xy = lower
+    else:
+        xy = lower[:-1] + upper[:0:-1]
+    return Polygon([Point(x, y) for x, y in xy])
+
+
+def convexHull(points):
+    '''
+    :points: PointArray, PointSequence or iterable of point equivalents
+    :return: Polygon
+
+    The smallest convex polygon in the XY plane which contains all
+    of the points. Its vertices are a counter-clockwise subset of
+    the points, starting with the one with the smallest X and then
+    Y coordinate. Collinear points on the edges of the hull are not
+    vertices.
+
+    Fewer than three distinct points, or only collinear points, give
+    a polygon with fewer than three vertices.
+    '''
+    xy = _coordinates(points)
+    return _polygon(_chain(xy, 1), _chain(xy, -1))
+
+
+class _Chain(object):
+    '''
+    One half of an IncrementalHull, the points sorted by X and then
+    Y coordinate which make convex turns in one direction.
+
+    Implementation private class.
+    '''
+
+    def __init__(self, sign):
+        '''
+        :sign: 1 for the lower chain, -1 for the upper chain
+        '''
+        self.sign = sign
+        self.xy = []
+
+    def _turn(self, a, b, c):
+        '''
+        :a: (x, y) tuple
+        :b: (x, y) tuple
+        :c: (x, y) tuple
+        :return: float, positive if a, b, c is a convex turn
+        '''
+        (ax, ay), (bx, by), (cx, cy) = a, b, c
+        return self.sign * (((bx - ax) * (cy - ay)) - ((by - ay) * (cx - ax)))
+
+    def add(self, p):
+        '''
+        :p: (x, y) tuple
+        :return: boolean, True if the chain changed
+        '''
+        xy = self.xy
+        i = bisect.bisect_left(xy, p)
+
+        if i < len(xy) and xy[i] == p:
+            return False
+
+        if 0 < i < len(xy) and self._turn(xy[i - 1], xy[i], p) >= 0:
+            return False
+
+        xy.insert(i, p)
+
+        while i >= 2 and self._turn(xy[i - 2], xy[i - 1], p) <= 0:
+            del xy[i - 1]
+            i -= 1
+
+        while i + 2 < len(xy) and self._turn(p, xy[i + 1], xy[i + 2]) <= 0:
+            del xy[i + 1]
+
+        return True
+
+
+class IncrementalHull(object):
+    '''
+    The convex hull of a stream of points in the XY plane.
+
+    Usage:
+
+    >>> hull = IncrementalHull()
+    >>> for p in feed:
+    ...     hull.add(p)
+    >>> hull.polygon
+
+    Each point is located in the upper and lower chains of the hull
+    with a binary search, so points inside the hull are discarded in
+    O(log n). A point outside the hull is inserted and the vertices
+    it makes redundant are removed.
+
+    The hull is the same as convexHull of all the points added.
+    '''
+
+    def __init__(self, points=None):
+        '''
+        :points: optional PointArray, PointSequence or iterable of
+                 point equivalents to start with
+        '''
+        self._lower = _Chain(1)
+        self._upper = _Chain(-1)
+        if points is not None:
+            self.extend(points)
+
+    def add(self, point):
+        '''
+        :point: Point or point equivalent
+        :return: boolean, True if the hull changed
+        '''
+        p = Point._convert(point)
+        xy = (p.x, p.y)
+        lower = self._lower.add(xy)
+        upper = self._upper.add(xy)
+        return lower or upper
+
+    def extend(self, points):
+        '''
+        :points: PointArray, PointSequence or iterable of point
+                 equivalents
+        :return: boolean, True if the hull changed
+        '''
+        changed = False
+        for xy in _coordinates(points):
+            lower = self._lower.add(xy)
+            upper = self._upper.add(xy)
+            changed = changed or lower or upper
+        return changed
+
+    def __len__(self):
+        '''
+        Number of vertices of the hull.
+        '''
+        lower, upper = self._lower.xy, self._upper.xy
+        if len(lower) < 2:
+            return len(lower)
+        return len(lower) + len(upper) - 2
+
+    @property
+    def polygon(self):
+        '''
+        The hull, a Polygon; see convexHull.
+        '''
+        return _polygon(self._lower.xy, self._upper.xy)
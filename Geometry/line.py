@@ -3,8 +3,10 @@
 
 import math
 import collections
+import weakref
 from . import Point
-from .exceptions import InfiniteLength, CollinearPoints, ParallelLines
+from .exceptions import (InfiniteLength, CollinearPoints, ParallelLines,
+                         CollinearLines)
 from .constants import *
 
 
@@ -22,6 +24,12 @@ class Line(collections.Mapping):
     >>>
     '''
 
+    # values computed from A and B, discarded when either changes
+    _cached = ('_terms', '_length', '_bounds')
+
+    # the range of the parameter t of the points on a line, see pointAt
+    _extent = (-math.inf, math.inf)
+
     @classmethod
     def fromSegment(cls, segment):
         '''
@@ -110,6 +118,44 @@ class Line(collections.Mapping):
     def B(self, newValue):
         self.B.xyz = newValue
 
+    def _invalidate(self):
+        '''
+        Discards values computed from A and B. Called by A and B when
+        they change, see Point._watch.
+        '''
+        for name in self._cached:
+            self.__dict__.pop(name, None)
+
+    def __getstate__(self):
+        '''
+        State for copy and pickle without the cached values, the
+        copy's A and B do not know about the copy.
+        '''
+        state = dict(self.__dict__)
+        for name in self._cached:
+            state.pop(name, None)
+        return state
+
+    @property
+    def _coefficients(self):
+        '''
+        Tuple (ax, ay, bx, by, dx, dy, dz, cross) of the X and Y
+        coordinates of A and B, the direction B - A and the cross term
+        ax * by - ay * bx. Cached until A or B change.
+        '''
+        try:
+            return self._terms
+        except AttributeError:
+            pass
+        a, b = self.A, self.B
+        ref = weakref.ref(self)
+        a._watch(ref)
+        b._watch(ref)
+        self._terms = (a._x, a._y, b._x, b._y,
+                       b._x - a._x, b._y - a._y, b._z - a._z,
+                       (a._x * b._y) - (a._y * b._x))
+        return self._terms
+
     def __iter__(self):
         return iter(self.AB)
 
@@ -160,7 +206,8 @@ class Line(collections.Mapping):
         '''
         Slope parameter, Point(B - A).
         '''
-        return self.B - self.A
+        dx, dy, dz = self._coefficients[4:7]
+        return Point(dx, dy, dz)
 
     @property
     def length(self):
@@ -176,10 +223,8 @@ class Line(collections.Mapping):
 
         Returns a Line normal (perpendicular) to this Line.
         '''
-
-        d = self.B - self.A
-
-        return Line([-d.y, d.x], [d.y, -d.x])
+        dx, dy = self._coefficients[4:6]
+        return Line([-dy, dx], [dy, -dx])
 
     def pointAt(self, t):
         '''
@@ -312,10 +357,15 @@ class Line(collections.Mapping):
            ccw(other.A,other.B,self.A) * ccw(other.A,other.B,self.B) <= 0
 
         '''
-        if self.A.ccw(self.B, other.A) * self.A.ccw(self.B, other.B) > 0:
+        ax, ay, bx, by, dx, dy = self._coefficients[:6]
+        cx, cy, ex, ey, fx, fy = other._coefficients[:6]
+
+        if ((dx * (cy - ay)) - (dy * (cx - ax))) * \
+           ((dx * (ey - ay)) - (dy * (ex - ax))) > 0:
             return False
 
-        if other.A.ccw(other.B, self.A) * other.A.ccw(other.B, self.B) > 0:
+        if ((fx * (ay - cy)) - (fy * (ax - cx))) * \
+           ((fx * (by - cy)) - (fy * (bx - cx))) > 0:
             return False
 
         return True
@@ -339,6 +389,52 @@ class Line(collections.Mapping):
         '''
         return other in self
 
+    def _parameters(self, other):
+        '''
+        :param: other - Line subclass
+        :return: tuple of floats (t, u) or None
+
+        Implementation private method, the parameters along this line
+        and along the other line of the point where they cross in the
+        XY plane, see pointAt. None if the lines are parallel.
+        '''
+        ax, ay, bx, by, dx, dy = self._coefficients[:6]
+        cx, cy, ex, ey, fx, fy = other._coefficients[:6]
+
+        denominator = (dx * fy) - (dy * fx)
+        if denominator == 0:
+            return None
+
+        wx, wy = cx - ax, cy - ay
+        return (((wx * fy) - (wy * fx)) / denominator,
+                ((wx * dy) - (wy * dx)) / denominator)
+
+    def findIntersection(self, other):
+        '''
+        :param: other - Line subclass
+        :return: Point subclass or None
+
+        Returns the point where the current line and the other line
+        meet in the XY plane, or None if they are parallel, collinear
+        or cross beyond the ends of a Segment or behind the head of a
+        Ray. Unlike intersection it never raises, so it suits loops
+        where most pairs do not meet.
+        '''
+        tu = self._parameters(other)
+        if tu is None:
+            return None
+
+        t, u = tu
+        lo, hi = self._extent
+        if not lo <= t <= hi:
+            return None
+        lo, hi = other._extent
+        if not lo <= u <= hi:
+            return None
+
+        ax, ay, bx, by, dx, dy = self._coefficients[:6]
+        return Point(ax + (t * dx), ay + (t * dy))
+
     def intersection(self, other):
         '''
         :param: other - Line subclass
@@ -347,48 +443,70 @@ class Line(collections.Mapping):
         Returns a Point object with the coordinates of the intersection
         between the current line and the other line.
 
-        Will raise Parallel() if the two lines are parallel.
-        Will raise Collinear() if the two lines are collinear.
+        Will raise ParallelLines() if the two lines are parallel or do
+        not meet.
+        Will raise CollinearLines() if the two lines are collinear.
+
+        See findIntersection.
         '''
+        p = self.findIntersection(other)
+        if p is not None:
+            return p
+
+        if self._parameters(other) is not None:
+            msg = '{!r} and {!r} do not meet'
+            raise ParallelLines(msg.format(self, other))
 
         if self.isCollinear(other):
             msg = '{!r} and {!r} are collinear'
             raise CollinearLines(msg.format(self, other))
 
-        d0 = self.A - self.B
-        d1 = other.A - other.B
+        msg = '{!r} and {!r} are parallel'
+        raise ParallelLines(msg.format(self, other))
 
-        denominator = (d0.x * d1.y) - (d0.y * d1.x)
-
-        if denominator == 0:
-            msg = '{!r} and {!r} are parallel'
-            raise ParallelLines(msg.format(self, other))
+    def _closest(self, point):
+        '''
+        :param: point - Point or point equivalent
+        :return: tuple of floats (t, ex, ey)
 
-        cp0 = self.A.cross(self.B)
-        cp1 = other.A.cross(other.B)
+        Implementation private method, the parameter of the point on
+        the line nearest to 'point' in the XY plane, limited to the
+        extent of a Segment or Ray, and the offset from that point to
+        'point'.
+        '''
+        point = Point._convert(point)
+        ax, ay, bx, by, dx, dy = self._coefficients[:6]
+        px, py = point.x - ax, point.y - ay
 
-        x_num = (cp0 * d1.x) - (d0.x * cp1)
-        y_num = (cp0 * d1.y) - (d0.y * cp1)
+        dd = (dx * dx) + (dy * dy)
+        t = ((px * dx) + (py * dy)) / dd if dd else 0.0
+        lo, hi = self._extent
+        t = min(max(t, lo), hi)
 
-        p = Point(x_num / denominator, y_num / denominator)
+        return t, px - (t * dx), py - (t * dy)
 
-        if p in self and p in other:
-            return p
+    def closestPoint(self, point):
+        '''
+        :param: point - Point or point equivalent
+        :return: Point subclass
 
-        msg = "found point {!r} but not in {!r} and {!r}"
-        raise ParallelLines(msg.format(p, self, other))
+        The point on the line nearest to the given point in the XY
+        plane. For a Segment or Ray this is an end point when the
+        perpendicular from the given point misses it.
+        '''
+        return self.pointAt(self._closest(point)[0])
 
     def distanceFromPoint(self, point):
         '''
-        :param: point - Point subclass
+        :param: point - Point or point equivalent
         :return: float
 
-        Distance from the line to the given point.
+        Distance from the line to the given point in the XY plane, the
+        distance to the nearest end point where the perpendicular
+        misses a Segment or Ray.
         '''
-        # XXX planar distance, doesn't take into account z ?
-        d = self.m
-        n = (d.y * point.x) - (d.x * point.y) + self.A.cross(self.B)
-        return abs(n / self.A.distance(self.B))
+        t, ex, ey = self._closest(point)
+        return math.hypot(ex, ey)
 
     def isNormal(self, other):
         '''
@@ -444,12 +562,38 @@ class Segment(Line):
     A Line subclass with finite length.
     '''
 
+    _extent = (0.0, 1.0)
+
     @property
     def length(self):
         '''
-        The scalar distance between A and B, float.
+        The scalar distance between A and B, float. Cached until A or
+        B change.
+        '''
+        try:
+            return self._length
+        except AttributeError:
+            pass
+        dx, dy, dz = self._coefficients[4:7]
+        self._length = math.sqrt((dx * dx) + (dy * dy) + (dz * dz))
+        return self._length
+
+    @property
+    def bounds(self):
+        '''
+        The smallest and largest coordinates of A and B along each
+        axis, a tuple ((xmin, ymin, zmin), (xmax, ymax, zmax)).
+        Cached until A or B change.
         '''
-        return self.A.distance(self.B)
+        try:
+            return self._bounds
+        except AttributeError:
+            pass
+        self._coefficients      # watches A and B
+        a, b = self.A, self.B
+        self._bounds = ((min(a._x, b._x), min(a._y, b._y), min(a._z, b._z)),
+                        (max(a._x, b._x), max(a._y, b._y), max(a._z, b._z)))
+        return self._bounds
 
     @property
     def midpoint(self):
@@ -508,6 +652,8 @@ class Ray(Line):
 
     '''
 
+    _extent = (0.0, math.inf)
+
     @property
     def head(self):
         '''
@@ -0,0 +1,257 @@
+'''unlabeled point sequences for large shapes
+
+PointSequence labels its vertices A, B, C, ... and resolves attribute
+names against the labels, which is handy for triangles but costs
+every attribute access and stops at 26 labels. PackedPointSequence
+and PackedPolygon keep their coordinates contiguously in a single
+PointArray instead, use ordinary attribute access and compute their
+cached values with numpy.
+'''
+
+import operator
+import weakref
+
+from .point import Point, PointSequence
+from .polygon import Polygon
+from .pointarray import PointArray, PointView
+
+
+class _PackedView(PointView):
+    '''
+    A PointView of one vertex of a packed sequence.
+
+    A Point stops watching its owners once it has told them about a
+    change and the owners watch it again when they next cache a value.
+    The sequence does not keep the views it hands out, so it cannot
+    watch them again; these views keep their owners instead and report
+    every change.
+    '''
+
+    __slots__ = ()
+
+    def _changed(self):
+        '''
+        Implementation private method.
+
+        Discards the cached values of the owning sequence, see
+        Point._changed.
+        '''
+        owners = self._owners
+        super()._changed()
+        self._owners = owners
+
+
+class PackedPointSequence(PointSequence):
+    '''
+    An unlabeled sequence of points stored in one N x 3 PointArray.
+
+    Usage:
+
+    >>> s = PackedPointSequence(numpy.random.rand(100000, 2))
+    >>> s[0].x = 1          # views write through to the array
+    >>> s.array.xyz         # the N x 3 buffer, shared
+
+    Indexing with an integer returns a PointView of that row and
+    slicing returns a list of PointViews. Vertices have no labels, so
+    s.A raises AttributeError.
+
+    Changes made through the views discard the cached values of the
+    sequence, e.g. its bounds and hash. Call _invalidate after
+    changing the array directly.
+    '''
+
+    _labels = ''
+
+    # plain attribute access, skips the label resolution of
+    # PointSequence.
+    __setattr__ = object.__setattr__
+    __delattr__ = object.__delattr__
+
+    def __init__(self, points=None):
+        '''
+        :points: optional PointArray, PointSequence, iterable of Points
+                 or point equivalents, or an N x 2 or N x 3 array
+
+        Initializes the sequence with a copy of 'points'.
+        '''
+        self._array = PointArray(points)
+
+    def __getattr__(self, attr):
+        raise AttributeError("{} object has no attribute '{}'".format(
+            self.__class__.__name__, attr))
+
+    @property
+    def array(self):
+        '''
+        The coordinates of the vertices, PointArray sharing storage.
+        '''
+        return self._array
+
+    @property
+    def vertices(self):
+        '''
+        A new list of PointViews, one for each vertex.
+        '''
+        return [self[i] for i in range(len(self._array))]
+
+    @property
+    def bounds(self):
+        '''
+        The smallest and largest vertex coordinates along each axis,
+        a tuple ((xmin, ymin, zmin), (xmax, ymax, zmax)) or None if
+        the sequence is empty. Cached until the sequence changes.
+        '''
+        try:
+            return self._bounds
+        except AttributeError:
+            pass
+
+        xyz = self._array.xyz
+        if len(xyz) == 0:
+            self._bounds = None
+        else:
+            self._bounds = (tuple(xyz.min(axis=0).tolist()),
+                            tuple(xyz.max(axis=0).tolist()))
+        return self._bounds
+
+    def _vertexKeys(self):
+        '''
+        Set of (x, y, z) tuples, the distinct vertices.
+        '''
+        return set(map(tuple, self._array.xyz.tolist()))
+
+    def __str__(self):
+        return str(self._array.xyz)
+
+    def __repr__(self):
+        return '{s.__class__.__name__}({a!r})'.format(s=self,
+                                                     a=self._array.xyz)
+
+    def __hash__(self):
+        '''
+        Hash computed from the set of vertices, the same as the hash
+        of a PointSequence with the same vertices. Cached until the
+        sequence changes.
+        '''
+        try:
+            return self._hashvalue
+        except AttributeError:
+            pass
+        self._hashvalue = hash(frozenset(self._vertexKeys()))
+        return self._hashvalue
+
+    def __contains__(self, point):
+        '''
+        True iff a vertex has the same coordinates as 'point'.
+        '''
+        return point in self._array
+
+    def __getitem__(self, key):
+        '''
+        :key: integer or slice
+        :return: PointView or list of PointViews
+        '''
+        n = len(self._array)
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(n))]
+
+        view = _PackedView(self._array, operator.index(key))
+        view._owners = [weakref.ref(self)]
+        return view
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self._array)))
+
+    def __reversed__(self):
+        return (self[i] for i in reversed(range(len(self._array))))
+
+    def __len__(self):
+        return len(self._array)
+
+    def rotate(self, theta_x, theta_y, theta_z, origin=None, radians=False):
+        '''
+        :theta_x: float angle to rotate around the X axis
+        :theta_y: float angle to rotate around the Y axis
+        :theta_z: float angle to rotate around the Z axis
+        :origin: optional Point, defaults to 0,0,0
+        :radians: optional boolean, angles are in degrees unless True
+        :return: a new sequence of the same class
+
+        Returns a copy of the sequence with its vertices rotated around
+        :origin:, see Point.rotate.
+        '''
+        return self.__class__(self._array.rotate(theta_x, theta_y, theta_z,
+                                                 origin, radians))
+
+    def convexHull(self):
+        '''
+        :return: Polygon
+
+        The convex hull of the vertices in the XY plane, see
+        Geometry.hull.convexHull.
+        '''
+        return self._array.convexHull()
+
+    def diameter(self):
+        '''
+        :return: Segment
+
+        See PointSequence.diameter.
+        '''
+        return self._array.diameter()
+
+    def minimumWidth(self):
+        '''
+        :return: float
+
+        See PointSequence.minimumWidth.
+        '''
+        return self._array.minimumWidth()
+
+    def minimumAreaRectangle(self):
+        '''
+        :return: Rectangle
+
+        See PointSequence.minimumAreaRectangle.
+        '''
+        return self._array.minimumAreaRectangle()
+
+    def simplify(self, tolerance, method='douglas-peucker',
+                 preserveTopology=False):
+        '''
+        :tolerance: float, a distance for Douglas-Peucker or an area
+                    for Visvalingam-Whyatt
+        :method: optional string, 'douglas-peucker' or
+                 'visvalingam-whyatt'
+        :preserveTopology: optional boolean, True to keep segments of
+                           the result from crossing
+        :return: a new sequence with a subset of the vertices
+
+        See Geometry.simplify.
+        '''
+        from .simplify import simplify
+
+        keep = simplify(self._array, tolerance, method, self._closed,
+                        preserveTopology)
+        return self.__class__(self._array.xyz[keep])
+
+
+class PackedPolygon(Polygon, PackedPointSequence):
+    '''
+    A Polygon whose vertices are stored in one N x 3 PointArray, see
+    PackedPointSequence. Containment, area, centroid and the other
+    Polygon operations work on the packed coordinates.
+    '''
+
+    @property
+    def xy(self):
+        '''
+        The X and Y coordinates of each vertex, list of float tuples.
+        Cached until the polygon changes.
+        '''
+        try:
+            return self._xy
+        except AttributeError:
+            pass
+        self._xy = list(map(tuple, self._array.xy.tolist()))
+        return self._xy
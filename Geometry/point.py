@@ -2,12 +2,15 @@
 '''
 
 import collections
-import hashlib
+import functools
 import random
 import math
+import weakref
 from .constants import Half_Pi, Two_Pi
 from .exceptions import CollinearPoints
-from .propgen import FloatProperty, FloatMultiProperty
+from .predicates import (orient2d, orient3d, incircle,
+                         predicateCounts, resetPredicateCounts)
+from .propgen import FloatMultiProperty, coerceFloat
 
 
 class Point(collections.Mapping):
@@ -49,6 +52,9 @@ class Point(collections.Mapping):
     the properties 'xy', 'xz', 'yz', 'xyz' and 'xyzw'.  Arguments
     to the setters can be mappings, sequences, or scalars.
 
+    Coordinates are stored as floats in fixed slots; Points do not
+    carry an instance dictionary.
+
     Operations
     ==========
 
@@ -80,18 +86,103 @@ class Point(collections.Mapping):
 
     '''
 
-    x = FloatProperty('x', docs='X axis coordinate, float.')
-    y = FloatProperty('y', docs='Y axis coordinate, float.')
-    z = FloatProperty('z', docs='Z axis coordinate, float.')
-    w = FloatProperty('w',
-                      docs='W coordinate, read-only float. '
-                      'Used to form square matrices. ',
-                      default=1.0, readonly=True)
+    __slots__ = ('_x', '_y', '_z', '_hashvalue', '_owners')
+
+    @property
+    def x(self):
+        '''
+        X axis coordinate, float.
+        '''
+        return self._x
+
+    @x.setter
+    def x(self, newValue):
+        if type(newValue) is float:
+            self._x = newValue if newValue else 0.0
+        elif type(newValue) is int:
+            self._x = float(newValue)
+        else:
+            self._x = coerceFloat(newValue, 'x', current=self._x)
+        self._hashvalue = None
+        if self._owners is not None:
+            self._changed()
+
+    @property
+    def y(self):
+        '''
+        Y axis coordinate, float.
+        '''
+        return self._y
+
+    @y.setter
+    def y(self, newValue):
+        if type(newValue) is float:
+            self._y = newValue if newValue else 0.0
+        elif type(newValue) is int:
+            self._y = float(newValue)
+        else:
+            self._y = coerceFloat(newValue, 'y', current=self._y)
+        self._hashvalue = None
+        if self._owners is not None:
+            self._changed()
+
+    @property
+    def z(self):
+        '''
+        Z axis coordinate, float.
+        '''
+        return self._z
+
+    @z.setter
+    def z(self, newValue):
+        if type(newValue) is float:
+            self._z = newValue if newValue else 0.0
+        elif type(newValue) is int:
+            self._z = float(newValue)
+        else:
+            self._z = coerceFloat(newValue, 'z', current=self._z)
+        self._hashvalue = None
+        if self._owners is not None:
+            self._changed()
+
+    @property
+    def w(self):
+        '''
+        W coordinate, read-only float. Used to form square matrices.
+        '''
+        return 1.0
+
     xyzw = FloatMultiProperty('xyzw',
                               docs='A list of all coordinates including W.',
                               readonly_keys='w')
-    xyz = FloatMultiProperty('xyz',
-                             docs='A list of all coordinates excluding W.')
+
+    _xyz = FloatMultiProperty('xyz')
+
+    @property
+    def xyz(self):
+        '''
+        A list of all coordinates excluding W.
+        '''
+        return [self._x, self._y, self._z]
+
+    @xyz.setter
+    def xyz(self, newValues):
+        # fast paths for the common cases; copying another Point
+        # and setting all three coordinates from a tuple or list.
+        if isinstance(newValues, Point):
+            self._x = newValues._x
+            self._y = newValues._y
+            self._z = newValues._z
+            self._hashvalue = None
+            if self._owners is not None:
+                self._changed()
+            return
+
+        if type(newValues) in (tuple, list) and len(newValues) == 3:
+            self.x, self.y, self.z = newValues
+            return
+
+        self._xyz = newValues
 
     xy = FloatMultiProperty('xy', docs='A list of X and Y coordinates.')
     yx = FloatMultiProperty('yx', docs='A list of Y and X coordinates.')
@@ -278,6 +369,9 @@ class Point(collections.Mapping):
         - mappings
         - sequences
         '''
+        self._x = self._y = self._z = 0.0
+        self._hashvalue = None
+        self._owners = None
         # see docstring of __call__
         self(*args, **kwds)
 
@@ -303,22 +397,8 @@ class Point(collections.Mapping):
         if len(args) > 1:
             self.xyz = args
 
-        self.xyz = kwds
-
-    def __setattr__(self, attr, value):
-        '''
-        Side-effect: deletes cached computed hash value if
-                     x, y, or z attributes change.
-        '''
-        super().__setattr__(attr, value)
-        try:
-            if attr[0] == '_' and attr[1] in self._keys:
-                try:
-                    del(self._hashvalue)
-                except AttributeError:
-                    pass
-        except IndexError:
-            pass
+        if kwds:
+            self.xyz = kwds
 
     def __str__(self):
         return 'x={p.x}, y={p.y}, z={p.z}'.format(p=self)
@@ -328,36 +408,59 @@ class Point(collections.Mapping):
 
     def __hash__(self):
         '''
-        Hash computed from the repr value. Re-computed if the
-        object's repr string changes (x, y, or z properties
-        change).
+        Hash computed from the x, y and z coordinates, consistent
+        with __eq__. Re-computed if the x, y, or z properties change.
         '''
-        try:
-            return self._hashvalue
-        except AttributeError:
-            pass
-        digest = hashlib.sha1(bytes(repr(self), 'utf-8')).hexdigest()
-        self._hashvalue = int(digest, 16)
+        if self._hashvalue is None:
+            self._hashvalue = hash((self._x, self._y, self._z))
         return self._hashvalue
 
     def __delhash__(self):
         '''
         '''
-        try:
-            del(self._hashvalue)
-        except AttributeError:
-            pass
+        self._hashvalue = None
+
+    def __reduce__(self):
+        return (self.__class__, (self._x, self._y, self._z))
+
+    def _changed(self):
+        '''
+        Implementation private method.
+
+        Called when a coordinate changes, discards the cached values
+        of the objects watching this point and stops watching. See
+        _watch.
+        '''
+        owners, self._owners = self._owners, None
+        for ref in owners:
+            owner = ref()
+            if owner is not None:
+                owner._invalidate()
+
+    def _watch(self, ref):
+        '''
+        :ref: weakref.ref to an object with an _invalidate method
+
+        Implementation private method.
+
+        Calls the object's _invalidate method the next time a
+        coordinate of this point changes, e.g. when a sequence or a
+        line has cached values computed from it. See
+        PointSequence.bounds.
+        '''
+        owners = self._owners
+        if owners is None:
+            self._owners = [ref]
+        elif not any(o is ref for o in owners):
+            owners = [o for o in owners if o() is not None]
+            owners.append(ref)
+            self._owners = owners
 
     def __len__(self):
         '''
         Number of coordinates defined in a Point: x, y and z
         '''
-        try:
-            return self._len
-        except AttributeError:
-            pass
-        self._len = len(self._keys)
-        return self._len
+        return len(self._keys)
 
     def __bool__(self):
         '''
@@ -457,11 +560,17 @@ class Point(collections.Mapping):
 
         a == b
         '''
-        try:
-            b = self.__class__._convert(other)
-        except:
-            return False
-        return all(u == v for u, v in zip(self.xyz, b.xyz))
+        if isinstance(other, Point):
+            b = other
+        elif isinstance(other, PointSequence):
+            # a sequence of points is not a point equivalent
+            return NotImplemented
+        else:
+            try:
+                b = self.__class__._convert(other)
+            except:
+                return False
+        return (self._x == b._x) and (self._y == b._y) and (self._z == b._z)
 
     def _binary_(self, other, func, inplace=False):
         '''
@@ -485,6 +594,46 @@ class Point(collections.Mapping):
 
         '''
 
+        # fast paths: Point and scalar operands are applied directly
+        # to the coordinates and the result is built without going
+        # through __init__ and the xyz multi-property setter.
+
+        if isinstance(other, Point):
+            x = func(self._x, other._x)
+            y = func(self._y, other._y)
+            z = func(self._z, other._z)
+        elif type(other) in (float, int):
+            x = func(self._x, other)
+            y = func(self._y, other)
+            z = func(self._z, other)
+        else:
+            return self._binaryConvert_(other, func, inplace)
+
+        if inplace:
+            dst = self
+        else:
+            dst = self.__class__.__new__(self.__class__)
+            dst._x = dst._y = dst._z = 0.0
+            dst._hashvalue = None
+            dst._owners = None
+        dst.x = x
+        dst.y = y
+        dst.z = z
+        return dst
+
+    def _binaryConvert_(self, other, func, inplace=False):
+        '''
+        :other:   point equivalent or scalar
+        :func:    binary function to apply
+        :inplace: optional boolean
+        :return:  Point
+
+        Implementation private method.
+
+        The slow path of _binary_, converts 'other' to a Point
+        if possible and otherwise treats it as a scalar.
+        '''
+
         dst = self if inplace else self.__class__(self)
 
         try:
@@ -626,7 +775,7 @@ class Point(collections.Mapping):
         Returns self.
         '''
         try:
-            return self._binary_(other, lambda a, b: a - b)
+            return self._binary_(other, lambda a, b: a - b, inplace=True)
         except TypeError as e:
             err = TypeError(str(e))
         raise err
@@ -1255,7 +1404,12 @@ class Point(collections.Mapping):
 
         Returns a float
         '''
-        return sum((self * other).values())
+        if type(other) in (float, int):
+            return (self._x * other) + (self._y * other) + (self._z * other)
+
+        b = self.__class__._convert(other)
+
+        return (self._x * b._x) + (self._y * b._y) + (self._z * b._z)
 
     def cross(self, other):
         '''
@@ -1276,9 +1430,9 @@ class Point(collections.Mapping):
 
         b = self.__class__._convert(other)
 
-        return sum([(self.y * b.z) - (self.z * b.y),
-                    (self.z * b.x) - (self.x * b.z),
-                    (self.x * b.y) - (self.y * b.x)])
+        return (((self._y * b._z) - (self._z * b._y)) +
+                ((self._z * b._x) - (self._x * b._z)) +
+                ((self._x * b._y) - (self._y * b._x)))
 
     def midpoint(self, other):
         '''
@@ -1348,13 +1502,20 @@ class Point(collections.Mapping):
               from an arbitrary point. Avoids a square root which can
               improve performance.
         '''
-        return sum(((other - self) ** 2).values())
+        b = self.__class__._convert(other)
+
+        dx = b._x - self._x
+        dy = b._y - self._y
+        dz = b._z - self._z
+
+        return (dx * dx) + (dy * dy) + (dz * dz)
 
-    def ccw(self, b, c, axis='z'):
+    def ccw(self, b, c, axis='z', robust=False):
         '''
         :b: Point or point equivalent
         :c: Point or point equivalent
         :axis: optional string or integer in set('x',0,'y',1,'z',2)
+        :robust: optional boolean
         :return: float
 
         CCW - Counter Clockwise
@@ -1368,29 +1529,45 @@ class Point(collections.Mapping):
 
         Returns an integer.
 
+        If robust is True the result is computed with orient2d, whose
+        sign is exact even for nearly collinear points.
+
         Raises ValueError if axis is not in 'xyz'.
         '''
-        bsuba = b - self
-        csuba = c - self
+        b = self.__class__._convert(b)
+        c = self.__class__._convert(c)
 
         if axis in ['z', 2]:
-            return (bsuba.x * csuba.y) - (bsuba.y * csuba.x)
+            if robust:
+                return orient2d((self._x, self._y),
+                                (b._x, b._y), (c._x, c._y))
+            return (((b._x - self._x) * (c._y - self._y)) -
+                    ((b._y - self._y) * (c._x - self._x)))
 
         if axis in ['y', 1]:
-            return (bsuba.x * csuba.z) - (bsuba.z * csuba.x)
+            if robust:
+                return orient2d((self._x, self._z),
+                                (b._x, b._z), (c._x, c._z))
+            return (((b._x - self._x) * (c._z - self._z)) -
+                    ((b._z - self._z) * (c._x - self._x)))
 
         if axis in ['x', 0]:
-            return (bsuba.y * csuba.z) - (bsuba.z * csuba.y)
+            if robust:
+                return orient2d((self._y, self._z),
+                                (b._y, b._z), (c._y, c._z))
+            return (((b._y - self._y) * (c._z - self._z)) -
+                    ((b._z - self._z) * (c._y - self._y)))
 
         msg = "invalid axis '{!r}', must be one of {}".format(axis, self._keys)
 
         raise ValueError(msg)
 
-    def isCCW(self, b, c, axis='z'):
+    def isCCW(self, b, c, axis='z', robust=False):
         '''
         :b: Point or point equivalent
         :c: Point or point equivalent
         :axis: optional string or integer in set('x',0,'y',1,'z',2)
+        :robust: optional boolean, see ccw
         :return: boolean
 
         True if the angle determined by a,self,b around 'axis'
@@ -1399,23 +1576,26 @@ class Point(collections.Mapping):
         Raises CollinearPoints if self, b, c are collinear.
         '''
 
-        result = self.ccw(b, c, axis)
+        result = self.ccw(b, c, axis, robust)
 
         if result == 0:
             raise CollinearPoints(b, self, c)
 
         return result > 0
 
-    def isCollinear(self, b, c):
+    def isCollinear(self, b, c, robust=False):
         '''
         :b: Point or point equivalent
         :c: Point or point equivalent
+        :robust: optional boolean, see ccw
         :return: boolean
 
         True if 'self' is collinear with 'b' and 'c', otherwise False.
         '''
+        b = self.__class__._convert(b)
+        c = self.__class__._convert(c)
 
-        return all(self.ccw(b, c, axis) == 0 for axis in self._keys)
+        return all(self.ccw(b, c, axis, robust) == 0 for axis in self._keys)
 
     def rotate2d(self, theta, origin=None, axis='z', radians=False):
         '''
@@ -1423,13 +1603,15 @@ class Point(collections.Mapping):
         :origin: optional Point, defaults to 0,0,0
 
         Returns a Point rotated by :theta: around :origin:.
+
+        The coordinate along 'axis' is left unchanged.
         '''
 
         origin = Point._convert(origin)
 
         delta = self - origin
 
-        p = Point(origin)
+        p = Point(self)
 
         if not radians:
             theta = math.radians(theta)
@@ -1438,18 +1620,18 @@ class Point(collections.Mapping):
         sinT = math.sin(theta)
 
         if axis == 'z':
-            p.x += (cosT * delta.x) - (sinT * delta.y)
-            p.y += (sinT * delta.x) + (cosT * delta.y)
+            p.x = origin.x + (cosT * delta.x) - (sinT * delta.y)
+            p.y = origin.y + (sinT * delta.x) + (cosT * delta.y)
             return p
 
         if axis == 'y':
-            p.z += (cosT * delta.z) - (sinT * delta.x)
-            p.x += (sinT * delta.z) + (cosT * delta.x)
+            p.z = origin.z + (cosT * delta.z) - (sinT * delta.x)
+            p.x = origin.x + (sinT * delta.z) + (cosT * delta.x)
             return p
 
         if axis == 'x':
-            p.y += (cosT * delta.y) - (sinT * delta.z)
-            p.z += (sinT * delta.y) + (cosT * delta.z)
+            p.y = origin.y + (cosT * delta.y) - (sinT * delta.z)
+            p.z = origin.z + (sinT * delta.y) + (cosT * delta.z)
             return p
 
         raise KeyError('unknown axis {}, expecting x, y or z'.format(axis))
@@ -1461,18 +1643,87 @@ class Point(collections.Mapping):
         return self
 
     def rotate(self, theta_x, theta_y, theta_z, origin=None, radians=False):
+        '''
+        :theta_x: float angle to rotate around the X axis
+        :theta_y: float angle to rotate around the Y axis
+        :theta_z: float angle to rotate around the Z axis
+        :origin: optional Point, defaults to 0,0,0
+        :radians: optional boolean, angles are in degrees unless True
+        :return: Point
 
-        origin = Point._convert(origin)
+        Returns a Point rotated around :origin: about the X axis, then
+        the Y axis and then the Z axis. The result is the same as
+        chaining rotate2d with axis 'x', 'y' and 'z'.
 
-        thetas = [theta_x, theta_y, theta_z]
+        See rotationMatrix.
+        '''
+        return Point(self).irotate(theta_x, theta_y, theta_z,
+                                   origin, radians)
 
-        if not radians:
-            thetas = list(map(math.radians, thetas))
+    def irotate(self, theta_x, theta_y, theta_z, origin=None, radians=False):
+        '''
+        In-place version of rotate, returns self.
+        '''
+        m = rotationMatrix(theta_x, theta_y, theta_z, radians)
+
+        if origin is None:
+            self.xyz = _rotated(m, 0.0, 0.0, 0.0, self._x, self._y, self._z)
+        else:
+            o = Point._convert(origin)
+            self.xyz = _rotated(m, o._x, o._y, o._z, self._x, self._y, self._z)
+
+        return self
+
+
+@functools.lru_cache(maxsize=64)
+def rotationMatrix(theta_x, theta_y, theta_z, radians=False):
+    '''
+    :theta_x: float angle to rotate around the X axis
+    :theta_y: float angle to rotate around the Y axis
+    :theta_z: float angle to rotate around the Z axis
+    :radians: optional boolean, angles are in degrees unless True
+    :return: 3 x 3 tuple of tuples of floats
+
+    The rotation matrix Rz * Ry * Rx, which rotates about the X axis
+    first, then Y and then Z.
+
+    Results are cached, so rotating many points by the same angles
+    computes the sines and cosines only once.
+    '''
+    thetas = [theta_x, theta_y, theta_z]
+
+    if not radians:
+        thetas = list(map(math.radians, thetas))
+
+    cosX, cosY, cosZ = list(map(math.cos, thetas))
+    sinX, sinY, sinZ = list(map(math.sin, thetas))
+
+    return ((cosZ * cosY,
+             (cosZ * sinY * sinX) - (sinZ * cosX),
+             (cosZ * sinY * cosX) + (sinZ * sinX)),
+            (sinZ * cosY,
+             (sinZ * sinY * sinX) + (cosZ * cosX),
+             (sinZ * sinY * cosX) - (cosZ * sinX)),
+            (-sinY,
+             cosY * sinX,
+             cosY * cosX))
+
+
+def _rotated(m, ox, oy, oz, x, y, z):
+    '''
+    :m: 3 x 3 rotation matrix, see rotationMatrix
+    :ox, oy, oz: floats, the origin of the rotation
+    :x, y, z: floats, the coordinates to rotate
+    :return: tuple of three floats
 
-        cosX, cosY, cosZ = list(map(math.cos, thetas))
-        sinX, sinY, sinZ = list(map(math.sin.thetas))
+    Module private function, the rotated coordinates.
+    '''
+    (a, b, c), (d, e, f), (g, h, i) = m
+    x, y, z = x - ox, y - oy, z - oz
+    return (ox + (a * x) + (b * y) + (c * z),
+            oy + (d * x) + (e * y) + (f * z),
+            oz + (g * x) + (h * y) + (i * z))
 
-        raise NotImplementedError("working on it")
 
 class PointSequence(collections.Sequence):
     '''
@@ -1482,6 +1733,13 @@ class PointSequence(collections.Sequence):
 
     _labels = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
 
+    # names of attributes holding values computed from the vertices,
+    # discarded by _invalidate when the sequence changes.
+    _cached = ('_hashvalue', '_bounds')
+
+    # True if the last vertex joins back to the first one.
+    _closed = False
+
     def __init__(self,*args,**kwds):
         '''
         :args: list of points
@@ -1531,7 +1789,34 @@ class PointSequence(collections.Sequence):
                     setattr(self,label,kwds[label])
                 except KeyError:
                     pass
-            
+
+        self._invalidate()
+
+    def _invalidate(self):
+        '''
+        Discards values computed from the vertices, e.g. the hash
+        value. Called whenever the sequence changes.
+
+        Vertices changed directly, e.g. seq[0].x = 1, call this once
+        the sequence has computed its bounds, see bounds. Before that,
+        or for changes the vertices cannot see, e.g. to the array
+        behind a PointView, call _invalidate afterwards.
+        '''
+        for name in self._cached:
+            self.__dict__.pop(name, None)
+
+    def __getstate__(self):
+        '''
+        State for copy and pickle without the cached values. The
+        vertices of a copy are not watched by the copy, or are new
+        Points which are not watched at all, so the copy computes
+        its own.
+        '''
+        state = dict(self.__dict__)
+        for name in self._cached:
+            state.pop(name, None)
+        return state
+
     @property
     def vertices(self):
         try:
@@ -1545,6 +1830,54 @@ class PointSequence(collections.Sequence):
     def labels(self):
         return self._labels[:len(self)]
 
+    def _watchedVertices(self):
+        '''
+        :return: list of Points
+
+        Implementation private method, the vertices converted to
+        Points. The vertices which are already Points remember the
+        sequence, so changing one directly discards the cached values.
+        Called whenever a cached value is computed, see Point._watch.
+        '''
+        ref = weakref.ref(self)
+        points = []
+        for v in self.vertices:
+            p = Point._convert(v)
+            if p is v:
+                p._watch(ref)
+            points.append(p)
+        return points
+
+    @property
+    def bounds(self):
+        '''
+        The smallest and largest vertex coordinates along each axis,
+        a tuple ((xmin, ymin, zmin), (xmax, ymax, zmax)) or None if
+        the sequence is empty.
+
+        Cached until the sequence changes. The vertices remember the
+        sequence, so changing a vertex directly, e.g. seq[0].x = 1,
+        also discards the cached values.
+        '''
+        try:
+            return self._bounds
+        except AttributeError:
+            pass
+
+        if not self.vertices:
+            self._bounds = None
+            return None
+
+        xs, ys, zs = [], [], []
+        for p in self._watchedVertices():
+            xs.append(p._x)
+            ys.append(p._y)
+            zs.append(p._z)
+
+        self._bounds = ((min(xs), min(ys), min(zs)),
+                        (max(xs), max(ys), max(zs)))
+        return self._bounds
+
     def __str__(self):
         s = []
         for label, vertex in zip(self.labels,self):
@@ -1556,9 +1889,15 @@ class PointSequence(collections.Sequence):
 
     def __hash__(self):
         '''
-        Hash computed from the repr value.
+        Hash computed from the set of vertices, consistent with
+        __eq__. Cached until the sequence changes, see bounds.
         '''
-        return int(hashlib.sha1(bytes(repr(self),'utf-8')).hexdigest(), 16)
+        try:
+            return self._hashvalue
+        except AttributeError:
+            pass
+        self._hashvalue = hash(frozenset(self._watchedVertices()))
+        return self._hashvalue
 
     def __contains__(self, point):
         '''
@@ -1618,6 +1957,7 @@ class PointSequence(collections.Sequence):
         if issubclass(type(value),Point):
             try:
                 self[attr[:1]].xyz = value
+                self._invalidate()
                 return
             except (KeyError, IndexError):
                 pass
@@ -1626,6 +1966,7 @@ class PointSequence(collections.Sequence):
             try:
                 for label, point in zip(attr, value):
                     self[label].xyz = point
+                self._invalidate()
                 return
             except KeyError:
                 pass
@@ -1687,14 +2028,112 @@ class PointSequence(collections.Sequence):
         
         return zip(self[0:],self[1:]+self[0:1])
 
-    def __eq__(self,other):
+    def rotate(self, theta_x, theta_y, theta_z, origin=None, radians=False):
+        '''
+        :theta_x: float angle to rotate around the X axis
+        :theta_y: float angle to rotate around the Y axis
+        :theta_z: float angle to rotate around the Z axis
+        :origin: optional Point, defaults to 0,0,0
+        :radians: optional boolean, angles are in degrees unless True
+        :return: a new sequence of the same class
+
+        Returns a copy of the sequence with its vertices rotated around
+        :origin:, see Point.rotate. The rotation matrix is computed once
+        for all of the vertices.
+        '''
+        m = rotationMatrix(theta_x, theta_y, theta_z, radians)
+        ox, oy, oz = Point._convert(origin).xyz
+        points = [Point._convert(p) for p in self.vertices]
+        return self.__class__([Point(_rotated(m, ox, oy, oz,
+                                              p._x, p._y, p._z))
+                               for p in points], base=self._base)
+
+    def convexHull(self):
+        '''
+        :return: Polygon
+
+        The convex hull of the vertices in the XY plane, see
+        Geometry.hull.convexHull.
         '''
-        x == y iff x and y have:
-                 1. an equal number of vertices
-                 2. the same vertices
+        from .hull import convexHull
+
+        return convexHull(self.vertices)
+
+    def diameter(self):
+        '''
+        :return: Segment
+
+        The segment between the two vertices farthest apart in the XY
+        plane, see Geometry.calipers.diameter.
+        '''
+        from .calipers import diameter
+
+        return diameter(self.vertices)
+
+    def minimumWidth(self):
+        '''
+        :return: float
+
+        The width of the narrowest strip holding the vertices in the
+        XY plane, see Geometry.calipers.minimumWidth.
         '''
+        from .calipers import minimumWidth
+
+        return minimumWidth(self.vertices)
 
-        return len(set(self.vertices).difference(set(other.vertices))) == 0
+    def minimumAreaRectangle(self):
+        '''
+        :return: Rectangle
+
+        The rotated rectangle with the smallest area holding the
+        vertices in the XY plane, see
+        Geometry.calipers.minimumAreaRectangle.
+        '''
+        from .calipers import minimumAreaRectangle
+
+        return minimumAreaRectangle(self.vertices)
+
+    def simplify(self, tolerance, method='douglas-peucker',
+                 preserveTopology=False):
+        '''
+        :tolerance: float, a distance for Douglas-Peucker or an area
+                    for Visvalingam-Whyatt
+        :method: optional string, 'douglas-peucker' or
+                 'visvalingam-whyatt'
+        :preserveTopology: optional boolean, True to keep segments of
+                           the result from crossing
+        :return: a new sequence with a subset of the vertices
+
+        See Geometry.simplify.
+        '''
+        from .simplify import simplify
+
+        keep = simplify(self, tolerance, method, self._closed,
+                        preserveTopology)
+        vertices = self.vertices
+        return self.__class__([Point(vertices[i]) for i in keep.tolist()],
+                              base=self._base)
+
+    def _vertexKeys(self):
+        '''
+        Set of (x, y, z) tuples, the distinct vertices.
+        '''
+        return {(v.x, v.y, v.z) for v in self.vertices}
+
+    def __eq__(self,other):
+        '''
+        x == y iff x and y have the same set of vertices, in any
+        order and however often each is repeated, consistent with
+        __hash__.
+        '''
+        if isinstance(other, PointSequence):
+            return self._vertexKeys() == other._vertexKeys()
+        try:
+            vertices = other.vertices
+        except AttributeError:
+            return NotImplemented
+        theirs = {tuple(Point._convert(v).xyz) for v in vertices}
+        return self._vertexKeys() == theirs
     
     
     
@@ -1708,12 +2147,14 @@ class MutablePointSequence(PointSequence,collections.MutableSequence):
         '''
         '''
         del(self.vertices[self._keyToIndex(key)])
+        self._invalidate()
 
     def __setitem__(self, key, value):
         '''
 
         '''
         self.vertices[self._keyToIndex(key)].xyz = value
+        self._invalidate()
 
     def append(self, point):
         '''
@@ -1723,6 +2164,7 @@ class MutablePointSequence(PointSequence,collections.MutableSequence):
         if not issubclass(type(point),Point):
             raise TypeError('{!r} is not a subclass of Point'.format(point))
         self.vertices.append(point)
+        self._invalidate()
 
     def extend(self, iterable):
         '''
@@ -1735,26 +2177,32 @@ class MutablePointSequence(PointSequence,collections.MutableSequence):
         '''
         point = Point._convert(point)
         self.vertices.insert(index,point)
+        self._invalidate()
 
     def clear(self):
         '''
         '''
         self.vertices.clear()
+        self._invalidate()
 
     def pop(self, index=-1):
         '''
         '''
-        return self.vertices.pop(index)
+        point = self.vertices.pop(index)
+        self._invalidate()
+        return point
 
     def remove(self, point):
         '''
         '''
         self.vertices.remove(point)
+        self._invalidate()
 
     def reverse(self):
         '''
         '''
         self.vertices.reverse()
+        self._invalidate()
 
 
     def __add__(self, other):
@@ -1763,26 +2211,45 @@ class MutablePointSequence(PointSequence,collections.MutableSequence):
         '''
         for p in self:
             p += other
+        self._invalidate()
         return self
 
     def __isub__(self, other):
         for p in self:
             p -= other
-        return self            
+        self._invalidate()
+        return self
         
     def __imul__(self, other):
         for p in self:
             p *= other
-        return self             
+        self._invalidate()
+        return self
 
     def __itruediv__(self, other):
         for p in self:
             p /= other
+        self._invalidate()
         return self
     
     def __ifloordiv__(self, other):
         for p in self:
             p //= other
+        self._invalidate()
+        return self
+
+    def irotate(self, theta_x, theta_y, theta_z, origin=None, radians=False):
+        '''
+        In-place version of rotate, rotates every vertex and
+        returns self.
+        '''
+        m = rotationMatrix(theta_x, theta_y, theta_z, radians)
+        ox, oy, oz = Point._convert(origin).xyz
+        for i, p in enumerate(self.vertices):
+            p = Point._convert(p)
+            p.xyz = _rotated(m, ox, oy, oz, p._x, p._y, p._z)
+            self.vertices[i] = p
+        self._invalidate()
         return self
 
         
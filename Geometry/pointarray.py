@@ -0,0 +1,1272 @@
+'''columnar arrays of points
+
+A PointArray stores N points in a single N x 3 buffer of float64 so
+that operations over every point run at array speed instead of
+walking Point objects one at a time.
+'''
+
+import collections
+import math
+import numbers
+import numpy
+
+from .point import Point, PointSequence, rotationMatrix
+
+
+# ccw evaluates the orientation in the plane normal to 'axis',
+# these are the two coordinate indices spanning that plane.
+_ccwAxes = {'z': (0, 1), 2: (0, 1),
+            'y': (0, 2), 1: (0, 2),
+            'x': (1, 2), 0: (1, 2)}
+
+
+def _coordinates(points):
+    '''
+    :points: PointArray, Point, point equivalent or ndarray
+    :return: ndarray whose last dimension holds x, y and z
+
+    Module private function used by the orientation predicates,
+    N x 2 arrays are padded with zero Z coordinates.
+    '''
+    if isinstance(points, numpy.ndarray) and points.shape[-1:] == (2,):
+        pad = numpy.zeros(points.shape[:-1] + (1,))
+        return numpy.concatenate([points, pad], axis=-1)
+
+    return PointArray._operand(points)
+
+
+def ccw(a, b, c, axis='z'):
+    '''
+    :a: PointArray, Point, point equivalent or ndarray
+    :b: PointArray, Point, point equivalent or ndarray
+    :c: PointArray, Point, point equivalent or ndarray
+    :axis: optional string or integer in set('x',0,'y',1,'z',2)
+    :return: numpy.ndarray of floats
+
+    Vectorized Point.ccw, computes a.ccw(b, c, axis) for every row.
+
+    Each argument may be an array of points or a single point which
+    is used for every row, e.g. a fixed pair against many queries:
+
+    >>> ccw(Point(0, 0), Point(1, 0), queries)
+
+    > 0 : counter-clockwise
+      0 : points are collinear
+    < 0 : clockwise
+
+    Raises ValueError if axis is not in 'xyz'.
+    '''
+    try:
+        u, v = _ccwAxes[axis]
+    except (KeyError, TypeError):
+        msg = "invalid axis '{!r}', must be one of {}".format(axis, 'xyz')
+        raise ValueError(msg) from None
+
+    a = _coordinates(a)
+    b = _coordinates(b)
+    c = _coordinates(c)
+
+    au = a[..., u]
+    av = a[..., v]
+
+    return (((b[..., u] - au) * (c[..., v] - av)) -
+            ((b[..., v] - av) * (c[..., u] - au)))
+
+
+def isCCW(a, b, c, axis='z'):
+    '''
+    :a: PointArray, Point, point equivalent or ndarray
+    :b: PointArray, Point, point equivalent or ndarray
+    :c: PointArray, Point, point equivalent or ndarray
+    :axis: optional string or integer in set('x',0,'y',1,'z',2)
+    :return: numpy.ndarray of booleans
+
+    Vectorized Point.isCCW, True for every row where the angle
+    [b, a, c] describes a counter-clockwise rotation around 'axis'.
+
+    Unlike Point.isCCW, collinear rows do not raise CollinearPoints,
+    they are False. Use isCollinear to tell them apart.
+    '''
+    return ccw(a, b, c, axis) > 0
+
+
+def isCollinear(a, b, c):
+    '''
+    :a: PointArray, Point, point equivalent or ndarray
+    :b: PointArray, Point, point equivalent or ndarray
+    :c: PointArray, Point, point equivalent or ndarray
+    :return: numpy.ndarray of booleans
+
+    Vectorized Point.isCollinear, True for every row where a, b
+    and c are collinear.
+    '''
+    return ((ccw(a, b, c, 'x') == 0) &
+            (ccw(a, b, c, 'y') == 0) &
+            (ccw(a, b, c, 'z') == 0))
+
+
+def _xyz(points):
+    '''
+    :points: PointArray, N x 2 or N x 3 ndarray or iterable of points
+    :return: ndarray whose rows start with x and y
+
+    Module private function for the batch queries over many points.
+    '''
+    if isinstance(points, PointArray):
+        return points.xyz
+    if isinstance(points, numpy.ndarray):
+        return points
+    return PointArray(points).xyz
+
+
+def inPolygon(vertices, points):
+    '''
+    :vertices: PointSequence or iterable of point equivalents
+    :points:   PointArray, N x 2 or N x 3 ndarray or iterable of points
+    :return: numpy.ndarray of booleans
+
+    Vectorized Polygon.__contains__, True for each point which is
+    enclosed by or on the perimeter of the polygon in the XY plane.
+    Concave and self-intersecting polygons are handled with the
+    non-zero winding rule.
+
+    The work is one pass over the query points per polygon edge.
+    '''
+    xyz = _xyz(points)
+
+    px = xyz[:, 0]
+    py = xyz[:, 1]
+
+    points = [Point._convert(v) for v in vertices]
+    xy = [(p.x, p.y) for p in points]
+
+    winding = numpy.zeros(len(px), dtype=int)
+    boundary = numpy.zeros(len(px), dtype=bool)
+
+    for (ax, ay), (bx, by) in zip(xy, xy[1:] + xy[:1]):
+
+        if ay > by:
+            ax, ay, bx, by, direction = bx, by, ax, ay, -1
+        else:
+            direction = 1
+
+        cross = ((bx - ax) * (py - ay)) - ((px - ax) * (by - ay))
+
+        boundary |= ((cross == 0) &
+                     (px >= min(ax, bx)) & (px <= max(ax, bx)) &
+                     (py >= ay) & (py <= by))
+
+        crossing = (ay <= py) & (py < by) & (cross > 0)
+        if direction > 0:
+            winding += crossing
+        else:
+            winding -= crossing
+
+    return (winding != 0) | boundary
+
+
+def shoelace(vertices, offsets):
+    '''
+    :vertices: N x 2 or N x 3 ndarray or PointArray, the vertices of
+               many polygons stored one polygon after another
+    :offsets:  sequence of P + 1 integers, polygon i is the vertices
+               from offsets[i] up to but not including offsets[i + 1]
+    :return: tuple of ndarrays, P signed areas and P x 2 centroids
+
+    Vectorized Polygon.signedArea and Polygon.centroid for P packed
+    polygons at once. Every polygon needs at least one vertex.
+    '''
+    if isinstance(vertices, PointArray):
+        vertices = vertices.xyz
+
+    offsets = numpy.asarray(offsets, dtype=int)
+    starts = offsets[:-1]
+    counts = numpy.diff(offsets)
+
+    if (counts < 1).any():
+        raise ValueError('every polygon needs at least one vertex')
+
+    # coordinates relative to each polygon's first vertex
+    origin = numpy.repeat(vertices[starts, :2], counts, axis=0)
+    xy = vertices[:, :2] - origin
+    x, y = xy[:, 0], xy[:, 1]
+
+    nxt = numpy.arange(1, len(x) + 1)
+    nxt[offsets[1:] - 1] = starts
+
+    cross = (x * y[nxt]) - (x[nxt] * y)
+
+    area = numpy.add.reduceat(cross, starts)
+    cx = numpy.add.reduceat((x + x[nxt]) * cross, starts)
+    cy = numpy.add.reduceat((y + y[nxt]) * cross, starts)
+
+    centroids = numpy.empty((len(starts), 2))
+    degenerate = area == 0
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        centroids[:, 0] = cx / (3 * area)
+        centroids[:, 1] = cy / (3 * area)
+
+    mean = numpy.add.reduceat(xy, starts, axis=0) / counts[:, numpy.newaxis]
+    centroids[degenerate] = mean[degenerate]
+
+    return area / 2, centroids + vertices[starts, :2]
+
+
+def _segments(segments):
+    '''
+    :segments: Segment, iterable of Segments or pairs of point
+               equivalents, or an N x 2 x 2, N x 2 x 3, 2 x 2 or
+               2 x 3 ndarray
+    :return: tuple of ndarrays, the X and Y coordinates of the first
+             and second end points
+
+    Module private function used by the segment queries, a single
+    segment gives scalar coordinates which broadcast against many.
+    '''
+    def row(segment):
+        try:
+            a, b = segment.A, segment.B
+        except AttributeError:
+            a, b = segment
+        return [Point._convert(a).xyz, Point._convert(b).xyz]
+
+    if isinstance(segments, numpy.ndarray):
+        ends = segments.astype(float, copy=False)
+    elif hasattr(segments, 'A'):
+        ends = numpy.array(row(segments), dtype=float)
+    else:
+        ends = numpy.array([row(s) for s in segments],
+                           dtype=float).reshape(-1, 2, 3)
+
+    if ends.shape[-2:] not in ((2, 2), (2, 3)):
+        raise ValueError('expected segments of two 2D or 3D end points, '
+                         'got shape {}'.format(ends.shape))
+
+    return (ends[..., 0, 0], ends[..., 0, 1],
+            ends[..., 1, 0], ends[..., 1, 1])
+
+
+def intersectSegments(first, second):
+    '''
+    :first:  Segment, iterable of Segments or pairs of point
+             equivalents, or an N x 2 x 2 (or N x 2 x 3) ndarray
+    :second: same as first
+    :return: tuple of ndarrays (mask, points, t, u)
+
+    Vectorized Segment.intersection in the XY plane for many pairs at
+    once, without exceptions. Row i pairs first[i] with second[i]; a
+    single segment on either side is paired with every row of the
+    other, e.g. one against the candidates from a spatial index:
+
+    >>> mask, points, t, u = intersectSegments(segment, candidates)
+
+    mask is True where the segments share a point, points holds that
+    point (N x 2, NaN where mask is False) and t and u are its
+    parameters along each segment, points = A + t (B - A) for first
+    and C + u (D - C) for second. Where the segments are not parallel
+    t and u locate the crossing of their lines even if it misses the
+    segments; they are NaN for parallel segments which do not meet.
+
+    Collinear segments which overlap give the shared point nearest
+    to the start of the first segment.
+    '''
+    ax, ay, bx, by = _segments(first)
+    cx, cy, dx, dy = _segments(second)
+
+    ax, ay, bx, by, cx, cy, dx, dy = numpy.broadcast_arrays(
+        ax, ay, bx, by, cx, cy, dx, dy)
+
+    rx, ry = bx - ax, by - ay
+    sx, sy = dx - cx, dy - cy
+    wx, wy = cx - ax, cy - ay
+
+    denominator = (rx * sy) - (ry * sx)
+    tn = (wx * sy) - (wy * sx)
+    un = (wx * ry) - (wy * rx)
+
+    t = numpy.full(denominator.shape, numpy.nan)
+    u = numpy.full(denominator.shape, numpy.nan)
+
+    crossing = denominator != 0
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        numpy.divide(tn, denominator, out=t, where=crossing)
+        numpy.divide(un, denominator, out=u, where=crossing)
+    mask = crossing & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+
+    # parallel segments on one line, including zero length segments,
+    # meet along their overlap
+    collinear = (~crossing) & (tn == 0) & (un == 0)
+    if collinear.any():
+        rr = (rx * rx) + (ry * ry)
+        ss = (sx * sx) + (sy * sy)
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            # the ends of second along first
+            t0 = ((wx * rx) + (wy * ry)) / rr
+            t1 = (((dx - ax) * rx) + ((dy - ay) * ry)) / rr
+            lo = numpy.maximum(numpy.minimum(t0, t1), 0)
+            hi = numpy.minimum(numpy.maximum(t0, t1), 1)
+            # first is a point, where it lies along second
+            v = -((wx * sx) + (wy * sy)) / ss
+
+        along = collinear & (rr > 0)
+        mask |= along & (lo <= hi)
+        t[along] = lo[along]
+
+        point = collinear & (rr == 0) & (ss > 0)
+        mask |= point & (v >= 0) & (v <= 1)
+        t[point] = 0
+        u[point] = v[point]
+
+        both = collinear & (rr == 0) & (ss == 0)
+        mask |= both & (wx == 0) & (wy == 0)
+        t[both] = 0
+        u[both] = 0
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            px, py = ax + (t * rx), ay + (t * ry)
+            uc = (((px - cx) * sx) + ((py - cy) * sy)) / ss
+        u[along] = numpy.where(ss[along] > 0, uc[along], 0)
+
+        miss = collinear & ~mask
+        t[miss] = numpy.nan
+        u[miss] = numpy.nan
+
+    points = numpy.full(denominator.shape + (2,), numpy.nan)
+    points[mask, 0] = ax[mask] + (t[mask] * rx[mask])
+    points[mask, 1] = ay[mask] + (t[mask] * ry[mask])
+
+    return mask, points, t, u
+
+
+def _segmentTerms(segments):
+    '''
+    :segments: see _segments
+    :return: tuple of 1D ndarrays (ax, ay, dx, dy, inverse)
+
+    Module private function, the start and direction of each segment
+    and the inverse of its squared length, zero for segments of zero
+    length so that their nearest point is their start.
+    '''
+    ax, ay, bx, by = (numpy.atleast_1d(v) for v in _segments(segments))
+    dx, dy = bx - ax, by - ay
+    dd = (dx * dx) + (dy * dy)
+    inverse = numpy.divide(1, dd, out=numpy.zeros_like(dd), where=dd > 0)
+    return ax, ay, dx, dy, inverse
+
+
+def _squaredDistances(px, py, ax, ay, dx, dy, inverse):
+    '''
+    :return: ndarray, the squared distances
+
+    Module private function, broadcasts the points px, py against
+    the segments from _segmentTerms. Works in place on as few
+    temporaries as possible, this is the inner loop of
+    nearestSegments.
+    '''
+    wx = px - ax
+    wy = py - ay
+    t = wx * dx
+    t += wy * dy
+    t *= inverse
+    numpy.clip(t, 0, 1, out=t)
+    wx -= t * dx
+    wy -= t * dy
+    wx *= wx
+    wy *= wy
+    wx += wy
+    return wx
+
+
+def segmentDistances(points, segments):
+    '''
+    :points:   PointArray, N x 2 or N x 3 ndarray or iterable of points
+    :segments: Segment, iterable of Segments or pairs of point
+               equivalents, or an M x 2 x 2 (or M x 2 x 3) ndarray
+    :return: N x M ndarray of floats
+
+    Vectorized Segment.distanceFromPoint, the distance in the XY plane
+    from every point to every segment. Memory grows with N * M, see
+    nearestSegments for many points.
+    '''
+    xyz = _xyz(points)
+    squared = _squaredDistances(xyz[:, 0, numpy.newaxis],
+                                xyz[:, 1, numpy.newaxis],
+                                *_segmentTerms(segments))
+    return numpy.sqrt(squared, out=squared)
+
+
+def nearestSegments(points, segments, chunk=None):
+    '''
+    :points:   PointArray, N x 2 or N x 3 ndarray or iterable of points
+    :segments: Segment, iterable of Segments or pairs of point
+               equivalents, or an M x 2 x 2 (or M x 2 x 3) ndarray
+    :chunk:    optional integer number of points per block
+    :return: tuple of ndarrays (index, distance, closest)
+
+    The segment nearest to each point in the XY plane, for snapping
+    many points to a set of edges. index holds the N indices of the
+    nearest segments, distance the N distances to them and closest
+    the N x 2 nearest points on them. Ties go to the lower index.
+
+    Points are processed 'chunk' at a time so that memory stays near
+    chunk * M floats, by default about 16k, which keeps each block
+    in the processor cache. Raises ValueError if there are no
+    segments.
+    '''
+    xyz = _xyz(points)
+    ax, ay, dx, dy, inverse = _segmentTerms(segments)
+
+    if len(ax) == 0:
+        raise ValueError('no segments')
+
+    if chunk is None:
+        chunk = max(1, (1 << 14) // len(ax))
+
+    n = len(xyz)
+    index = numpy.empty(n, dtype=int)
+    for start in range(0, n, chunk):
+        block = slice(start, start + chunk)
+        squared = _squaredDistances(xyz[block, 0, numpy.newaxis],
+                                    xyz[block, 1, numpy.newaxis],
+                                    ax, ay, dx, dy, inverse)
+        index[start:start + chunk] = squared.argmin(axis=1)
+
+    # the nearest points, once for each point
+    px, py = xyz[:, 0], xyz[:, 1]
+    ax, ay, dx, dy = ax[index], ay[index], dx[index], dy[index]
+    t = ((px - ax) * dx) + ((py - ay) * dy)
+    t = numpy.clip(t * inverse[index], 0, 1)
+
+    closest = numpy.empty((n, 2))
+    closest[:, 0] = ax + (t * dx)
+    closest[:, 1] = ay + (t * dy)
+    distance = numpy.hypot(px - closest[:, 0], py - closest[:, 1])
+
+    return index, distance, closest
+
+
+def clipSegments(segments, rectangle):
+    '''
+    :segments:  Segment, iterable of Segments or pairs of point
+                equivalents, or an N x 2 x 2 (or N x 2 x 3) ndarray
+    :rectangle: Rectangle, possibly rotated
+    :return: tuple of ndarrays (mask, ends)
+
+    Vectorized Rectangle.clip with the Liang-Barsky algorithm, for
+    culling and clipping many segments against a viewport. mask is
+    True for every segment with a part inside the rectangle or on its
+    edges in the XY plane, and ends holds the N x 2 x 2 end points of
+    that part, NaN where mask is False. End points inside the
+    rectangle are kept exactly.
+    '''
+    ax, ay, bx, by = (numpy.atleast_1d(v) for v in _segments(segments))
+    dx, dy = bx - ax, by - ay
+
+    t0 = numpy.zeros(ax.shape)
+    t1 = numpy.ones(ax.shape)
+    mask = numpy.ones(ax.shape, dtype=bool)
+
+    for p, q in rectangle._slabs(ax, ay, dx, dy):
+        mask &= (p != 0) | (q >= 0)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            r = q / p
+        numpy.maximum(t0, r, out=t0, where=p < 0)
+        numpy.minimum(t1, r, out=t1, where=p > 0)
+    mask &= t0 <= t1
+
+    ends = numpy.full(ax.shape + (2, 2), numpy.nan)
+    t0, t1 = t0[mask], t1[mask]
+    ax, ay, bx, by = ax[mask], ay[mask], bx[mask], by[mask]
+    dx, dy = dx[mask], dy[mask]
+    ends[mask, 0, 0] = numpy.where(t0 == 0, ax, ax + (t0 * dx))
+    ends[mask, 0, 1] = numpy.where(t0 == 0, ay, ay + (t0 * dy))
+    ends[mask, 1, 0] = numpy.where(t1 == 1, bx, ax + (t1 * dx))
+    ends[mask, 1, 1] = numpy.where(t1 == 1, by, ay + (t1 * dy))
+
+    return mask, ends
+
+
+def randomStreams(count, seed=None):
+    '''
+    :count: integer number of generators
+    :seed:  optional integer seed or numpy.random.SeedSequence
+    :return: list of numpy.random.Generator
+
+    Returns 'count' statistically independent random generators
+    spawned from one seed, suitable for the 'rng' argument of the
+    PointArray random generators. Workers given one stream each
+    produce deterministic, non-overlapping samples for a given seed.
+    '''
+    if not isinstance(seed, numpy.random.SeedSequence):
+        seed = numpy.random.SeedSequence(seed)
+    return [numpy.random.default_rng(s) for s in seed.spawn(count)]
+
+
+class PointView(Point):
+    '''
+    A Point whose coordinates live in one row of a PointArray.
+
+    Changes made through the view are visible in the array and
+    changes to the array are visible through the view. Operations
+    which return a new object, e.g. view + 1, return plain Points.
+    '''
+
+    __slots__ = ('_row',)
+
+    @classmethod
+    def _convert(cls, other, ignoreScalars=False):
+        '''
+        :other: Point or point equivalent
+        :ignorescalars: optional boolean
+        :return: Point
+
+        Converts 'other' into a Point rather than a view, see
+        Point._convert.
+        '''
+        return Point._convert(other, ignoreScalars)
+
+    def __init__(self, array, index):
+        '''
+        :array: PointArray
+        :index: integer row index
+        '''
+        self._row = array.xyz[index]
+        self._hashvalue = None
+        self._owners = None
+
+    @property
+    def _x(self):
+        return float(self._row[0])
+
+    @_x.setter
+    def _x(self, newValue):
+        self._row[0] = newValue
+
+    @property
+    def _y(self):
+        return float(self._row[1])
+
+    @_y.setter
+    def _y(self, newValue):
+        self._row[1] = newValue
+
+    @property
+    def _z(self):
+        return float(self._row[2])
+
+    @_z.setter
+    def _z(self, newValue):
+        self._row[2] = newValue
+
+    def __hash__(self):
+        '''
+        The hash of a Point with the same coordinates. Not cached
+        since the underlying array may change without notice.
+        '''
+        return hash(Point(self))
+
+    def __reduce__(self):
+        return (Point, tuple(self.xyz))
+
+    def _binary_(self, other, func, inplace=False):
+        '''
+        See Point._binary_, results which are not computed in-place
+        are returned as Points.
+        '''
+        if inplace:
+            return super()._binary_(other, func, inplace=True)
+        return Point(self)._binary_(other, func, inplace=True)
+
+    def _unary_(self, func, inplace=False):
+        '''
+        See Point._unary_, results which are not computed in-place
+        are returned as Points.
+        '''
+        if inplace:
+            return super()._unary_(func, inplace=True)
+        return Point(self)._unary_(func, inplace=True)
+
+
+class PointArray(collections.Sequence):
+    '''
+    An array of three dimensional points stored in a single N x 3
+    float64 buffer.
+
+    Usage:
+
+    >>> a = PointArray([[0, 0], [1, 1], [2, 2]])
+    >>> b = PointArray(Point.random() for _ in range(3))
+    >>> c = PointArray(polygon)            # any PointSequence
+    >>> d = PointArray(numpy.zeros((1000, 3)))
+    >>> e = PointArray.randomInSphere(1000000, rng=42)
+
+    The random generators gaussian, randomInBox, randomInDisc and
+    randomInSphere create every point in one call. They draw from
+    'rng', a numpy.random.Generator or anything numpy.random.default_rng
+    accepts, e.g. an integer seed. Use randomStreams to get independent
+    generators for parallel workers.
+
+    PointArray supports the same operators as Point, applied to
+    every row at once. Operands can be PointArrays with the same
+    number of points, Points or point equivalents (which are applied
+    to each row), scalars or numpy arrays which broadcast against
+    the N x 3 buffer.
+
+    Operations
+    ==========
+
+    +, -, *, /, //, %, **, +=, -=, *=, /=, //=, %=, **=, ==, !=
+
+    Indexing with an integer returns a PointView; a Point which
+    shares storage with the array. Slicing returns a PointArray which
+    also shares storage, other index types return a copy.
+
+    Methods
+    =======
+                     ccw: counter-clockwise function for each row
+                   isCCW: is angle [b, row, c] a counter-clockwise rotation?
+             isCollinear: are b, row, c collinear?
+                     dot: dot product of each row
+                   cross: cross product of each row
+                midpoint: points between each row and other
+                distance: Euclidean distance between each row and other
+         distanceSquared: Squared Euclidean distance
+                rotate2d: rotate each row around an axis
+                  rotate: rotate each row around the X, Y and Z axes
+              convexHull: the convex hull of the points as a Polygon
+                diameter: the farthest pair of points as a Segment
+            minimumWidth: the width of the narrowest strip holding the points
+    minimumAreaRectangle: the smallest rotated Rectangle holding the points
+                simplify: a simplified line through a subset of the rows
+
+    Methods which reduce a row to a single value return numpy arrays
+    with one value per point.
+    '''
+
+    @classmethod
+    def zeros(cls, count):
+        '''
+        :count: integer number of points
+        :return: PointArray
+
+        Returns a PointArray of 'count' points at the origin.
+        '''
+        return cls(numpy.zeros((count, 3)))
+
+    @classmethod
+    def gaussian(cls, count, mu=0, sigma=1, rng=None):
+        '''
+        :count: integer number of points
+        :mu:    optional float or point equivalent, mean
+        :sigma: optional float, standard deviation
+        :rng:   optional numpy.random.Generator, SeedSequence or seed
+        :return: PointArray
+
+        Returns 'count' points whose coordinates are picked from a
+        Gaussian distribution, see Point.gaussian.
+        '''
+        rng = numpy.random.default_rng(rng)
+        return cls(rng.normal(cls._operand(mu), sigma, (count, 3)))
+
+    @classmethod
+    def randomInBox(cls, count, low=None, high=None, rng=None):
+        '''
+        :count: integer number of points
+        :low:   optional point equivalent, defaults to 0,0,0
+        :high:  optional point equivalent, defaults to 1,1,1
+        :rng:   optional numpy.random.Generator, SeedSequence or seed
+        :return: PointArray
+
+        Returns 'count' points picked uniformly from the box with
+        opposite corners 'low' and 'high'. Give the corners equal Z
+        coordinates to pick points in a rectangle.
+        '''
+        rng = numpy.random.default_rng(rng)
+        low = cls._operand(low)
+        high = cls._operand([1, 1, 1] if high is None else high)
+        return cls(rng.uniform(low, high, (count, 3)))
+
+    @classmethod
+    def randomInDisc(cls, count, origin=None, radius=1, rng=None):
+        '''
+        :count:  integer number of points
+        :origin: optional point equivalent, center of the disc
+        :radius: optional float
+        :rng:    optional numpy.random.Generator, SeedSequence or seed
+        :return: PointArray
+
+        Returns 'count' points picked uniformly from the disc in
+        the XY plane with center 'origin' and 'radius'.
+        '''
+        rng = numpy.random.default_rng(rng)
+        r = radius * numpy.sqrt(rng.random(count))
+        t = rng.uniform(0, 2 * math.pi, count)
+        xyz = numpy.zeros((count, 3))
+        xyz[:, 0] = r * numpy.cos(t)
+        xyz[:, 1] = r * numpy.sin(t)
+        return cls(xyz + cls._operand(origin))
+
+    @classmethod
+    def randomInSphere(cls, count, origin=None, radius=1, rng=None):
+        '''
+        :count:  integer number of points
+        :origin: optional point equivalent, center of the sphere
+        :radius: optional float
+        :rng:    optional numpy.random.Generator, SeedSequence or seed
+        :return: PointArray
+
+        Returns 'count' points picked uniformly from the solid sphere
+        with center 'origin' and 'radius'.
+        '''
+        rng = numpy.random.default_rng(rng)
+        xyz = rng.standard_normal((count, 3))
+        length = numpy.sqrt(numpy.einsum('ij,ij->i', xyz, xyz))
+        length[length == 0] = 1
+        r = radius * numpy.cbrt(rng.random(count))
+        xyz *= (r / length)[:, numpy.newaxis]
+        return cls(xyz + cls._operand(origin))
+
+    @classmethod
+    def _operand(cls, other):
+        '''
+        :other: PointArray, Point, point equivalent, scalar or ndarray
+        :return: ndarray or scalar
+
+        Class private method for converting 'other' into something
+        that broadcasts against an N x 3 buffer.
+        '''
+        if isinstance(other, PointArray):
+            return other.xyz
+
+        if isinstance(other, (numbers.Number, numpy.generic, numpy.ndarray)):
+            return other
+
+        return numpy.array(Point._convert(other).xyz)
+
+    def __init__(self, points=None):
+        '''
+        :points: optional PointArray, PointSequence, iterable of Points
+                 or point equivalents, or an N x 2 or N x 3 array
+
+        Initializes the array with a copy of 'points'.
+        '''
+        self.xyz = points
+
+    @property
+    def xyz(self):
+        '''
+        The N x 3 coordinate buffer, numpy.ndarray.
+        '''
+        try:
+            return self._xyz
+        except AttributeError:
+            pass
+        self._xyz = numpy.zeros((0, 3))
+        return self._xyz
+
+    @xyz.setter
+    def xyz(self, newValues):
+        if newValues is None:
+            self._xyz = numpy.zeros((0, 3))
+            return
+
+        if isinstance(newValues, PointArray):
+            newValues = newValues.xyz
+
+        if not isinstance(newValues, numpy.ndarray):
+            newValues = [p.xyz if isinstance(p, Point) else Point(p).xyz
+                         for p in newValues]
+
+        values = numpy.array(newValues, dtype=float, ndmin=2)
+
+        if values.size == 0:
+            values = values.reshape(0, 3)
+
+        if values.ndim != 2 or not 1 <= values.shape[1] <= 3:
+            msg = 'expected N x 3 coordinates, got shape {}'
+            raise ValueError(msg.format(values.shape))
+
+        if values.shape[1] < 3:
+            pad = numpy.zeros((len(values), 3 - values.shape[1]))
+            values = numpy.hstack([values, pad])
+
+        self._xyz = values
+
+    @property
+    def x(self):
+        '''
+        X axis coordinates, numpy.ndarray view.
+        '''
+        return self.xyz[:, 0]
+
+    @x.setter
+    def x(self, newValues):
+        self.xyz[:, 0] = newValues
+
+    @property
+    def y(self):
+        '''
+        Y axis coordinates, numpy.ndarray view.
+        '''
+        return self.xyz[:, 1]
+
+    @y.setter
+    def y(self, newValues):
+        self.xyz[:, 1] = newValues
+
+    @property
+    def z(self):
+        '''
+        Z axis coordinates, numpy.ndarray view.
+        '''
+        return self.xyz[:, 2]
+
+    @z.setter
+    def z(self, newValues):
+        self.xyz[:, 2] = newValues
+
+    @property
+    def xy(self):
+        '''
+        X and Y axis coordinates, N x 2 numpy.ndarray view.
+        '''
+        return self.xyz[:, :2]
+
+    @xy.setter
+    def xy(self, newValues):
+        self.xyz[:, :2] = newValues
+
+    def points(self):
+        '''
+        :return: list of Points
+
+        Returns new Points with the coordinates of each row.
+        '''
+        return [Point(x, y, z) for x, y, z in self.xyz.tolist()]
+
+    def toSequence(self, cls=PointSequence):
+        '''
+        :cls:    optional PointSequence subclass
+        :return: PointSequence subclass
+
+        Returns a new PointSequence of Points copied from this array.
+        '''
+        return cls(self.points())
+
+    def copy(self):
+        '''
+        :return: PointArray
+
+        Returns a new PointArray with a copy of the coordinates.
+        '''
+        return self.__class__(self)
+
+    def __str__(self):
+        return str(self.xyz)
+
+    def __repr__(self):
+        return '{s.__class__.__name__}({a!r})'.format(s=self, a=self.xyz)
+
+    def __len__(self):
+        return len(self.xyz)
+
+    def __iter__(self):
+        '''
+        Returns an iterator of PointViews, one for each row.
+        '''
+        return (PointView(self, i) for i in range(len(self)))
+
+    def __getitem__(self, key):
+        '''
+        :key:    integer, slice, mask or index array
+        :return: PointView or PointArray
+
+        Integers return a PointView of that row, slices return a
+        PointArray sharing storage. Masks and index arrays return a
+        PointArray with a copy of the selected rows.
+        '''
+        if isinstance(key, (int, numpy.integer)):
+            return PointView(self, key)
+
+        result = self.__class__()
+        result._xyz = self.xyz[key]
+        return result
+
+    def __setitem__(self, key, newValue):
+        '''
+        :key:      integer, slice, mask or index array
+        :newValue: PointArray, Point, point equivalent or ndarray
+        '''
+        self.xyz[key] = self._operand(newValue)
+
+    def __contains__(self, point):
+        '''
+        True iff a row has the same coordinates as 'point'.
+        '''
+        try:
+            p = numpy.array(Point._convert(point).xyz)
+        except (TypeError, ValueError):
+            return False
+        return bool((self.xyz == p).all(axis=1).any())
+
+    def __eq__(self, other):
+        '''
+        x == y iff x and y have the same number of points and
+        the same coordinates in the same order.
+        '''
+        if other is None:
+            return NotImplemented
+        try:
+            return numpy.array_equal(self.xyz, PointArray(other).xyz)
+        except (TypeError, ValueError):
+            return NotImplemented
+
+    __hash__ = None
+
+    # numpy scalars and arrays on the left defer to the reflected
+    # operators instead of treating the array as a sequence
+    __array_ufunc__ = None
+
+    def _binary_(self, other, func, inplace=False, checkZero=False):
+        '''
+        :other:     PointArray, Point or point equivalent, scalar
+        :func:      numpy binary ufunc
+        :inplace:   optional boolean
+        :checkZero: optional boolean
+        :return:    PointArray
+
+        Implementation private method.
+
+        All of the binary operations funnel thru this method, see
+        Point._binary_. If checkZero is True, ZeroDivisionError is
+        raised when any element of 'other' is zero.
+        '''
+        b = self._operand(other)
+
+        if checkZero and numpy.any(numpy.equal(b, 0)):
+            raise ZeroDivisionError('{} by zero'.format(func.__name__))
+
+        if inplace:
+            func(self.xyz, b, out=self.xyz)
+            return self
+
+        result = self.__class__()
+        result._xyz = func(self.xyz, b)
+        return result
+
+    def _rbinary_(self, other, func, checkZero=False):
+        '''
+        Reflected version of _binary_, computes func(other, self).
+        '''
+        if checkZero and numpy.any(numpy.equal(self.xyz, 0)):
+            raise ZeroDivisionError('{} by zero'.format(func.__name__))
+
+        result = self.__class__()
+        result._xyz = func(self._operand(other), self.xyz)
+        return result
+
+    def __add__(self, other):
+        return self._binary_(other, numpy.add)
+
+    def __radd__(self, other):
+        return self._rbinary_(other, numpy.add)
+
+    def __iadd__(self, other):
+        return self._binary_(other, numpy.add, inplace=True)
+
+    def __sub__(self, other):
+        return self._binary_(other, numpy.subtract)
+
+    def __rsub__(self, other):
+        return self._rbinary_(other, numpy.subtract)
+
+    def __isub__(self, other):
+        return self._binary_(other, numpy.subtract, inplace=True)
+
+    def __mul__(self, other):
+        return self._binary_(other, numpy.multiply)
+
+    def __rmul__(self, other):
+        return self._rbinary_(other, numpy.multiply)
+
+    def __imul__(self, other):
+        return self._binary_(other, numpy.multiply, inplace=True)
+
+    def __truediv__(self, other):
+        return self._binary_(other, numpy.true_divide, checkZero=True)
+
+    def __rtruediv__(self, other):
+        return self._rbinary_(other, numpy.true_divide, checkZero=True)
+
+    def __itruediv__(self, other):
+        return self._binary_(other, numpy.true_divide,
+                             inplace=True, checkZero=True)
+
+    def __floordiv__(self, other):
+        return self._binary_(other, numpy.floor_divide, checkZero=True)
+
+    def __rfloordiv__(self, other):
+        return self._rbinary_(other, numpy.floor_divide, checkZero=True)
+
+    def __ifloordiv__(self, other):
+        return self._binary_(other, numpy.floor_divide,
+                             inplace=True, checkZero=True)
+
+    def __mod__(self, other):
+        return self._binary_(other, numpy.mod, checkZero=True)
+
+    def __rmod__(self, other):
+        return self._rbinary_(other, numpy.mod, checkZero=True)
+
+    def __imod__(self, other):
+        return self._binary_(other, numpy.mod, inplace=True, checkZero=True)
+
+    def __pow__(self, other):
+        return self._binary_(other, numpy.power)
+
+    def __rpow__(self, other):
+        return self._rbinary_(other, numpy.power)
+
+    def __ipow__(self, other):
+        return self._binary_(other, numpy.power, inplace=True)
+
+    def __pos__(self):
+        '''
+        +a
+
+        Returns self.
+        '''
+        return self
+
+    def __neg__(self):
+        '''
+        -a
+
+        Returns a new object with it's members negated.
+        '''
+        return self * -1
+
+    def __abs__(self):
+        '''
+        abs(a.x),abs(a.y),abs(a.z) for each row.
+
+        Returns self, see Point.__abs__.
+        '''
+        numpy.absolute(self.xyz, out=self.xyz)
+        return self
+
+    def dot(self, other):
+        '''
+        :other: PointArray, Point or point equivalent
+        :return: numpy.ndarray of floats
+
+        Dot product of each row and other, see Point.dot.
+        '''
+        return (self.xyz * self._operand(other)).sum(axis=1)
+
+    def cross(self, other):
+        '''
+        :other: PointArray, Point or point equivalent
+        :return: numpy.ndarray of floats
+
+        Cross product of each row and other, see Point.cross.
+        '''
+        u = self.xyz
+        v = numpy.broadcast_to(self._operand(other), u.shape)
+
+        return (((u[:, 1] * v[:, 2]) - (u[:, 2] * v[:, 1])) +
+                ((u[:, 2] * v[:, 0]) - (u[:, 0] * v[:, 2])) +
+                ((u[:, 0] * v[:, 1]) - (u[:, 1] * v[:, 0])))
+
+    def midpoint(self, other):
+        '''
+        :other: PointArray, Point or point equivalent
+        :return: PointArray
+
+        The points midway between each row and 'other'.
+        '''
+        return (self + other) / 2
+
+    def distanceSquared(self, other=None):
+        '''
+        :other: optional PointArray, Point or point equivalent
+        :return: numpy.ndarray of floats
+
+        The squared Euclidean distance from each row to 'other'.
+
+        If 'other' is not specified, the origin is used.
+        '''
+        d = self.xyz - self._operand(other)
+        return (d * d).sum(axis=1)
+
+    def distance(self, other=None):
+        '''
+        :other: optional PointArray, Point or point equivalent
+        :return: numpy.ndarray of floats
+
+        The Euclidean distance from each row to 'other'.
+
+        If 'other' is not specified, the origin is used.
+        '''
+        return numpy.sqrt(self.distanceSquared(other))
+
+    def ccw(self, b, c, axis='z'):
+        '''
+        :b: PointArray, Point or point equivalent
+        :c: PointArray, Point or point equivalent
+        :axis: optional string or integer in set('x',0,'y',1,'z',2)
+        :return: numpy.ndarray of floats
+
+        Point.ccw for every row, see the module function ccw.
+        '''
+        return ccw(self, b, c, axis)
+
+    def isCCW(self, b, c, axis='z'):
+        '''
+        :b: PointArray, Point or point equivalent
+        :c: PointArray, Point or point equivalent
+        :axis: optional string or integer in set('x',0,'y',1,'z',2)
+        :return: numpy.ndarray of booleans
+
+        Point.isCCW for every row, see the module function isCCW.
+        '''
+        return isCCW(self, b, c, axis)
+
+    def isCollinear(self, b, c):
+        '''
+        :b: PointArray, Point or point equivalent
+        :c: PointArray, Point or point equivalent
+        :return: numpy.ndarray of booleans
+
+        Point.isCollinear for every row.
+        '''
+        return isCollinear(self, b, c)
+
+    def rotate2d(self, theta, origin=None, axis='z', radians=False):
+        '''
+        :theta: float angle to rotate each point around origin
+        :origin: optional Point, defaults to 0,0,0
+        :axis: optional string, one of 'x', 'y' or 'z'
+        :radians: optional boolean, theta is in degrees unless True
+
+        Returns a new PointArray rotated by :theta: around :origin:,
+        see Point.rotate2d.
+        '''
+        return self.copy().irotate2d(theta, origin, axis, radians)
+
+    def irotate2d(self, theta, origin=None, axis='z', radians=False):
+        '''
+        In-place version of rotate2d, returns self.
+        '''
+        try:
+            u, v = {'z': (0, 1), 'y': (2, 0), 'x': (1, 2)}[axis]
+        except KeyError:
+            msg = 'unknown axis {}, expecting x, y or z'
+            raise KeyError(msg.format(axis)) from None
+
+        o = numpy.array(Point._convert(origin).xyz)
+
+        if not radians:
+            theta = math.radians(theta)
+
+        cosT = math.cos(theta)
+        sinT = math.sin(theta)
+
+        du = self.xyz[:, u] - o[u]
+        dv = self.xyz[:, v] - o[v]
+
+        self.xyz[:, u] = o[u] + (cosT * du) - (sinT * dv)
+        self.xyz[:, v] = o[v] + (sinT * du) + (cosT * dv)
+
+        return self
+
+    def convexHull(self):
+        '''
+        :return: Polygon
+
+        The convex hull of the points in the XY plane, see
+        Geometry.hull.convexHull.
+        '''
+        from .hull import convexHull
+
+        return convexHull(self)
+
+    def diameter(self):
+        '''
+        :return: Segment
+
+        The segment between the two points farthest apart in the XY
+        plane, see Geometry.calipers.diameter.
+        '''
+        from .calipers import diameter
+
+        return diameter(self)
+
+    def minimumWidth(self):
+        '''
+        :return: float
+
+        The width of the narrowest strip holding the points in the
+        XY plane, see Geometry.calipers.minimumWidth.
+        '''
+        from .calipers import minimumWidth
+
+        return minimumWidth(self)
+
+    def minimumAreaRectangle(self):
+        '''
+        :return: Rectangle
+
+        The rotated rectangle with the smallest area holding the
+        points in the XY plane, see
+        Geometry.calipers.minimumAreaRectangle.
+        '''
+        from .calipers import minimumAreaRectangle
+
+        return minimumAreaRectangle(self)
+
+    def simplify(self, tolerance, method='douglas-peucker', closed=False,
+                 preserveTopology=False):
+        '''
+        :tolerance: float, a distance for Douglas-Peucker or an area
+                    for Visvalingam-Whyatt
+        :method: optional string, 'douglas-peucker' or
+                 'visvalingam-whyatt'
+        :closed: optional boolean, True if the rows are a ring
+        :preserveTopology: optional boolean, True to keep segments of
+                           the result from crossing
+        :return: PointArray with a subset of the rows
+
+        See Geometry.simplify.
+        '''
+        from .simplify import simplify
+
+        keep = simplify(self, tolerance, method, closed, preserveTopology)
+        return self.__class__(self.xyz[keep])
+
+    def rotate(self, theta_x, theta_y, theta_z, origin=None, radians=False):
+        '''
+        :theta_x: float angle to rotate around the X axis
+        :theta_y: float angle to rotate around the Y axis
+        :theta_z: float angle to rotate around the Z axis
+        :origin: optional Point, defaults to 0,0,0
+        :radians: optional boolean, angles are in degrees unless True
+
+        Returns a new PointArray rotated around :origin:, see
+        Point.rotate.
+        '''
+        return self.copy().irotate(theta_x, theta_y, theta_z,
+                                   origin, radians)
+
+    def irotate(self, theta_x, theta_y, theta_z, origin=None, radians=False):
+        '''
+        In-place version of rotate, returns self.
+        '''
+        m = numpy.array(rotationMatrix(theta_x, theta_y, theta_z, radians))
+
+        o = numpy.array(Point._convert(origin).xyz)
+
+        self.xyz[...] = numpy.dot(self.xyz - o, m.T) + o
+
+        return self
@@ -2,6 +2,10 @@
 
 '''
 
+import bisect
+import sys
+import time
+
 from . import Point, PointSequence, MutablePointSequence, Segment
 from . import CollinearPoints
 
@@ -14,29 +18,168 @@ class Polygon(PointSequence):
 
     '''
 
+    _cached = PointSequence._cached + ('_xy', '_shoelace')
+
+    _closed = True
+
+    @property
+    def xy(self):
+        '''
+        The X and Y coordinates of each vertex, list of float tuples.
+        Cached until the polygon changes, see PointSequence.bounds.
+        '''
+        try:
+            return self._xy
+        except AttributeError:
+            pass
+        self._xy = [(p.x, p.y) for p in self._watchedVertices()]
+        return self._xy
+
     def __contains__(self, point):
         '''
         True iff point is on the perimeter or enclosed by the polygon.
 
+        Uses the winding number of the polygon around point in the XY
+        plane, so concave polygons are handled. Points enclosed by a
+        self-intersecting polygon follow the non-zero winding rule.
+        Points outside the bounds are rejected without visiting the
+        edges.
         '''
-        try:
-            r = [a.isCCW(b,point) for a,b in self.pairs()]
-        except CollinearPoints:
-            return True
+        p = Point._convert(point)
+        px, py = p.x, p.y
+
+        bounds = self.bounds
+        if bounds is None:
+            return False
+        (xmin, ymin, _), (xmax, ymax, _) = bounds
+        if not (xmin <= px <= xmax and ymin <= py <= ymax):
+            return False
+
+        xy = self.xy
+
+        winding = 0
+        for (ax, ay), (bx, by) in zip(xy, xy[1:] + xy[:1]):
+
+            # orient every edge from bottom to top so that the sign of
+            # cross is computed the same way for either direction.
+            if ay > by:
+                ax, ay, bx, by, direction = bx, by, ax, ay, -1
+            else:
+                direction = 1
+
+            cross = ((bx - ax) * (py - ay)) - ((px - ax) * (by - ay))
+
+            if cross == 0:
+                if ((min(ax, bx) <= px <= max(ax, bx)) and
+                        (ay <= py <= by)):
+                    return True
+                continue
+
+            if ay <= py < by and cross > 0:
+                winding += direction
+
+        return winding != 0
+
+    def containsPoints(self, points):
+        '''
+        :points: PointArray, N x 2 or N x 3 ndarray or iterable of points
+        :return: numpy.ndarray of booleans
+
+        Classifies every point at once, the result is the same as
+        [p in self for p in points].
+        '''
+        from .pointarray import inPolygon
+
+        return inPolygon(self.xy, points)
+
+    def prepare(self):
+        '''
+        Returns a PreparedPolygon for fast repeated containment tests.
+        '''
+        return PreparedPolygon(self)
+
+    @property
+    def isConvex(self):
+        '''
+        True if the polygon is convex in the XY plane, boolean.
+        Repeated vertices and vertices in the middle of straight
+        edges are allowed.
+        '''
+        from .clipping import _ring, _isConvex
+
+        return _isConvex(_ring(self))
+
+    def intersection(self, other):
+        '''
+        :other: Polygon or iterable of point equivalents
+        :return: list of Polygons
+
+        The regions inside both self and other, see Geometry.clipping.
+        '''
+        from .clipping import intersection
+
+        return intersection(self, other)
+
+    def union(self, other):
+        '''
+        :other: Polygon or iterable of point equivalents
+        :return: list of Polygons
+
+        The regions inside self or other, see Geometry.clipping.
+        Holes are clockwise Polygons.
+        '''
+        from .clipping import union
+
+        return union(self, other)
+
+    def difference(self, other):
+        '''
+        :other: Polygon or iterable of point equivalents
+        :return: list of Polygons
+
+        The regions inside self and not inside other, see
+        Geometry.clipping. Holes are clockwise Polygons.
+        '''
+        from .clipping import difference
+
+        return difference(self, other)
+
+    def xor(self, other):
+        '''
+        :other: Polygon or iterable of point equivalents
+        :return: list of Polygons
+
+        The regions inside exactly one of self and other, see
+        Geometry.clipping. Holes are clockwise Polygons.
+        '''
+        from .clipping import xor
+
+        return xor(self, other)
+
+    def triangulate(self, indices=False):
+        '''
+        :indices: optional boolean
+        :return: list of Triangles or an N x 3 numpy.ndarray of integers
+
+        Cuts the polygon into triangles, see
+        Geometry.triangulation.triangulate.
+        '''
+        from .triangulation import triangulate
+
+        return triangulate(self, indices)
 
-        return not (any(r) and not all(r))
-        
     def edges(self):
         '''
         A list of Segments.
         '''
         return [Segment(a,b) for a,b in self.pairs()]
 
+    @property
     def sides(self):
         '''
-        Segment lengths, list of floats.
+        Edge lengths, list of floats.
         '''
-        return [s.length for s in self.segments()]
+        return [a.distance(b) for a, b in self.pairs()]
 
     @property
     def perimeter(self):
@@ -52,16 +195,100 @@ class Polygon(PointSequence):
         '''
         return self.perimeter / 2
 
+    @property
+    def _shoelaceResult(self):
+        '''
+        Tuple of signed area and centroid X and Y coordinates, floats.
+
+        Implementation private property, computes everything in one
+        pass over the vertices with the shoelace formula. Cached
+        until the polygon changes.
+        '''
+        try:
+            return self._shoelace
+        except AttributeError:
+            pass
+
+        xy = self.xy
+        if not xy:
+            self._shoelace = (0.0, 0.0, 0.0)
+            return self._shoelace
+
+        # coordinates relative to the first vertex lose less precision
+        # for polygons far from the origin.
+        x0, y0 = xy[0]
+        area = cx = cy = 0.0
+        sx = sy = 0.0
+        ax, ay = xy[-1][0] - x0, xy[-1][1] - y0
+        for x, y in xy:
+            bx, by = x - x0, y - y0
+            cross = (ax * by) - (bx * ay)
+            area += cross
+            cx += (ax + bx) * cross
+            cy += (ay + by) * cross
+            sx += bx
+            sy += by
+            ax, ay = bx, by
+
+        if area == 0:
+            # degenerate, fall back to the average of the vertices
+            n = len(xy)
+            self._shoelace = (0.0, x0 + (sx / n), y0 + (sy / n))
+        else:
+            self._shoelace = (area / 2,
+                              x0 + (cx / (3 * area)),
+                              y0 + (cy / (3 * area)))
+        return self._shoelace
+
+    @property
+    def signedArea(self):
+        '''
+        Area enclosed by the polygon in the XY plane, float. Positive
+        if the vertices are in counter-clockwise order and negative
+        if they are clockwise.
+        '''
+        return self._shoelaceResult[0]
+
+    @property
+    def area(self):
+        '''
+        Area enclosed by the polygon in the XY plane, float.
+        '''
+        return abs(self._shoelaceResult[0])
+
+    @property
+    def isCCW(self):
+        '''
+        True if the vertices are in counter-clockwise order, boolean.
+        '''
+        return self._shoelaceResult[0] > 0
+
     @property
     def centroid(self):
         '''
+        The center of mass of the area enclosed by the polygon in the
+        XY plane, Point. Polygons without area use the average of
+        their vertices.
         '''
-        return sum(self.vertices) / len(self.vertices)
+        area, cx, cy = self._shoelaceResult
+        return Point(cx, cy)
 
     def incenter(self):
         '''
+        Center of the incircle of a triangle, Point. The average of
+        the vertices weighted by the length of the side opposite each
+        one.
+
+        Raises ValueError unless the polygon has three vertices, only
+        triangles always have an incircle.
         '''
-        return sum([s*p for s,p in zip(self.sides, self.vertices)]) / len(self.vertices)
+        vertices = self.vertices
+        if len(vertices) != 3:
+            raise ValueError('incenter needs 3 vertices, got {}'.format(
+                len(vertices)))
+        a, b, c = vertices
+        sides = [b.distance(c), c.distance(a), a.distance(b)]
+        return sum([s*p for s,p in zip(sides, vertices)]) / sum(sides)
 
     @property
     def midpoints(self):
@@ -69,10 +296,257 @@ class Polygon(PointSequence):
         The midpoints of each edge, list of Points.
 
         '''
-        return [s.midpoint for s in self.edges]    
+        return [s.midpoint for s in self.edges()]
 
 
 class MutablePolygon(Polygon, MutablePointSequence):
     pass
 
 
+class PreparedPolygon(object):
+    '''
+    A snapshot of a Polygon indexed for fast repeated containment
+    tests in the XY plane.
+
+    Usage:
+
+    >>> prepared = PreparedPolygon(polygon)
+    >>> Point(1, 2) in prepared
+    >>> prepared.containsPoints(points)     # numpy.ndarray of booleans
+
+    The distinct Y coordinates of the vertices cut the plane into
+    horizontal slabs. No vertex lies strictly inside a slab, so the
+    edges crossing a slab can be kept sorted from left to right
+    together with the running sum of their winding directions. A
+    query finds its slab and its place among the slab's edges with
+    two binary searches, O(log n) instead of the O(n) of
+    Polygon.__contains__.
+
+    Results are the same as Polygon.__contains__ for polygons whose
+    edges do not cross each other. Changes to the polygon made
+    after preparation are not seen.
+
+    Preparation costs O(n log n) time and memory proportional to
+    the number of (slab, edge) pairs, which is O(n) for most shapes
+    and O(n**2) in the worst case. See buildTime and memory.
+    '''
+
+    def __init__(self, polygon):
+        '''
+        :polygon: Polygon or iterable of point equivalents
+        '''
+        start = time.perf_counter()
+
+        try:
+            xy = polygon.xy
+        except AttributeError:
+            points = [Point._convert(v) for v in polygon]
+            xy = [(p.x, p.y) for p in points]
+
+        ys = sorted(set(y for x, y in xy))
+
+        # vertices and horizontal edges, keyed by their Y coordinate
+        rows = {y: ([], []) for y in ys}
+
+        slabs = [[] for _ in ys[1:]]
+
+        for (ax, ay), (bx, by) in zip(xy, xy[1:] + xy[:1]):
+            rows[ay][0].append(ax)
+            if ay == by:
+                rows[ay][1].append((min(ax, bx), max(ax, bx)))
+                continue
+            # store edges from bottom to top with direction +1 for
+            # edges which go up and -1 for edges which go down.
+            if ay < by:
+                edge = (ax, ay, bx, by, 1)
+            else:
+                edge = (bx, by, ax, ay, -1)
+            first = bisect.bisect_left(ys, edge[1])
+            last = bisect.bisect_left(ys, edge[3])
+            for k in range(first, last):
+                slabs[k].append(edge)
+
+        index = []
+        for k, edges in enumerate(slabs):
+            ym = (ys[k] + ys[k + 1]) / 2
+            edges.sort(key=lambda e: e[0] + ((e[2] - e[0]) *
+                                             (ym - e[1]) / (e[3] - e[1])))
+            suffix = [0] * (len(edges) + 1)
+            for i in range(len(edges) - 1, -1, -1):
+                suffix[i] = suffix[i + 1] + edges[i][4]
+            index.append((edges, suffix))
+
+        self._ys = ys
+        self._rows = rows
+        self._slabs = index
+        self._arrays = None
+
+        self.buildTime = time.perf_counter() - start
+
+    @property
+    def slabEntries(self):
+        '''
+        Total number of edges stored across all slabs, integer.
+        '''
+        return sum(len(edges) for edges, suffix in self._slabs)
+
+    @property
+    def memory(self):
+        '''
+        Approximate size of the index in bytes, integer. Does not
+        include the arrays built on the first call to containsPoints.
+        '''
+        size = sys.getsizeof
+        total = size(self._ys) + size(self._rows) + size(self._slabs)
+        seen = set()
+        for edges, suffix in self._slabs:
+            total += size(edges) + size(suffix)
+            for edge in edges:
+                if id(edge) not in seen:
+                    seen.add(id(edge))
+                    total += size(edge)
+        for xs, spans in self._rows.values():
+            total += size(xs) + size(spans)
+        return total
+
+    def _onRow(self, px, py):
+        '''
+        :px: float
+        :py: float
+        :return: boolean
+
+        Implementation private method, True if the point is a vertex
+        or lies on a horizontal edge.
+        '''
+        try:
+            xs, spans = self._rows[py]
+        except KeyError:
+            return False
+
+        if px in xs:
+            return True
+
+        return any(x0 <= px <= x1 for x0, x1 in spans)
+
+    def contains(self, point):
+        '''
+        :point: Point or point equivalent
+        :return: boolean
+
+        True iff point is on the perimeter or enclosed by the polygon,
+        see Polygon.__contains__.
+        '''
+        p = Point._convert(point)
+        px, py = p.x, p.y
+
+        if self._onRow(px, py):
+            return True
+
+        k = bisect.bisect_right(self._ys, py) - 1
+        if k < 0 or k >= len(self._slabs):
+            return False
+
+        edges, suffix = self._slabs[k]
+
+        # first edge with the point strictly to its left
+        lo, hi = 0, len(edges)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            ax, ay, bx, by, d = edges[mid]
+            if ((bx - ax) * (py - ay)) - ((px - ax) * (by - ay)) > 0:
+                hi = mid
+            else:
+                lo = mid + 1
+
+        if lo > 0:
+            ax, ay, bx, by, d = edges[lo - 1]
+            if ((bx - ax) * (py - ay)) - ((px - ax) * (by - ay)) == 0:
+                return True
+
+        return suffix[lo] != 0
+
+    __contains__ = contains
+
+    def _buildArrays(self):
+        '''
+        Implementation private method, flattens the slabs into numpy
+        arrays for containsPoints.
+        '''
+        import numpy
+
+        edges = [e for slab, suffix in self._slabs for e in slab]
+        offsets = numpy.cumsum([0] + [len(s) for s, _ in self._slabs])
+        e = numpy.array(edges, dtype=float).reshape(-1, 5)
+
+        # prefix sums of directions, the winding number for a query
+        # at position i of slab k is prefix[end of k] - prefix[i].
+        prefix = numpy.concatenate([[0], numpy.cumsum(e[:, 4])])
+
+        self._arrays = (numpy.array(self._ys), offsets,
+                        e[:, 0], e[:, 1], e[:, 2], e[:, 3], prefix)
+
+    def containsPoints(self, points):
+        '''
+        :points: PointArray, N x 2 or N x 3 ndarray or iterable of points
+        :return: numpy.ndarray of booleans
+
+        Classifies every point at once, the result is the same as
+        [self.contains(p) for p in points].
+        '''
+        import numpy
+        from .pointarray import PointArray
+
+        if self._arrays is None:
+            self._buildArrays()
+
+        ys, offsets, ax, ay, bx, by, prefix = self._arrays
+
+        if isinstance(points, PointArray):
+            xyz = points.xyz
+        elif isinstance(points, numpy.ndarray):
+            xyz = points
+        else:
+            xyz = PointArray(points).xyz
+
+        px = xyz[:, 0]
+        py = xyz[:, 1]
+
+        result = numpy.zeros(len(px), dtype=bool)
+
+        k = numpy.searchsorted(ys, py, side='right') - 1
+        inside = (k >= 0) & (k < len(self._slabs))
+        which = numpy.flatnonzero(inside)
+        k, qx, qy = k[which], px[which], py[which]
+
+        lo = offsets[k]
+        hi = offsets[k + 1]
+        first = lo.copy()
+        end = hi.copy()
+
+        active = numpy.flatnonzero(lo < hi)
+        while len(active):
+            mid = (lo[active] + hi[active]) // 2
+            x, y = qx[active], qy[active]
+            left = (((bx[mid] - ax[mid]) * (y - ay[mid])) -
+                    ((x - ax[mid]) * (by[mid] - ay[mid]))) > 0
+            hi[active] = numpy.where(left, mid, hi[active])
+            lo[active] = numpy.where(left, lo[active], mid + 1)
+            active = active[lo[active] < hi[active]]
+
+        winding = prefix[end] - prefix[lo]
+
+        prev = numpy.maximum(lo - 1, 0)
+        cross = (((bx[prev] - ax[prev]) * (qy - ay[prev])) -
+                 ((qx - ax[prev]) * (by[prev] - ay[prev])))
+        boundary = (lo > first) & (cross == 0)
+
+        result[which] = (winding != 0) | boundary
+
+        # vertices and horizontal edges lie on slab boundaries
+        for i in numpy.flatnonzero(numpy.isin(py, ys)):
+            if self._onRow(px[i], py[i]):
+                result[i] = True
+
+        return result
+
+
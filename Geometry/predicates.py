@@ -0,0 +1,258 @@
+'''robust geometric predicates
+
+Adaptive precision orientation and in-circle tests in the style of
+Jonathan Shewchuk's "Adaptive Precision Floating-Point Arithmetic and
+Fast Robust Geometric Predicates".
+
+Each predicate is first evaluated with ordinary float arithmetic.
+If the magnitude of the result exceeds a bound on the rounding error
+of that evaluation, its sign is correct and it is returned at once.
+Otherwise the predicate is re-evaluated exactly, using integers
+scaled from the float coordinates, which is slow but rarely needed.
+
+The number of calls to each predicate and the number of those which
+needed the exact evaluation are kept in predicateCounts, keyed by
+predicate name, e.g. 'orient2d' and 'orient2d.exact'.
+'''
+
+import collections
+import math
+
+
+# Shewchuk's epsilon is half of an ulp of 1.0
+_Epsilon = 2.0 ** -53
+
+_ccwErrorBound = (3.0 + 16.0 * _Epsilon) * _Epsilon
+_o3dErrorBound = (7.0 + 56.0 * _Epsilon) * _Epsilon
+_iccErrorBound = (10.0 + 96.0 * _Epsilon) * _Epsilon
+
+_Smallest = math.ldexp(1.0, -1074)
+
+predicateCounts = collections.Counter()
+
+
+def resetPredicateCounts():
+    '''
+    Sets all predicate counters to zero.
+    '''
+    predicateCounts.clear()
+
+
+def _xyz(point):
+    '''
+    :point: Point or sequence of two or three numbers
+    :return: list of three floats
+    '''
+    try:
+        return point.xyz
+    except AttributeError:
+        pass
+    values = [float(v) for v in point]
+    return values + [0.0] * (3 - len(values))
+
+
+def _integers(values):
+    '''
+    :values: iterable of floats
+    :return: tuple of (list of integers, integer exponent)
+
+    Scales every float by the same power of two so that all of them
+    become integers, returns the integers and the power of two.
+    '''
+    ratios = [float(v).as_integer_ratio() for v in values]
+    shift = max(d.bit_length() - 1 for n, d in ratios)
+    return [n << (shift - (d.bit_length() - 1)) for n, d in ratios], shift
+
+
+def _result(det, shift, degree):
+    '''
+    :det:    integer exact determinant of coordinates scaled by 2**shift
+    :shift:  integer
+    :degree: integer degree of the determinant polynomial
+    :return: float
+
+    Returns the float nearest det, never rounding a non-zero
+    determinant to zero so that the sign is always preserved.
+    '''
+    value = det / (1 << (shift * degree))
+    if value == 0 and det != 0:
+        return math.copysign(_Smallest, det)
+    return value
+
+
+def orient2d(a, b, c):
+    '''
+    :a: Point or point equivalent
+    :b: Point or point equivalent
+    :c: Point or point equivalent
+    :return: float
+
+    Robust version of a.ccw(b, c) in the XY plane.
+
+    > 0 : a, b, c are in counter-clockwise order
+      0 : a, b, c are collinear
+    < 0 : a, b, c are in clockwise order
+
+    The sign of the result is always exact.
+    '''
+    ax, ay = _xyz(a)[:2]
+    bx, by = _xyz(b)[:2]
+    cx, cy = _xyz(c)[:2]
+
+    predicateCounts['orient2d'] += 1
+
+    detleft = (ax - cx) * (by - cy)
+    detright = (ay - cy) * (bx - cx)
+    det = detleft - detright
+
+    if detleft > 0:
+        if detright <= 0:
+            return det
+        detsum = detleft + detright
+    elif detleft < 0:
+        if detright >= 0:
+            return det
+        detsum = -detleft - detright
+    else:
+        return det
+
+    errbound = _ccwErrorBound * detsum
+    if (det >= errbound) or (-det >= errbound):
+        return det
+
+    predicateCounts['orient2d.exact'] += 1
+
+    (ax, ay, bx, by, cx, cy), shift = _integers([ax, ay, bx, by, cx, cy])
+
+    det = ((ax - cx) * (by - cy)) - ((ay - cy) * (bx - cx))
+
+    return _result(det, shift, 2)
+
+
+def orient3d(a, b, c, d):
+    '''
+    :a: Point or point equivalent
+    :b: Point or point equivalent
+    :c: Point or point equivalent
+    :d: Point or point equivalent
+    :return: float
+
+    Orientation of point d with respect to the plane through a, b
+    and c.
+
+    > 0 : d lies below the plane, where a, b, c appear in
+          counter-clockwise order when viewed from above
+      0 : a, b, c, d are coplanar
+    < 0 : d lies above the plane
+
+    The result approximates six times the signed volume of the
+    tetrahedron abcd and its sign is always exact.
+    '''
+    ax, ay, az = _xyz(a)
+    bx, by, bz = _xyz(b)
+    cx, cy, cz = _xyz(c)
+    dx, dy, dz = _xyz(d)
+
+    predicateCounts['orient3d'] += 1
+
+    adx, ady, adz = ax - dx, ay - dy, az - dz
+    bdx, bdy, bdz = bx - dx, by - dy, bz - dz
+    cdx, cdy, cdz = cx - dx, cy - dy, cz - dz
+
+    bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+    cdxady, adxcdy = cdx * ady, adx * cdy
+    adxbdy, bdxady = adx * bdy, bdx * ady
+
+    det = ((adz * (bdxcdy - cdxbdy)) +
+           (bdz * (cdxady - adxcdy)) +
+           (cdz * (adxbdy - bdxady)))
+
+    permanent = (((abs(bdxcdy) + abs(cdxbdy)) * abs(adz)) +
+                 ((abs(cdxady) + abs(adxcdy)) * abs(bdz)) +
+                 ((abs(adxbdy) + abs(bdxady)) * abs(cdz)))
+
+    errbound = _o3dErrorBound * permanent
+    if (det > errbound) or (-det > errbound) or not math.isfinite(det):
+        return det
+
+    predicateCounts['orient3d.exact'] += 1
+
+    values, shift = _integers([ax, ay, az, bx, by, bz,
+                               cx, cy, cz, dx, dy, dz])
+    ax, ay, az, bx, by, bz, cx, cy, cz, dx, dy, dz = values
+
+    adx, ady, adz = ax - dx, ay - dy, az - dz
+    bdx, bdy, bdz = bx - dx, by - dy, bz - dz
+    cdx, cdy, cdz = cx - dx, cy - dy, cz - dz
+
+    det = ((adz * ((bdx * cdy) - (cdx * bdy))) +
+           (bdz * ((cdx * ady) - (adx * cdy))) +
+           (cdz * ((adx * bdy) - (bdx * ady))))
+
+    return _result(det, shift, 3)
+
+
+def incircle(a, b, c, d):
+    '''
+    :a: Point or point equivalent
+    :b: Point or point equivalent
+    :c: Point or point equivalent
+    :d: Point or point equivalent
+    :return: float
+
+    Location of point d with respect to the circle through a, b and
+    c in the XY plane. The points a, b, c must be in counter-clockwise
+    order or the sign of the result is reversed.
+
+    > 0 : d lies inside the circle
+      0 : a, b, c, d are cocircular
+    < 0 : d lies outside the circle
+
+    The sign of the result is always exact.
+    '''
+    ax, ay = _xyz(a)[:2]
+    bx, by = _xyz(b)[:2]
+    cx, cy = _xyz(c)[:2]
+    dx, dy = _xyz(d)[:2]
+
+    predicateCounts['incircle'] += 1
+
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+
+    bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+    alift = (adx * adx) + (ady * ady)
+
+    cdxady, adxcdy = cdx * ady, adx * cdy
+    blift = (bdx * bdx) + (bdy * bdy)
+
+    adxbdy, bdxady = adx * bdy, bdx * ady
+    clift = (cdx * cdx) + (cdy * cdy)
+
+    det = ((alift * (bdxcdy - cdxbdy)) +
+           (blift * (cdxady - adxcdy)) +
+           (clift * (adxbdy - bdxady)))
+
+    permanent = (((abs(bdxcdy) + abs(cdxbdy)) * alift) +
+                 ((abs(cdxady) + abs(adxcdy)) * blift) +
+                 ((abs(adxbdy) + abs(bdxady)) * clift))
+
+    errbound = _iccErrorBound * permanent
+    if (det > errbound) or (-det > errbound) or not math.isfinite(det):
+        return det
+
+    predicateCounts['incircle.exact'] += 1
+
+    values, shift = _integers([ax, ay, bx, by, cx, cy, dx, dy])
+    ax, ay, bx, by, cx, cy, dx, dy = values
+
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+
+    det = ((((adx * adx) + (ady * ady)) * ((bdx * cdy) - (cdx * bdy))) +
+           (((bdx * bdx) + (bdy * bdy)) * ((cdx * ady) - (adx * cdy))) +
+           (((cdx * cdx) + (cdy * cdy)) * ((adx * bdy) - (bdx * ady))))
+
+    return _result(det, shift, 4)
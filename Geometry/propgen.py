@@ -22,6 +22,58 @@ import collections
 # EJO the ultimate goal is to make propgen go away
 
 
+def coerceFloat(newValue, name, default=0.0, current=None):
+    '''
+    :newValue: float, mapping, sequence, object or None
+    :name:     string - key used to look up newValue in mappings
+    :default:  float - value used when newValue is None
+    :current:  float - value returned when a mapping lacks 'name'
+    :return:   float
+
+    Converts newValue to a float using the same rules as the
+    setters generated by FloatProperty. Values which are effectively
+    zero are returned as 0.0.
+
+    Raises ValueError if newValue cannot be converted.
+    '''
+
+    def epsilon_set(v):
+        # epsilon_set: creates a float from v unless that
+        #              float is less than epsilon, which will
+        #              be considered effectively zero.
+        fv = float(v)
+        return 0.0 if nearly_zero(fv) else fv
+
+    try:
+        return epsilon_set(newValue)
+    except TypeError:
+        pass
+
+    if isinstance(newValue, collections.Mapping):
+        try:
+            return epsilon_set(newValue[name])
+        except KeyError:
+            pass
+        return current
+
+    if isinstance(newValue, collections.Iterable):
+        try:
+            return epsilon_set(newValue[0])
+        except (IndexError, TypeError):
+            pass
+
+    try:
+        mapping = vars(newValue)
+        return epsilon_set(mapping[name])
+    except (TypeError, KeyError):
+        pass
+
+    if newValue is None:
+        return epsilon_set(default)
+
+    raise ValueError(newValue)
+
+
 def FloatProperty(name, default=0.0, readonly=False, docs=None):
     '''
     :name: string - property name
@@ -43,45 +95,9 @@ def FloatProperty(name, default=0.0, readonly=False, docs=None):
         setf = None
     else:
         def setf(self, newValue):
-            def epsilon_set(v):
-                # epsilon_set: creates a float from v unless that
-                #              float is less than epsilon, which will
-                #              be considered effectively zero.
-                fv = float(v)
-                return 0.0 if nearly_zero(fv) else fv
-
-            try:
-                setattr(self, private_name, epsilon_set(newValue))
-                return
-            except TypeError:
-                pass
-
-            if isinstance(newValue, collections.Mapping):
-                try:
-                    setattr(self, private_name, epsilon_set(newValue[name]))
-                except KeyError:
-                    pass
-                return
-
-            if isinstance(newValue, collections.Iterable):
-                try:
-                    setattr(self, private_name, epsilon_set(newValue[0]))
-                    return
-                except (IndexError, TypeError):
-                    pass
-
-            try:
-                mapping = vars(newValue)
-                setattr(self, private_name, epsilon_set(mapping[name]))
-                return
-            except (TypeError, KeyError):
-                pass
-
-            if newValue is None:
-                setattr(self, private_name, epsilon_set(default))
-                return
-
-            raise ValueError(newValue)
+            current = getattr(self, private_name, default)
+            setattr(self, private_name,
+                    coerceFloat(newValue, name, default, current))
 
     return property(getf, setf, None, docs)
 
@@ -15,9 +15,11 @@ from .exceptions import *
 class Rectangle(object):
     '''
     Implements a Rectangle object in the XY plane defined by
-    an origin point and scalars length and width.
+    an origin point, scalars length and width and an angle theta.
 
-    All other properties are derived.
+    The rectangle is rotated counter-clockwise by theta degrees
+    around its origin, so the side AB runs along the direction
+    theta. All other properties are derived.
 
     Note: Origin may have a non-zero z coordinate.
     '''
@@ -71,17 +73,17 @@ class Rectangle(object):
         :param: width  - float X distance from origin.x
         :param: height - float Y distance from origin.y
         :param: origin - Point subclass
+        :param: theta  - optional float, rotation in degrees
         :return: Rectangle
         Returns a unit square anchored at the origin by default.
         '''
 
-        try:
-            self.origin = iter(origin)
-        except TypeError:
-            pass
+        if origin is not None:
+            self.origin = Point._convert(origin).xyz
 
         self.width = width
         self.height = height
+        self.theta = theta
 
     @property
     def origin(self):
@@ -142,6 +144,66 @@ class Rectangle(object):
     def height(self, newHeight):
         self._height = float(newHeight)
 
+    @property
+    def theta(self):
+        '''
+        Counter-clockwise rotation around the origin in degrees, float.
+        '''
+        try:
+            return self._theta
+        except AttributeError:
+            pass
+        self._theta = 0.0
+        return self._theta
+
+    @theta.setter
+    def theta(self, newTheta):
+        self._theta = float(newTheta)
+
+    def _axes(self):
+        '''
+        :return: tuple of floats (cos(theta), sin(theta))
+
+        Implementation private method.
+        '''
+        if not self.theta:
+            return 1.0, 0.0
+        t = math.radians(self.theta)
+        return math.cos(t), math.sin(t)
+
+    def _corner(self, u, v):
+        '''
+        :param: u - float distance along AB
+        :param: v - float distance along AD
+        :return: Point
+
+        Implementation private method.
+        '''
+        c, s = self._axes()
+        o = self.origin
+        return Point(o.x + (u * c) - (v * s), o.y + (u * s) + (v * c), o.z)
+
+    def _place(self, point, u, v):
+        '''
+        :param: point - Point or point equivalent
+        :param: u     - float distance along AB
+        :param: v     - float distance along AD
+
+        Implementation private method, moves the origin so that the
+        corner at (u, v) is at point.
+        '''
+        c, s = self._axes()
+        self.origin = point
+        self.origin.x -= (u * c) - (v * s)
+        self.origin.y -= (u * s) + (v * c)
+
+    @property
+    def vertices(self):
+        '''
+        The corners A, B, C and D, list of Points.
+        '''
+        return [self.A, self.B, self.C, self.D]
+
     @property
     def w(self):
         '''
@@ -241,47 +303,58 @@ class Rectangle(object):
     def xyz(self, newXYZ):
         self.origin.xyz = newXYZ
 
+    # The bounds of a rotated rectangle are the bounds of its
+    # corners.
+
     @property
     def minX(self):
         '''
         Minimum X coordinate boundry, float.
         '''
-        return self.origin.x
+        if not self.theta:
+            return self.origin.x
+        return min(p.x for p in self.vertices)
 
     @property
     def midX(self):
         '''
         Middle X coordinate, float.
         '''
-        return self.origin.x + (self.width / 2)
+        return self.center.x
 
     @property
     def maxX(self):
         '''
         Maximum X coordinate boundry, float.
         '''
-        return self.origin.x + self.width
+        if not self.theta:
+            return self.origin.x + self.width
+        return max(p.x for p in self.vertices)
 
     @property
     def minY(self):
         '''
         Minimum Y coordinate, float.
         '''
-        return self.origin.y
+        if not self.theta:
+            return self.origin.y
+        return min(p.y for p in self.vertices)
 
     @property
     def midY(self):
         '''
         Middle Y coordinate, float.
         '''
-        return self.origin.y + (self.height / 2)
+        return self.center.y
 
     @property
     def maxY(self):
         '''
         Maximum Y coordinate, float.
         '''
-        return self.origin.y + self.height
+        if not self.theta:
+            return self.origin.y + self.height
+        return max(p.y for p in self.vertices)
 
     # Note: The setters for the following points don't actually
     # create that point.  Instead they adjust the rectangle's
@@ -290,7 +363,7 @@ class Rectangle(object):
     @property
     def A(self):
         '''
-        Point whose coordinates are (minX,minY,origin.z), Point.
+        The origin corner, Point.
         '''
         return Point(self.origin)
 
@@ -301,102 +374,93 @@ class Rectangle(object):
     @property
     def B(self):
         '''
-        Point whose coordinates are (maxX,minY,origin.z), Point.
+        The corner width along theta from A, Point. (maxX,minY,origin.z)
+        if theta is zero.
         '''
-        return Point(self.maxX, self.minY, self.origin.z)
+        return self._corner(self.width, 0)
 
     @B.setter
     def B(self, newB):
-        self.origin = newB
-        self.origin.x -= self.width
+        self._place(newB, self.width, 0)
 
     @property
     def C(self):
         '''
-        Point whose coordinates are (maxX,maxY,origin.z), Point.
+        The corner opposite A, Point. (maxX,maxY,origin.z) if theta
+        is zero.
         '''
-        return Point(self.maxX, self.maxY, self.origin.z)
+        return self._corner(self.width, self.height)
 
     @C.setter
     def C(self, newC):
-        self.origin = newC
-        self.origin.x -= self.width
-        self.origin.y -= self.height
+        self._place(newC, self.width, self.height)
 
     @property
     def D(self):
         '''
-        Point whose coordinates are (minX,maxY,origin.Z), Point.
+        The corner height across theta from A, Point.
+        (minX,maxY,origin.z) if theta is zero.
         '''
-        return Point(self.minX, self.maxY, self.origin.z)
+        return self._corner(0, self.height)
 
     @D.setter
     def D(self, newD):
-        self.origin = newD
-        self.origin.y -= self.height
+        self._place(newD, 0, self.height)
 
     @property
     def center(self):
         '''
-        Point whose coordinates are (midX,midY,origin.z), Point.
+        The middle of the rectangle, Point.
         '''
-        return Point(self.midX, self.midY, self.origin.z)
+        return self._corner(self.width / 2, self.height / 2)
 
     @center.setter
     def center(self, newCenter):
-        self.origin = newCenter
-        self.origin.x -= (self.width / 2)
-        self.origin.y -= (self.height / 2)
+        self._place(newCenter, self.width / 2, self.height / 2)
 
     @property
     def midAB(self):
         '''
         Point inbetween A and B, Point.
         '''
-        return self.A.midpoint(B)
+        return self._corner(self.width / 2, 0)
 
     @midAB.setter
     def midAB(self, newMidAB):
-        self.origin = newMidAB
-        self.origin.x -= (self.width / 2)
+        self._place(newMidAB, self.width / 2, 0)
 
     @property
     def midBC(self):
         '''
         Point inbetween B and C, Point.
         '''
-        return self.B.midpoint(C)
+        return self._corner(self.width, self.height / 2)
 
     @midBC.setter
     def midBC(self, newMidBC):
-        self.origin = newMidBC
-        self.origin.x -= self.width
-        self.origin.y -= (self.height / 2)
+        self._place(newMidBC, self.width, self.height / 2)
 
     @property
     def midCD(self):
         '''
         Point inbetween C and D, Point.
         '''
-        return self.C.midpoint(D)
+        return self._corner(self.width / 2, self.height)
 
     @midCD.setter
     def midCD(self, newMidCD):
-        self.origin = newMidCD
-        self.origin.x -= (self.width / 2)
-        self.origin.y -= self.height
+        self._place(newMidCD, self.width / 2, self.height)
 
     @property
     def midAD(self):
         '''
         Point inbetween A and D, Point.
         '''
-        return self.A.midpoint(D)
+        return self._corner(0, self.height / 2)
 
     @midAD.setter
     def midAD(self, newMidAD):
-        self.origin = newMidAD
-        self.origin.y -= (self.height / 2)
+        self._place(newMidAD, 0, self.height / 2)
 
     @property
     def perimeter(self):
@@ -453,12 +517,15 @@ class Rectangle(object):
         '''
         return {'origin': self.origin,
                 'width': self.width,
-                'height': self.height}
+                'height': self.height,
+                'theta': self.theta}
 
     def __str__(self):
         '''
         '''
         output = 'origin={origin},width={width},height={height}'
+        if self.theta:
+            output += ',theta={theta}'
         return output.format(**self.mapping)
 
     def __repr__(self):
@@ -473,11 +540,13 @@ class Rectangle(object):
           x.origin == y.origin
           x.width  == y.width
           x.height == y.height
+          x.theta  == y.theta
         '''
         oeq = self.origin == other.origin
         weq = self.w == other.w
         heq = self.h == other.h
-        return oeq and weq and heq
+        teq = self.theta == other.theta
+        return oeq and weq and heq and teq
 
     def __contains__(self, other):
         '''
@@ -521,17 +590,35 @@ class Rectangle(object):
     def union(self, other):
         '''
         :param: other - Rectangle subclass
+        :return: Rectangle
+
+        The smallest rectangle containing both self and other, not
+        rotated.
         '''
-        # returns a rectangle composed of the bounds of self and other
-        raise NotImplemented('union')
+        minX = min(self.minX, other.minX)
+        minY = min(self.minY, other.minY)
+        return self.__class__(Point(minX, minY, self.origin.z),
+                              max(self.maxX, other.maxX) - minX,
+                              max(self.maxY, other.maxY) - minY)
 
     def intersect(self, other):
         '''
         :param: other - Rectangle subclass
-        '''
-        # returns an iterable of rectangles that compose the intersection
-        # a limit of 0 to 4 rects?
-        raise NotImplemented('intersect')
+        :return: Rectangle or None
+
+        The rectangle covered by both self and other, None if they
+        do not overlap. Rectangles which only touch give a rectangle
+        with zero width or height. Rotated rectangles are replaced
+        by their bounds.
+        '''
+        minX = max(self.minX, other.minX)
+        minY = max(self.minY, other.minY)
+        maxX = min(self.maxX, other.maxX)
+        maxY = min(self.maxY, other.maxY)
+        if minX > maxX or minY > maxY:
+            return None
+        return self.__class__(Point(minX, minY, self.origin.z),
+                              maxX - minX, maxY - minY)
 
     def containsPoint(self, point, Zorder=False):
         '''
@@ -545,9 +632,18 @@ class Rectangle(object):
         equality with the rectangle origin's Z coordinate.
 
         '''
-        if not point.isBetweenX(self.A, self.B):
+        point = Point._convert(point)
+        c, s = self._axes()
+        dx = point.x - self.origin.x
+        dy = point.y - self.origin.y
+
+        # the point in the rotated frame of the rectangle
+        u = (dx * c) + (dy * s)
+        v = (dy * c) - (dx * s)
+
+        if not min(0, self.width) <= u <= max(0, self.width):
             return False
-        if not point.isBetweenY(self.A, self.D):
+        if not min(0, self.height) <= v <= max(0, self.height):
             return False
 
         if Zorder:
@@ -555,6 +651,83 @@ class Rectangle(object):
 
         return True
 
+    def _slabs(self, ax, ay, dx, dy):
+        '''
+        :param: ax, ay - float or ndarray, start of the lines
+        :param: dx, dy - float or ndarray, direction of the lines
+        :return: list of four (p, q) pairs
+
+        Implementation private method, the Liang-Barsky terms of a
+        line A + t (B - A) in the rotated frame of the rectangle. The
+        line is inside the edge for t >= q / p when p < 0, for
+        t <= q / p when p > 0 and everywhere or nowhere as q >= 0 or
+        q < 0 when p == 0.
+        '''
+        c, s = self._axes()
+        wx = ax - self.origin.x
+        wy = ay - self.origin.y
+        u, v = (wx * c) + (wy * s), (wy * c) - (wx * s)
+        du, dv = (dx * c) + (dy * s), (dy * c) - (dx * s)
+        return [(-du, u - min(0, self.width)),
+                (du, max(0, self.width) - u),
+                (-dv, v - min(0, self.height)),
+                (dv, max(0, self.height) - v)]
+
+    def clip(self, line):
+        '''
+        :param: line - Line, Segment or Ray
+        :return: Segment or None
+
+        The part of the line inside the rectangle or on its edges in
+        the XY plane, None if the line misses the rectangle. Lines and
+        Rays are clipped to the rectangle along their whole extent.
+        End points inside the rectangle are kept exactly. A line whose
+        A and B coincide in the XY plane is clipped to the degenerate
+        Segment from A to B.
+
+        Uses the Liang-Barsky algorithm, see clipSegments for many
+        segments at once.
+        '''
+        from .line import Segment
+
+        ax, ay, bx, by, dx, dy = line._coefficients[:6]
+        t0, t1 = line._extent
+
+        for p, q in self._slabs(ax, ay, dx, dy):
+            if p == 0:
+                if q < 0:
+                    return None
+            elif p < 0:
+                t0 = max(t0, q / p)
+            else:
+                t1 = min(t1, q / p)
+
+        if dx == 0 and dy == 0:
+            # no direction to extend along, A is inside
+            return Segment(line.A, line.B)
+
+        if t0 > t1:
+            return None
+
+        a = line.A if t0 == 0 else line.pointAt(t0)
+        b = line.B if t1 == 1 else line.pointAt(t1)
+        return Segment(a, b)
+
+    def clipSegments(self, segments):
+        '''
+        :param: segments - iterable of Segments or pairs of point
+                           equivalents, or an N x 2 x 2 ndarray
+        :return: tuple of ndarrays (mask, ends)
+
+        Clips every segment at once, see Geometry.pointarray.
+        clipSegments. mask is True for the segments which are
+        visible in the rectangle and ends holds their clipped end
+        points, N x 2 x 2.
+        '''
+        from .pointarray import clipSegments
+
+        return clipSegments(segments, self)
+
     def zorder(self, other):
         '''
         :param: other - Rectangle subclass
@@ -0,0 +1,591 @@
+'''line and polygon simplification
+
+Both algorithms work in the XY plane on an N x 2 array of
+coordinates and return the sorted indices of the vertices to keep,
+so the caller decides what to build from them; see
+PointSequence.simplify and PointArray.simplify.
+
+douglasPeucker keeps every vertex needed to stay within a distance
+of the original line. It splits the line at the vertex farthest from
+the segment joining its ends until every vertex is close enough,
+using an explicit stack and measuring each range at array speed.
+
+visvalingamWhyatt removes the vertices which form the smallest
+triangles with their neighbours until every remaining triangle has
+at least the given area. Rather than taking them one at a time from
+a heap it removes them in rounds at array speed, so it can keep
+other vertices than a heap would, though about as many and with
+the same bound on their areas.
+
+The cost depends on the line as well as its length. douglasPeucker
+measures each range at array speed but splits the ranges one at a
+time in Python, so it grows with the number of vertices kept: a
+million vertex track kept to a few hundred vertices takes a few
+tenths of a second, a million vertex random walk which keeps a third
+of its vertices about fifteen seconds. visvalingamWhyatt works at
+array speed whatever the line and simplifies a million vertex track
+in about two thirds of a second.
+
+With preserveTopology, segments of the simplified line which cross
+another segment get back the most significant vertex they dropped,
+until the simplification adds no crossings. Segments replacing parts
+of the original line which already cross each other are left to
+cross. Crossings are found by binning the segments into a grid of
+cells and after the first round only the segments which changed are
+checked again. A line which crosses itself everywhere has many
+crossings to check and repair, and a million vertex random walk
+takes tens of seconds.
+'''
+
+import math
+
+import numpy
+
+from .point import Point, PointSequence
+
+
+def _xy(points):
+    '''
+    :points: PointArray, PointSequence, N x 2 or N x 3 ndarray or
+             iterable of point equivalents
+    :return: N x 2 numpy.ndarray of floats
+
+    Module private function.
+    '''
+    from .pointarray import PointArray
+
+    if isinstance(points, PointArray):
+        return points.xyz[:, :2]
+
+    if isinstance(points, numpy.ndarray):
+        return numpy.asarray(points, dtype=float)[:, :2]
+
+    if isinstance(points, PointSequence):
+        points = points.vertices
+
+    points = [Point._convert(p) for p in points]
+    return numpy.array([(p.x, p.y) for p in points],
+                       dtype=float).reshape(-1, 2)
+
+
+def _distances(xy, a, b, indices):
+    '''
+    :xy: N x 2 numpy.ndarray
+    :a: integer or numpy.ndarray, index of the start of the segment
+    :b: integer or numpy.ndarray, index of the end of the segment
+    :indices: numpy.ndarray of integer vertex indices
+    :return: numpy.ndarray, squared distance of each vertex from the
+             segment from a to b
+    '''
+    return _segmentDistances(xy[indices, 0], xy[indices, 1],
+                             xy[a, 0], xy[a, 1], xy[b, 0], xy[b, 1])
+
+
+def _segmentDistances(px, py, ax, ay, bx, by):
+    '''
+    :px: numpy.ndarray of X coordinates
+    :py: numpy.ndarray of Y coordinates
+    :ax: float or numpy.ndarray
+    :ay: float or numpy.ndarray
+    :bx: float or numpy.ndarray
+    :by: float or numpy.ndarray
+    :return: numpy.ndarray, squared distance of each point from the
+             segment from a to b
+    '''
+    vx = px - ax
+    vy = py - ay
+    dx = bx - ax
+    dy = by - ay
+    length = (dx * dx) + (dy * dy)
+    # a zero length segment leaves t at zero, the distance from a
+    t = (vx * dx) + (vy * dy)
+    numpy.divide(t, length, out=t, where=length > 0)
+    numpy.clip(t, 0, 1, out=t)
+    vx -= t * dx
+    vy -= t * dy
+    return (vx * vx) + (vy * vy)
+
+
+def _segments(keep, closed):
+    '''
+    :keep: sorted numpy.ndarray of integer vertex indices
+    :closed: boolean
+    :return: tuple of numpy.ndarrays (a, b), the indices of the
+             consecutive vertices starting and ending each segment
+    '''
+    if closed and len(keep) > 2:
+        return keep, numpy.roll(keep, -1)
+    return keep[:-1], keep[1:]
+
+
+def _cross(ax, ay, bx, by, cx, cy):
+    '''
+    :return: numpy.ndarray, positive where a, b, c turn
+             counter-clockwise
+    '''
+    return ((bx - ax) * (cy - ay)) - ((by - ay) * (cx - ax))
+
+
+def _meet(ax, ay, bx, by, cx, cy, dx, dy):
+    '''
+    :return: numpy.ndarray of booleans, True where the segments a b
+             and c d share a point
+    '''
+    d1 = _cross(cx, cy, dx, dy, ax, ay)
+    d2 = _cross(cx, cy, dx, dy, bx, by)
+    d3 = _cross(ax, ay, bx, by, cx, cy)
+    d4 = _cross(ax, ay, bx, by, dx, dy)
+
+    def within(px, py, sx, sy, tx, ty):
+        return ((numpy.minimum(sx, tx) <= px) &
+                (px <= numpy.maximum(sx, tx)) &
+                (numpy.minimum(sy, ty) <= py) &
+                (py <= numpy.maximum(sy, ty)))
+
+    return ((((d1 > 0) & (d2 < 0)) | ((d1 < 0) & (d2 > 0))) &
+            (((d3 > 0) & (d4 < 0)) | ((d3 < 0) & (d4 > 0))) |
+            ((d1 == 0) & within(ax, ay, cx, cy, dx, dy)) |
+            ((d2 == 0) & within(bx, by, cx, cy, dx, dy)) |
+            ((d3 == 0) & within(cx, cy, ax, ay, bx, by)) |
+            ((d4 == 0) & within(dx, dy, ax, ay, bx, by)))
+
+
+def _overlapping(x0, y0, x1, y1, among=None, chunk=1 << 20):
+    '''
+    :x0: numpy.ndarray, smallest X coordinate of each box
+    :y0: numpy.ndarray, smallest Y coordinate of each box
+    :x1: numpy.ndarray, largest X coordinate of each box
+    :y1: numpy.ndarray, largest Y coordinate of each box
+    :among: optional numpy.ndarray of booleans, only pairs with at
+            least one of these boxes are wanted
+    :chunk: optional integer, about the number of pairs compared at
+            once
+    :return: iterator of tuples of numpy.ndarrays (i, j), the pairs of
+             boxes i < j which overlap
+
+    Boxes are binned into a grid of square cells about the size of
+    a typical box, so only boxes sharing a cell are compared. Each
+    pair is kept in the one cell holding the lower left corner of
+    their overlap. Pairs come in blocks so that memory stays near
+    chunk pairs when many boxes crowd into the same cells.
+    '''
+    count = len(x0)
+    if count < 2:
+        return
+
+    left, bottom = x0.min(), y0.min()
+    extent = max(x1.max() - left, y1.max() - bottom)
+    size = max(float(numpy.mean(numpy.maximum(x1 - x0, y1 - y0))),
+               extent * 2.0 ** -30)
+    if not size > 0:
+        size = 1.0
+
+    # large boxes cover many cells, grow the cells until the boxes
+    # cover a few each on average
+    while True:
+        gx0 = ((x0 - left) / size).astype(numpy.intp)
+        gy0 = ((y0 - bottom) / size).astype(numpy.intp)
+        nx = ((x1 - left) / size).astype(numpy.intp) - gx0 + 1
+        ny = ((y1 - bottom) / size).astype(numpy.intp) - gy0 + 1
+        cover = nx * ny
+        if cover.sum() <= 8 * count:
+            break
+        size *= 2
+
+    # one entry for each cell a box covers
+    box = numpy.repeat(numpy.arange(count), cover)
+    offset = numpy.arange(len(box)) - numpy.repeat(
+        numpy.cumsum(cover) - cover, cover)
+    gx = gx0[box] + (offset % nx[box])
+    gy = gy0[box] + (offset // nx[box])
+    cell = (gx * (gy.max() + 1)) + gy
+
+    order = numpy.argsort(cell)
+    cell, box, gx, gy = cell[order], box[order], gx[order], gy[order]
+    starts = numpy.flatnonzero(numpy.diff(cell, prepend=-1))
+    sizes = numpy.diff(starts, append=len(cell))
+
+    if among is not None:
+        # only the cells holding one of the wanted boxes
+        wanted = numpy.repeat(numpy.logical_or.reduceat(among[box], starts),
+                              sizes)
+        cell, box, gx, gy = cell[wanted], box[wanted], gx[wanted], gy[wanted]
+        if not len(cell):
+            return
+        starts = numpy.flatnonzero(numpy.diff(cell, prepend=-1))
+        sizes = numpy.diff(starts, append=len(cell))
+
+    # each entry pairs with the entries after it in the same cell
+    later = numpy.repeat(starts + sizes, sizes) - numpy.arange(len(cell)) - 1
+    total = numpy.cumsum(later)
+
+    bounds = numpy.searchsorted(total, numpy.arange(chunk, total[-1], chunk))
+    bounds = numpy.unique(numpy.concatenate([[0], bounds, [len(cell)]]))
+    for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+        pairs = later[lo:hi]
+        first = numpy.repeat(numpy.arange(lo, hi), pairs)
+        second = first + 1 + numpy.arange(len(first)) - numpy.repeat(
+            numpy.cumsum(pairs) - pairs, pairs)
+
+        i, j = box[first], box[second]
+        ox = numpy.maximum(x0[i], x0[j])
+        oy = numpy.maximum(y0[i], y0[j])
+        home = ((ox <= numpy.minimum(x1[i], x1[j])) &
+                (oy <= numpy.minimum(y1[i], y1[j])) &
+                (((ox - left) / size).astype(numpy.intp) == gx[first]) &
+                (((oy - bottom) / size).astype(numpy.intp) == gy[first]))
+        if among is not None:
+            home &= among[i] | among[j]
+        i, j = i[home], j[home]
+        yield numpy.minimum(i, j), numpy.maximum(i, j)
+
+
+def _crossings(xy, a, b, among=None):
+    '''
+    :xy: N x 2 numpy.ndarray
+    :a: numpy.ndarray of integer vertex indices starting each segment
+    :b: numpy.ndarray of integer vertex indices ending each segment
+    :among: optional numpy.ndarray of booleans, only pairs with at
+            least one of these segments are wanted
+    :return: tuple of numpy.ndarrays (i, j), every pair of segments
+             i < j which meet and do not share a vertex
+    '''
+    ax, ay, bx, by = xy[a, 0], xy[a, 1], xy[b, 0], xy[b, 1]
+
+    found = [(numpy.zeros(0, dtype=numpy.intp),) * 2]
+    for i, j in _overlapping(numpy.minimum(ax, bx), numpy.minimum(ay, by),
+                             numpy.maximum(ax, bx), numpy.maximum(ay, by),
+                             among):
+        apart = ((a[i] != a[j]) & (a[i] != b[j]) &
+                 (b[i] != a[j]) & (b[i] != b[j]))
+        i, j = i[apart], j[apart]
+        meet = _meet(ax[i], ay[i], bx[i], by[i],
+                     ax[j], ay[j], bx[j], by[j])
+        found.append((i[meet], j[meet]))
+
+    i, j = zip(*found)
+    return numpy.concatenate(i), numpy.concatenate(j)
+
+
+def crossingSegments(xy, keep, closed=False):
+    '''
+    :xy: N x 2 numpy.ndarray or list of (x, y) tuples
+    :keep: sorted list of integer vertex indices
+    :closed: optional boolean, True if the line is a ring
+    :return: set of (integer, integer) segments
+
+    The segments of the line through the kept vertices which meet a
+    segment other than their neighbours.
+    '''
+    a, b = _segments(numpy.asarray(keep, dtype=numpy.intp), closed)
+    i, j = _crossings(numpy.asarray(xy, dtype=float), a, b)
+    crossing = numpy.union1d(i, j)
+    return set(zip(a[crossing].tolist(), b[crossing].tolist()))
+
+
+def _repair(xy, keep, closed, weight):
+    '''
+    :xy: N x 2 numpy.ndarray
+    :keep: numpy.ndarray of booleans, updated in place
+    :closed: boolean
+    :weight: function of (a, b, indices) returning the importance of
+             each dropped vertex in indices, which lies between kept
+             vertices a and b
+
+    Module private function, gives crossing segments back their most
+    important dropped vertex until the simplification adds no
+    crossings. Two segments whose stretches of the original line
+    already cross may go on crossing.
+    '''
+    n = len(xy)
+    edges = numpy.arange(n if closed else n - 1)
+    first, second = _crossings(xy, edges, (edges + 1) % n)
+    first, second = edges[first], edges[second]
+
+    # only segments changed by the last round can cross anew
+    added = None
+    while True:
+        kept = numpy.flatnonzero(keep)
+        a, b = _segments(kept, closed)
+        among = None if added is None else added[a] | added[b]
+        i, j = _crossings(xy, a, b, among)
+
+        if len(i) and len(first):
+            # the segments replacing each crossing pair of edges, the
+            # edges before the first kept vertex are on the last
+            # segment of a ring
+            segment = (numpy.cumsum(keep) - 1) % len(a)
+            s, t = segment[first], segment[second]
+            if among is not None:
+                near = among[s] | among[t]
+                s, t = s[near], t[near]
+            inherited = (numpy.minimum(s, t) * len(a)) + numpy.maximum(s, t)
+            new = ~numpy.isin((i * len(a)) + j, inherited)
+            i, j = i[new], j[new]
+
+        # the vertices each crossing segment dropped
+        k = numpy.union1d(i, j)
+        counts = (b[k] - a[k] - 1) % n
+        owner = numpy.repeat(k, counts)
+        dropped = (numpy.repeat(a[k] + 1, counts) + numpy.arange(
+            len(owner)) - numpy.repeat(numpy.cumsum(counts) - counts,
+                                       counts)) % n
+        if not len(dropped):
+            return
+
+        # the most important of them, the first of any ties
+        order = numpy.lexsort((-weight(a[owner], b[owner], dropped), owner))
+        firsts = numpy.flatnonzero(numpy.diff(owner[order], prepend=-1))
+        added = numpy.zeros(n, dtype=bool)
+        added[dropped[order[firsts]]] = True
+        keep |= added
+
+
+def douglasPeucker(points, tolerance, closed=False, preserveTopology=False):
+    '''
+    :points: PointArray, PointSequence, N x 2 or N x 3 ndarray or
+             iterable of point equivalents
+    :tolerance: float, largest distance a dropped vertex may be from
+                the simplified line
+    :closed: optional boolean, True if the points are a ring
+    :preserveTopology: optional boolean, True to keep segments of the
+                       simplified line from crossing
+    :return: numpy.ndarray of the sorted indices of the kept vertices
+
+    Douglas-Peucker simplification in the XY plane. Open lines keep
+    their end points, rings keep at least three vertices.
+    '''
+    xy = _xy(points)
+    n = len(xy)
+    if n < 3:
+        return numpy.arange(n)
+
+    keep = numpy.zeros(n + 1, dtype=bool)
+    limit = tolerance * tolerance
+
+    # rings repeat their first vertex at the end so that no range
+    # wraps around
+    X = numpy.append(xy[:, 0], xy[0, 0])
+    Y = numpy.append(xy[:, 1], xy[0, 1])
+
+    if closed:
+        # split the ring at the vertex farthest from the first one
+        far = int(numpy.argmax(_segmentDistances(X[:n], Y[:n], X[0], Y[0],
+                                                 X[0], Y[0])))
+        keep[0] = keep[far] = True
+        stack = [(0, far), (far, n)]
+    else:
+        keep[0] = keep[n - 1] = True
+        stack = [(0, n - 1)]
+
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        d = _segmentDistances(X[a + 1:b], Y[a + 1:b], X[a], Y[a], X[b], Y[b])
+        i = int(numpy.argmax(d))
+        if d[i] > limit:
+            m = a + 1 + i
+            keep[m] = True
+            stack.append((a, m))
+            stack.append((m, b))
+
+    keep = keep[:n]
+
+    # rings keep a triangle, even when all their vertices coincide
+    while closed and keep.sum() < 3:
+        kept = numpy.flatnonzero(keep)
+        others = numpy.flatnonzero(~keep)
+        keep[others[numpy.argmax(_distances(xy, kept[0], kept[-1],
+                                            others))]] = True
+
+    if preserveTopology:
+        _repair(xy, keep, closed,
+                lambda a, b, indices: _distances(xy, a, b, indices))
+
+    return numpy.flatnonzero(keep)
+
+
+def _triangleAreas(X, Y, u, j, w):
+    '''
+    :X: numpy.ndarray of X coordinates
+    :Y: numpy.ndarray of Y coordinates
+    :u: numpy.ndarray of integer vertex indices
+    :j: numpy.ndarray of integer vertex indices
+    :w: numpy.ndarray of integer vertex indices
+    :return: numpy.ndarray, area of each triangle u j w
+    '''
+    ax, ay = X[u], Y[u]
+    return numpy.abs(((X[j] - ax) * (Y[w] - ay)) -
+                     ((X[w] - ax) * (Y[j] - ay))) / 2
+
+
+def _minima(key, index, joined):
+    '''
+    :key: numpy.ndarray of floats
+    :index: numpy.ndarray of integers breaking ties in key
+    :joined: numpy.ndarray of booleans, True where an entry is next
+             to the one after it
+    :return: numpy.ndarray of booleans
+
+    Module private function, the entries smaller than the entries
+    next to them, which a heap can take without taking a neighbour
+    first. Of a run of equal entries the heap takes the one with the
+    smallest index, and the others as their neighbours go, so every
+    other entry of the run is taken starting from that end, unless a
+    smaller entry is next to it.
+    '''
+    m = len(key)
+    k0, k1, i0, i1 = key[:-1], key[1:], index[:-1], index[1:]
+    equal = joined & (k0 == k1)
+    leftTie = numpy.append(False, equal & (i0 < i1))
+    rightTie = numpy.append(equal & (i1 < i0), False)
+    leftLess = numpy.append(False, joined & (k0 < k1))
+    rightLess = numpy.append(joined & (k1 < k0), False)
+
+    # the distance to the end of each run, one further when a smaller
+    # entry is next to that end, is even on both sides
+    positions = numpy.arange(m)
+    lows = numpy.maximum.accumulate(numpy.where(leftTie, 0, positions))
+    highs = numpy.minimum.accumulate(numpy.where(rightTie, m,
+                                                 positions)[::-1])[::-1]
+    left = positions - lows + leftLess[lows]
+    right = highs - positions + rightLess[highs]
+    return ((left | right) & 1) == 0
+
+
+def visvalingamWhyatt(points, tolerance, closed=False,
+                      preserveTopology=False):
+    '''
+    :points: PointArray, PointSequence, N x 2 or N x 3 ndarray or
+             iterable of point equivalents
+    :tolerance: float, smallest area of the triangle a kept vertex
+                forms with its neighbours
+    :closed: optional boolean, True if the points are a ring
+    :preserveTopology: optional boolean, True to keep segments of the
+                       simplified line from crossing
+    :return: numpy.ndarray of the sorted indices of the kept vertices
+
+    Visvalingam-Whyatt simplification in the XY plane. The area of
+    a vertex never drops below the area of a neighbour removed before
+    it. Open lines keep their end points, rings keep at least three
+    vertices.
+
+    Vertices are removed in rounds rather than one at a time from a
+    heap. Each round takes the smallest quarter of the areas under
+    the tolerance, removes those smaller than both their neighbours,
+    see _minima, and measures the areas next to them again. Where a
+    heap would first remove a neighbour whose area shrank, the result
+    differs from the heap's; the area of every vertex kept still
+    reaches the tolerance.
+    '''
+    xy = _xy(points)
+    n = len(xy)
+    if n < 3:
+        return numpy.arange(n)
+
+    X = numpy.ascontiguousarray(xy[:, 0])
+    Y = numpy.ascontiguousarray(xy[:, 1])
+    minimum = 3 if closed else 2
+
+    # the remaining vertices in order and their areas
+    index = numpy.arange(n)
+    if closed:
+        area = _triangleAreas(X, Y, numpy.roll(index, 1), index,
+                              numpy.roll(index, -1))
+    else:
+        area = numpy.full(n, math.inf)
+        area[1:-1] = _triangleAreas(X, Y, index[:-2], index[1:-1],
+                                    index[2:])
+
+    keep = numpy.ones(n, dtype=bool)
+    effective = numpy.full(n, math.inf)
+
+    while len(index) > minimum:
+        rows = numpy.flatnonzero(area < tolerance)
+        if not len(rows):
+            break
+
+        # the smallest quarter, so that vertices go in about the order
+        # a heap removes them
+        small = area[rows]
+        quarter = len(small) // 4
+        rows = rows[small <= numpy.partition(small, quarter)[quarter]]
+
+        m = len(index)
+        if closed and len(rows) == m:
+            # the whole ring, starting from its smallest area and back
+            rows = numpy.roll(rows, -numpy.lexsort((index, area))[0])
+            rows = numpy.append(rows, rows[0])
+        elif closed and rows[0] == 0 and rows[-1] == m - 1:
+            # no run of rows wraps around the end
+            gap = numpy.flatnonzero(numpy.diff(rows) != 1)[0]
+            rows = numpy.roll(rows, -(gap + 1))
+
+        joined = (numpy.diff(rows) % m) == 1
+        taken = _minima(area[rows], index[rows], joined)
+        taken = rows[:m][taken[:m]]
+
+        spare = m - minimum
+        if len(taken) > spare:
+            # as many as may go, smallest first
+            taken = taken[numpy.lexsort((index[taken],
+                                         area[taken]))[:spare]]
+        taken.sort()
+
+        removed = area[taken]
+        keep[index[taken]] = False
+        effective[index[taken]] = removed
+
+        remaining = numpy.ones(m, dtype=bool)
+        remaining[taken] = False
+        index, area = index[remaining], area[remaining]
+
+        # the neighbours of the removed vertices get the larger of
+        # their new area and the areas removed next to them, a vertex
+        # between two removed ones is next to both
+        before = (taken - 1) % m
+        before -= numpy.searchsorted(taken, before)
+        after = (taken + 1) % m
+        after -= numpy.searchsorted(taken, after)
+        m = len(index)
+        for rows in (before, after):
+            rows = rows[area[rows] < math.inf]
+            area[rows] = _triangleAreas(X, Y, index[(rows - 1) % m],
+                                        index[rows], index[(rows + 1) % m])
+        for rows in (before, after):
+            finite = area[rows] < math.inf
+            area[rows[finite]] = numpy.maximum(area[rows[finite]],
+                                               removed[finite])
+
+    if preserveTopology:
+        _repair(xy, keep, closed, lambda a, b, indices: effective[indices])
+
+    return numpy.flatnonzero(keep)
+
+
+_Methods = {'douglas-peucker': douglasPeucker,
+            'visvalingam-whyatt': visvalingamWhyatt}
+
+
+def simplify(points, tolerance, method='douglas-peucker', closed=False,
+             preserveTopology=False):
+    '''
+    :points: PointArray, PointSequence, N x 2 or N x 3 ndarray or
+             iterable of point equivalents
+    :tolerance: float, a distance for Douglas-Peucker and an area for
+                Visvalingam-Whyatt
+    :method: optional string, 'douglas-peucker' or
+             'visvalingam-whyatt'
+    :closed: optional boolean, True if the points are a ring
+    :preserveTopology: optional boolean
+    :return: numpy.ndarray of the sorted indices of the kept vertices
+
+    Raises ValueError for an unknown method.
+    '''
+    try:
+        func = _Methods[method]
+    except KeyError:
+        raise ValueError('unknown simplification method {!r}'.format(
+            method)) from None
+    return func(points, tolerance, closed, preserveTopology)
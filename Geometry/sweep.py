@@ -0,0 +1,446 @@
+'''all intersections among many segments
+
+segmentIntersections finds every pair of segments which meet with
+the Bentley-Ottmann sweep in O((n + k) log n) time for n segments
+and k pairs, instead of testing all n * n pairs.
+
+A vertical line sweeps from left to right and stops at events, the
+end points of the segments and the points where two segments cross.
+The segments crossed by the sweep line are kept sorted from bottom
+to top in a list split into blocks, so that segments enter and leave
+it in O(log n) time plus the size of a block. Segments can only cross
+after they have been next to each other in that order, so at each
+event only the segments which have become neighbours are tested and
+their crossing, if it is further along the sweep, becomes a new
+event.
+
+Events are ordered by X and then Y coordinate, as if the sweep line
+were turned slightly clockwise, so vertical segments need no special
+cases. At each event p the segments starting at p, ending at p and
+passing through p are handled together, following de Berg et al.
+"Computational Geometry: Algorithms and Applications", chapter 2,
+which takes care of many segments meeting at one point.
+'''
+
+import heapq
+import itertools
+import math
+
+from .point import Point
+
+
+def _endpoints(segments):
+    '''
+    :segments: iterable of Segments, pairs of point equivalents or an
+               N x 2 x 2 (or N x 2 x 3) numpy.ndarray
+    :return: list of ((x, y), (x, y)) tuples, left end point first
+
+    Module private function.
+    '''
+    if hasattr(segments, 'tolist'):
+        import numpy
+        xy = numpy.asarray(segments, dtype=float)
+        rows = xy.reshape(len(xy), 2, -1)[:, :, :2].tolist()
+    else:
+        rows = []
+        for segment in segments:
+            try:
+                a, b = segment.A, segment.B
+            except AttributeError:
+                a, b = segment
+            a, b = Point._convert(a), Point._convert(b)
+            rows.append(((a.x, a.y), (b.x, b.y)))
+
+    ends = []
+    for a, b in rows:
+        a, b = tuple(a), tuple(b)
+        ends.append((a, b) if a <= b else (b, a))
+    return ends
+
+
+def _cross(a, b, c):
+    '''
+    :a: (x, y) tuple
+    :b: (x, y) tuple
+    :c: (x, y) tuple
+    :return: float, positive if a, b, c turn counter-clockwise
+    '''
+    return ((b[0] - a[0]) * (c[1] - a[1])) - ((b[1] - a[1]) * (c[0] - a[0]))
+
+
+def _meet(s, t):
+    '''
+    :s: ((x, y), (x, y)) segment
+    :t: ((x, y), (x, y)) segment
+    :return: (x, y) tuple or None
+
+    Module private function, the single point where s and t meet,
+    or None if they do not meet or are parallel. Points at the ends
+    of either segment are returned exactly.
+    '''
+    (ax, ay), (bx, by) = s
+    (cx, cy), (dx, dy) = t
+    rx, ry = bx - ax, by - ay
+    qx, qy = dx - cx, dy - cy
+
+    denominator = (rx * qy) - (ry * qx)
+    if denominator == 0:
+        return None
+
+    wx, wy = cx - ax, cy - ay
+    u = ((wx * qy) - (wy * qx)) / denominator
+    v = ((wx * ry) - (wy * rx)) / denominator
+    if not (0 <= u <= 1 and 0 <= v <= 1):
+        return None
+
+    if u == 0:
+        return s[0]
+    if u == 1:
+        return s[1]
+    if v == 0:
+        return t[0]
+    if v == 1:
+        return t[1]
+    return (ax + (u * rx), ay + (u * ry))
+
+
+# relative distance within which a segment meets a rounded crossing
+_Tolerance = 1e-10
+
+# number of entries in each block of a _Blocks list
+_Load = 1000
+
+
+def _search(lines, entries, hi, px, py, top=False):
+    '''
+    :lines: list of (ax, ay, bx, by, slope) tuples for each segment
+    :entries: list of integer segments, or of blocks if top is True
+    :hi: integer, number of entries to search
+    :px: float, X coordinate of the sweep line
+    :py: float, Y coordinate of the current event
+    :top: optional boolean, True to search blocks by their top segment
+    :return: integer, number of the first hi entries below (px, py)
+
+    Module private function.
+    '''
+    lo = 0
+    while lo < hi:
+        mid = (lo + hi) // 2
+        s = entries[mid][-1] if top else entries[mid]
+        ax, ay, bx, by, k = lines[s]
+        if px == ax:
+            y = ay if ax != bx else py
+        elif px == bx:
+            y = by
+        else:
+            y = ay + ((px - ax) * k)
+        if y < py:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+class _Blocks(object):
+    '''
+    A list kept as blocks of around _Load entries, like a SortedList,
+    so that entries are added and removed in time proportional to the
+    size of a block rather than the length of the list. Positions are
+    (block, offset) tuples and entries must be distinct.
+
+    Implementation private class.
+    '''
+
+    def __init__(self):
+        self.blocks = [[]]
+        self.block = {}
+
+    def entries(self, lo, hi):
+        '''
+        :lo: (integer, integer) position
+        :hi: (integer, integer) position, not before lo
+        :return: list of the entries from lo up to hi
+        '''
+        (i, a), (j, b) = lo, hi
+        if i == j:
+            return self.blocks[i][a:b]
+        result = self.blocks[i][a:]
+        for block in self.blocks[i + 1:j]:
+            result.extend(block)
+        result.extend(self.blocks[j][:b])
+        return result
+
+    def replace(self, lo, hi, values):
+        '''
+        :lo: (integer, integer) position
+        :hi: (integer, integer) position, not before lo
+        :values: list of entries to put in place of those from lo up
+                 to hi
+        '''
+        (i, a), (j, b) = lo, hi
+        if i == j:
+            block = self.blocks[i]
+            block[a:b] = values
+        else:
+            block = self.blocks[i][:a] + values + self.blocks[j][b:]
+            self.blocks[i:j + 1] = [block]
+            values = block
+        # entries which have left keep their stale block, remove
+        # finds them missing from it
+        where = self.block
+        for value in values:
+            where[value] = block
+        size = len(block)
+        if size > 2 * _Load or (size < _Load // 2 and len(self.blocks) > 1):
+            self._balance(i)
+
+    def remove(self, value):
+        '''
+        :value: entry to remove
+
+        Raises ValueError if value is not in the list.
+        '''
+        block = self.block.get(value, ())
+        if value not in block:
+            raise ValueError('{!r} not in list'.format(value))
+        block.remove(value)
+        for i, b in enumerate(self.blocks):
+            if b is block:
+                self._balance(i)
+                return
+
+    def _balance(self, i):
+        '''
+        :i: integer, block which has changed size
+
+        Splits block i if it has grown too large and merges it into
+        a neighbour if it has grown too small.
+        '''
+        blocks = self.blocks
+        block = blocks[i]
+        if len(block) > 2 * _Load:
+            rest = [block[k:k + _Load]
+                    for k in range(_Load, len(block), _Load)]
+            del block[_Load:]
+            blocks[i + 1:i + 1] = rest
+            for piece in rest:
+                self.block.update(dict.fromkeys(piece, piece))
+        elif len(block) < _Load // 2 and len(blocks) > 1:
+            if i + 1 == len(blocks):
+                i -= 1
+            first, second = blocks[i], blocks.pop(i + 1)
+            self.block.update(dict.fromkeys(second, first))
+            first.extend(second)
+            self._balance(i)
+
+
+class _Status(object):
+    '''
+    The segments crossed by the sweep line, sorted from bottom to
+    top, with their slopes precomputed.
+
+    Implementation private class.
+    '''
+
+    def __init__(self, ends):
+        '''
+        :ends: list of ((x, y), (x, y)) segments, left end first
+        '''
+        self.ends = ends
+        self.slopes = [(by - ay) / (bx - ax) if bx != ax else math.inf
+                       for (ax, ay), (bx, by) in ends]
+        self.items = _Blocks()
+        self.lines = [(ax, ay, bx, by, k) for ((ax, ay), (bx, by)), k
+                      in zip(ends, self.slopes)]
+
+        # distance within which a segment meets an event, relative to
+        # the extent of all the segments
+        extent = 0.0
+        if ends:
+            xs = [x for (ax, ay), (bx, by) in ends for x in (ax, bx)]
+            ys = [y for (ax, ay), (bx, by) in ends for y in (ay, by)]
+            extent = max(max(xs) - min(xs), max(ys) - min(ys))
+        self.tolerance = _Tolerance * extent
+
+    def bisect(self, px, py):
+        '''
+        :px: float, X coordinate of the sweep line
+        :py: float, Y coordinate of the current event
+        :return: (integer, integer) position in items just above the
+                 segments below (px, py)
+
+        Vertical segments are crossed at the current event, which
+        puts them neither above nor below it. The block holding the
+        position is found by the top segment of each block, then the
+        position within it.
+        '''
+        lines, blocks = self.lines, self.items.blocks
+        i = 0
+        if len(blocks) > 1:
+            i = _search(lines, blocks, len(blocks) - 1, px, py, True)
+        return i, _search(lines, blocks[i], len(blocks[i]), px, py)
+
+    def through(self, s, p, members):
+        '''
+        :s: integer segment
+        :p: (x, y) tuple, the current event
+        :members: set of integer segments known to meet at p
+        :return: boolean, True if s passes through or ends at p
+
+        Crossings are rounded, so s meets p if it passes within the
+        tolerance of p.
+        '''
+        if s in members:
+            return True
+        a, b = self.ends[s]
+        if not a[0] <= p[0] <= b[0]:
+            return False
+        size = abs(b[0] - a[0]) + abs(b[1] - a[1])
+        return abs(_cross(a, b, p)) <= self.tolerance * size
+
+    def around(self, p, members):
+        '''
+        :p: (x, y) tuple, the current event
+        :members: set of integer segments known to meet at p
+        :return: tuple of ((integer, integer), (integer, integer),
+                 set of integer segments, integer segment or None,
+                 integer segment or None)
+
+        The positions in items of the first segment through p and
+        just after the last, the segments between them and the
+        segments just below and above them.
+        '''
+        blocks, through = self.items.blocks, self.through
+        i, a = self.bisect(*p)
+
+        under, j, b = None, i, a
+        while b > 0 or j > 0:
+            if b == 0:
+                j -= 1
+                b = len(blocks[j])
+            if not through(blocks[j][b - 1], p, members):
+                under = blocks[j][b - 1]
+                break
+            b -= 1
+        lo = (j, b)
+
+        over, j, b = None, i, a
+        last, size = len(blocks) - 1, len(blocks[i])
+        while b < size or j < last:
+            if b == size:
+                j += 1
+                b, size = 0, len(blocks[j])
+            if not through(blocks[j][b], p, members):
+                over = blocks[j][b]
+                break
+            b += 1
+        hi = (j, b)
+
+        return lo, hi, set(self.items.entries(lo, hi)), under, over
+
+
+def segmentIntersections(segments, endpoints=True):
+    '''
+    :segments: iterable of Segments, pairs of point equivalents or an
+               N x 2 x 2 numpy.ndarray of end points
+    :endpoints: optional boolean, False to leave out pairs which only
+                meet where both of them end
+    :return: list of (integer, integer, Point) tuples
+
+    Every pair of segments which meet in the XY plane, as the indices
+    i < j of the two segments and the point where they meet, in the
+    order the sweep reaches them. Collinear segments which overlap
+    are reported once, at the first point they share.
+
+    Runs in O((n + k) log n) time for n segments and k pairs, plus
+    the time to move entries within a block of the sorted list of
+    crossed segments, which holds at most a couple of thousand.
+    Crossings are computed in floating point, so segments which
+    almost meet at a point shared by several of them may give pairs
+    at slightly different points.
+    '''
+    ends = _endpoints(segments)
+    status = _Status(ends)
+    slopes = status.slopes
+
+    # event point -> [segments starting, segments ending, segments
+    # found to cross there]
+    events = {}
+    for s, (a, b) in enumerate(ends):
+        events.setdefault(a, [[], [], set()])[0].append(s)
+        events.setdefault(b, [[], [], set()])[1].append(s)
+    queue = list(events)
+    heapq.heapify(queue)
+
+    found = []
+    seen = set()
+
+    def report(s, t, q):
+        if s > t:
+            s, t = t, s
+        if (s, t) in seen:
+            return
+        if not endpoints and q in ends[s] and q in ends[t]:
+            a, b = ends[s]
+            c, d = ends[t]
+            # collinear segments leaving q the same way overlap
+            if (slopes[s] != slopes[t] or (q == a) != (q == c) or
+                    a == b or c == d):
+                return
+        seen.add((s, t))
+        found.append((s, t, Point(q[0], q[1])))
+
+    def schedule(s, t, p):
+        q = _meet(ends[s], ends[t])
+        if q is None:
+            return
+        # rounding may put q just past the end of s or t, after they
+        # have left the sweep
+        q = min(q, ends[s][1], ends[t][1])
+        if q <= p:
+            # neighbours never meet behind the sweep, unless rounding
+            # put a third segment's crossing apart from p
+            report(s, t, q)
+            return
+        try:
+            event = events[q]
+        except KeyError:
+            event = events[q] = [[], [], set()]
+            heapq.heappush(queue, q)
+        event[2].update((s, t))
+
+    while queue:
+        p = heapq.heappop(queue)
+        upper, lower, crossing = events.pop(p)
+        starting = set(upper)
+        ending = set(lower)
+
+        known = ending | crossing
+        lo, hi, here, under, over = status.around(p, known)
+        strays = known - here - starting
+        if strays:
+            # rounding separated segments which meet at p, take them
+            # out and search again
+            for s in strays:
+                status.items.remove(s)
+            lo, hi, here, under, over = status.around(p, known)
+
+        members = here | starting | ending | crossing
+        if len(members) > 1:
+            for s, t in itertools.combinations(sorted(members), 2):
+                report(s, t, p)
+
+        # the segments continuing past p, in their order just after p
+        after = sorted((here | starting | crossing) - ending,
+                       key=lambda s: (slopes[s], s))
+        status.items.replace(lo, hi, after)
+
+        if after:
+            if under is not None:
+                schedule(under, after[0], p)
+            if over is not None:
+                schedule(after[-1], over, p)
+        elif under is not None and over is not None:
+            schedule(under, over, p)
+
+    return found
@@ -3,17 +3,44 @@
 '''
 
 from .test_point import PointTestCase
+from .test_pointarray import PointArrayTestCase
+from .test_pointsequence import PointSequenceTestCase
+from .test_predicates import PredicatesTestCase
+from .test_transform import TransformTestCase
+from .test_import import ImportTestCase
 from .test_ellipse import EllipseTestCase
 from .test_line import LineTestCase, SegmentTestCase, RayTestCase
+from .test_polygon import PolygonTestCase, PreparedPolygonTestCase
+from .test_hull import HullTestCase
+from .test_triangulation import TriangulationTestCase
+from .test_clipping import ClippingTestCase
+from .test_simplify import SimplifyTestCase
+from .test_packed import PackedTestCase
+from .test_calipers import CalipersTestCase
+from .test_sweep import SweepTestCase
 from .test_triangle import TriangleTestCase
 from .test_rectangle import RectangleTestCase
 from .test_graph import GraphTestCase, NodeTestCase
 
 __all__ = ['PointTestCase',
+           'PointArrayTestCase',
+           'PointSequenceTestCase',
+           'PredicatesTestCase',
+           'TransformTestCase',
+           'ImportTestCase',
            'EllipseTestCase',
            'LineTestCase',
            'SegmentTestCase',
            'RayTestCase',
+           'PolygonTestCase',
+           'PreparedPolygonTestCase',
+           'HullTestCase',
+           'TriangulationTestCase',
+           'ClippingTestCase',
+           'SimplifyTestCase',
+           'PackedTestCase',
+           'CalipersTestCase',
+           'SweepTestCase',
            'TriangleTestCase',
            'RectangleTestCase',
            'GraphTestCase']
@@ -0,0 +1,110 @@
+import unittest
+import math
+import random
+
+from .. import Point, PointSequence, Polygon, PointArray, Rectangle
+from ..packed import PackedPointSequence
+from ..calipers import diameter, minimumWidth, minimumAreaRectangle
+
+
+def _bruteForce(points):
+    '''
+    The diameter, width and smallest rectangle area by trying every
+    pair of points and every pair of hull edge and point.
+    '''
+    xy = Polygon(points).convexHull().xy
+    n = len(xy)
+    far = max(math.dist(p, q) for p in xy for q in xy)
+    width = area = math.inf
+    for i in range(n):
+        (ax, ay), (bx, by) = xy[i], xy[(i + 1) % n]
+        length = math.hypot(bx - ax, by - ay)
+        ex, ey = (bx - ax) / length, (by - ay) / length
+        along = [(x * ex) + (y * ey) for x, y in xy]
+        across = [((y - ay) * ex) - ((x - ax) * ey) for x, y in xy]
+        width = min(width, max(across))
+        area = min(area, (max(along) - min(along)) * max(across))
+    return far, width, area
+
+
+class CalipersTestCase(unittest.TestCase):
+
+    def assertHolds(self, rectangle, points):
+        # every point is inside the rectangle, allowing for rounding
+        c, s = rectangle._axes()
+        for p in points:
+            dx, dy = p.x - rectangle.x, p.y - rectangle.y
+            u, v = (dx * c) + (dy * s), (dy * c) - (dx * s)
+            self.assertTrue(-1e-9 <= u <= rectangle.width + 1e-9)
+            self.assertTrue(-1e-9 <= v <= rectangle.height + 1e-9)
+
+    def testSquare(self):
+        square = [Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2),
+                  Point(1, 1), Point(1, 0)]
+
+        d = diameter(square)
+        self.assertAlmostEqual(d.length, math.sqrt(8))
+        self.assertEqual(minimumWidth(square), 2)
+
+        r = minimumAreaRectangle(square)
+        self.assertEqual(r.area, 4)
+        self.assertEqual(r.theta, 0)
+        self.assertHolds(r, square)
+
+    def testRotated(self):
+        # a 4 x 1 rectangle turned by 30 degrees
+        r = Rectangle(Point(1, 2), 4, 1, 30)
+        points = r.vertices + [r.center, r.midAB, r.midCD]
+
+        best = minimumAreaRectangle(points)
+        self.assertAlmostEqual(best.area, 4)
+        self.assertAlmostEqual(minimumWidth(points), 1)
+        self.assertAlmostEqual(diameter(points).length, math.sqrt(17))
+        self.assertAlmostEqual(math.cos(math.radians(4 * best.theta)),
+                               math.cos(math.radians(4 * 30)))
+        self.assertHolds(best, points)
+
+    def testDegenerate(self):
+        self.assertEqual(diameter([Point(1, 1)]).length, 0)
+        self.assertEqual(minimumWidth([Point(1, 1), Point(1, 1)]), 0)
+
+        line = [Point(0, 0), Point(1, 1), Point(3, 3)]
+        self.assertAlmostEqual(diameter(line).length, math.sqrt(18))
+        self.assertEqual(minimumWidth(line), 0)
+        r = minimumAreaRectangle(line)
+        self.assertEqual((r.area, r.theta), (0, 45))
+        self.assertAlmostEqual(r.width, math.sqrt(18))
+
+        with self.assertRaises(ValueError):
+            diameter([])
+
+    def testRandomAgainstBruteForce(self):
+        rng = random.Random(20)
+        sets = []
+        for trial in range(100):
+            count = rng.randint(3, 50)
+            sets.append([Point(rng.uniform(-1, 1), rng.uniform(-1, 1))
+                         for _ in range(count)])
+        for sides in range(3, 13):
+            sets.append([Point(math.cos(2 * math.pi * i / sides),
+                               math.sin(2 * math.pi * i / sides))
+                         for i in range(sides)])
+        sets.append([Point(rng.randint(0, 4), rng.randint(0, 4))
+                     for _ in range(40)])
+
+        for points in sets:
+            far, width, area = _bruteForce(points)
+            self.assertAlmostEqual(diameter(points).length, far)
+            self.assertAlmostEqual(minimumWidth(points), width)
+            r = minimumAreaRectangle(points)
+            self.assertAlmostEqual(r.area, area)
+            self.assertHolds(r, points)
+
+    def testMethods(self):
+        xy = [(0, 0), (4, 0), (4, 1), (0, 1), (2, 0.5)]
+        for shape in (PointSequence([Point(p) for p in xy]),
+                      Polygon([Point(p) for p in xy]),
+                      PointArray(xy), PackedPointSequence(xy)):
+            self.assertAlmostEqual(shape.diameter().length, math.sqrt(17))
+            self.assertEqual(shape.minimumWidth(), 1)
+            self.assertEqual(shape.minimumAreaRectangle().area, 4)
@@ -0,0 +1,152 @@
+import unittest
+import math
+import random
+
+import numpy
+
+from .. import Point, Polygon
+from ..clipping import intersection, union, difference, xor, clipConvex
+from ..clipping import _apart, _box
+
+
+def _square(x, y, size):
+    return Polygon([Point(x, y), Point(x + size, y),
+                    Point(x + size, y + size), Point(x, y + size)])
+
+
+def _star(count, rng, cx=0, cy=0):
+    points = []
+    for i in range(count):
+        angle = 2 * math.pi * i / count
+        r = rng.uniform(0.2, 1.0)
+        points.append(Point(cx + r * math.cos(angle),
+                            cy + r * math.sin(angle)))
+    return Polygon(points)
+
+
+class ClippingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # a 'U' shape, concave with the notch open to the top
+        self.u = Polygon([Point(0, 0), Point(3, 0), Point(3, 3),
+                          Point(2, 3), Point(2, 1), Point(1, 1),
+                          Point(1, 3), Point(0, 3)])
+        self.a = _square(0, 0, 2)
+        self.b = _square(1, 1, 2)
+
+    def assertArea(self, polygons, area):
+        self.assertAlmostEqual(sum(p.signedArea for p in polygons), area)
+
+    def testOverlappingSquares(self):
+        self.assertArea(intersection(self.a, self.b), 1)
+        self.assertArea(union(self.a, self.b), 7)
+        self.assertArea(difference(self.a, self.b), 3)
+        self.assertArea(xor(self.a, self.b), 6)
+
+        result = self.a.union(self.b)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(len(result[0].vertices), 8)
+        self.assertTrue(result[0].isCCW)
+
+    def testConcaveSplits(self):
+        bar = Polygon([Point(-1, 2), Point(4, 2), Point(4, 4), Point(-1, 4)])
+
+        pieces = self.u.intersection(bar)
+        self.assertEqual(len(pieces), 2)
+        self.assertArea(pieces, 2)
+        for p in pieces:
+            self.assertEqual(p.area, 1)
+
+        self.assertEqual(len(self.u.union(bar)), 2)
+        self.assertArea(self.u.union(bar), 7 + 10 - 2)
+
+    def testContained(self):
+        inner = _square(1, 1, 1)
+        outer = _square(0, 0, 3)
+
+        self.assertArea(intersection(inner, outer), 1)
+        self.assertArea(union(inner, outer), 9)
+        self.assertEqual(difference(inner, outer), [])
+
+        ring = difference(outer, inner)
+        self.assertEqual(len(ring), 2)
+        self.assertEqual(sorted(p.signedArea for p in ring), [-1, 9])
+
+    def testDisjoint(self):
+        far = _square(5, 5, 1)
+
+        self.assertEqual(intersection(self.a, far), [])
+        self.assertEqual(len(union(self.a, far)), 2)
+        self.assertArea(difference(self.a, far), 4)
+        self.assertArea(xor(self.a, far), 5)
+        self.assertArea(union(self.a, far[:]), 5)
+
+        # boxes which touch at a corner are not apart
+        corner = _square(2, 2, 1)
+        self.assertFalse(_apart([_box(self.a, self.a.xy),
+                                 _box(corner, corner.xy)]))
+        self.assertTrue(_apart([_box(self.a, self.a.xy),
+                                _box(far, far.xy)]))
+        self.assertEqual(len(union(self.a, corner)), 2)
+
+        # inside the bounds of the U but in the notch
+        notch = _square(1.25, 1.5, 0.5)
+        self.assertEqual(intersection(self.u, notch), [])
+        self.assertArea(union(self.u, notch), 7.25)
+
+    def testSharedEdges(self):
+        right = _square(2, 0, 2)
+
+        result = union(self.a, right)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(len(result[0].vertices), 4)
+        self.assertArea(result, 8)
+
+        self.assertEqual(intersection(self.a, right), [])
+
+        self.assertArea(union(self.a, self.a), 4)
+        self.assertArea(intersection(self.a, self.a), 4)
+        self.assertEqual(difference(self.a, self.a), [])
+        self.assertEqual(xor(self.a, self.a), [])
+
+    def testClockwiseInput(self):
+        b = Polygon(list(reversed(self.b.vertices)))
+        self.assertArea(intersection(self.a, b), 1)
+        self.assertArea(difference(b, self.a), 3)
+
+    def testClipConvex(self):
+        xy = clipConvex(self.u, _square(0.5, 0.5, 2))
+        self.assertAlmostEqual(Polygon(xy).area, 4 - 1.5)
+
+        with self.assertRaises(ValueError):
+            clipConvex(self.a, self.u)
+
+    def testIsConvex(self):
+        self.assertTrue(self.a.isConvex)
+        self.assertTrue(Polygon(list(reversed(self.a.vertices))).isConvex)
+        self.assertFalse(self.u.isConvex)
+
+        pentagram = Polygon([Point(math.cos(a), math.sin(a))
+                             for a in [i * 4 * math.pi / 5 for i in range(5)]])
+        self.assertFalse(pentagram.isConvex)
+
+    def testRandomAgainstContainment(self):
+        rng = random.Random(16)
+        queries = numpy.random.default_rng(16).uniform(-2, 2, (500, 2))
+        operations = {intersection: numpy.logical_and,
+                      union: numpy.logical_or,
+                      difference: lambda a, b: a & ~b,
+                      xor: numpy.logical_xor}
+
+        for trial in range(10):
+            a = _star(rng.randint(3, 12), rng)
+            b = _star(rng.randint(3, 12), rng,
+                      rng.uniform(-1, 1), rng.uniform(-1, 1))
+            inA, inB = a.containsPoints(queries), b.containsPoints(queries)
+            for operation, expected in operations.items():
+                winding = numpy.zeros(len(queries), dtype=int)
+                for p in operation(a, b):
+                    sign = 1 if p.isCCW else -1
+                    winding += sign * p.containsPoints(queries)
+                self.assertTrue(numpy.array_equal(winding > 0,
+                                                  expected(inA, inB)))
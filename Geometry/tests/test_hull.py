@@ -0,0 +1,66 @@
+import unittest
+import random
+
+from .. import Point, Polygon, PointArray
+from ..hull import convexHull, IncrementalHull
+
+
+class HullTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.square = [Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2)]
+        self.inside = [Point(1, 1), Point(0.5, 1.5), Point(1, 0), Point(2, 1)]
+
+    def assertHullEqual(self, hull, xy):
+        self.assertEqual([(p.x, p.y) for p in hull.vertices], xy)
+
+    def testConvexHullSquare(self):
+        hull = convexHull(self.inside + list(reversed(self.square)))
+
+        self.assertIsInstance(hull, Polygon)
+        self.assertHullEqual(hull, [(0, 0), (2, 0), (2, 2), (0, 2)])
+        self.assertTrue(hull.isCCW)
+        self.assertEqual(hull.area, 4)
+
+    def testConvexHullDegenerate(self):
+        self.assertHullEqual(convexHull([]), [])
+        self.assertHullEqual(convexHull([(1, 1), (1, 1)]), [(1, 1)])
+        self.assertHullEqual(convexHull([(2, 2), (0, 0), (1, 1), (3, 3)]),
+                             [(0, 0), (3, 3)])
+
+    def testConvexHullInputs(self):
+        points = self.square + self.inside
+        expected = convexHull(points)
+
+        self.assertEqual(convexHull(Polygon(points)), expected)
+        self.assertEqual(convexHull([p.xy for p in points]), expected)
+        self.assertEqual(convexHull(PointArray(points)), expected)
+        self.assertEqual(Polygon(points).convexHull(), expected)
+        self.assertEqual(PointArray(points).convexHull(), expected)
+
+    def testIncrementalHullAdd(self):
+        hull = IncrementalHull()
+        self.assertEqual(len(hull), 0)
+
+        for p in self.square:
+            self.assertTrue(hull.add(p))
+        for p in self.inside:
+            self.assertFalse(hull.add(p))
+
+        self.assertEqual(len(hull), 4)
+        self.assertTrue(hull.add((3, 3)))
+        self.assertHullEqual(hull.polygon, [(0, 0), (2, 0), (3, 3), (0, 2)])
+
+    def testIncrementalHullMatchesConvexHull(self):
+        rng = random.Random(14)
+        for trial in range(50):
+            # a small integer grid gives plenty of collinear points
+            points = [(rng.randint(0, 6), rng.randint(0, 6))
+                      for i in range(rng.randint(0, 40))]
+            hull = IncrementalHull()
+            for p in points:
+                hull.add(p)
+            expected = convexHull(points)
+            self.assertEqual(hull.polygon, expected, points)
+            self.assertEqual(len(hull), len(expected.vertices), points)
+            self.assertEqual(IncrementalHull(points).polygon, expected)
@@ -0,0 +1,57 @@
+import unittest
+import subprocess
+import sys
+import os
+
+import Geometry
+
+_top = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+def _modulesAfter(statement):
+    '''
+    :statement: string of python source
+    :return: set of module names
+
+    Runs 'statement' in a fresh interpreter and returns the names of
+    the modules loaded afterwards.
+    '''
+    source = '\n'.join([statement,
+                        'import sys',
+                        'print(" ".join(sys.modules))'])
+    output = subprocess.check_output([sys.executable, '-c', source],
+                                     cwd=_top)
+    return set(output.decode().split())
+
+
+class ImportTestCase(unittest.TestCase):
+
+    def testImportIsLazy(self):
+        '''
+        '''
+        modules = _modulesAfter('import Geometry')
+
+        self.assertIn('Geometry.point', modules)
+        for name in ['pkg_resources', 'numpy',
+                     'Geometry.pointarray', 'Geometry.transform',
+                     'Geometry.ellipse', 'Geometry.triangle2',
+                     'Geometry.rectangle', 'Geometry.graph',
+                     'Geometry.packed', 'Geometry.sweep']:
+            self.assertNotIn(name, modules)
+
+    def testImportLazyNames(self):
+        '''
+        '''
+        modules = _modulesAfter('from Geometry import Circle')
+        self.assertIn('Geometry.ellipse', modules)
+        self.assertNotIn('Geometry.graph', modules)
+
+        for name in Geometry.__all__:
+            self.assertIs(getattr(Geometry, name),
+                          getattr(Geometry, name))
+            self.assertIn(name, dir(Geometry))
+
+        self.assertIs(Geometry.Triangle, Geometry.triangle2.Triangle)
+
+        with self.assertRaises(AttributeError):
+            Geometry.NotAShape
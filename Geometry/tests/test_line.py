@@ -1,6 +1,8 @@
 
 import unittest
+import copy
 import math
+import pickle
 import sys
 
 from .. import Line, Segment, Ray, Point
@@ -24,9 +26,139 @@ class LineTestCase(unittest.TestCase):
         self.assertIsLine(Line(o, i))
 
 
+    def testLineIntersection(self):
+        l = Line(Point(0, 0), Point(1, 0))
+        m = Line(Point(5, -1), Point(5, 1))
+
+        self.assertEqual(l.intersection(m), Point(5, 0))
+        self.assertEqual(l.findIntersection(m), Point(5, 0))
+
+        n = Line(Point(0, 1), Point(1, 1))
+        self.assertIsNone(l.findIntersection(n))
+        with self.assertRaises(ParallelLines):
+            l.intersection(n)
+
+        o = Line(Point(2, 0), Point(3, 0))
+        self.assertIsNone(l.findIntersection(o))
+        with self.assertRaises(CollinearLines):
+            l.intersection(o)
+
+    def testLineCachedTerms(self):
+        l = Line(Point(0, 1), Point(1, 1))
+
+        self.assertEqual(l.m, Point(1, 0))
+        self.assertEqual(l.distanceFromPoint(Point(3, -2)), 3)
+        self.assertEqual(l.distanceFromPoint(Point(5, 1)), 0)
+
+        # changing A or B, directly or through the line, discards them
+        l.A.y = 0
+        self.assertEqual(l.m, Point(1, 1))
+        l.B = (1, -1)
+        self.assertEqual(l.m, Point(1, -1))
+        l.flip()
+        self.assertEqual(l.m, Point(-1, 1))
+
+        n = l.normal
+        self.assertEqual((n.A, n.B), (Point(-1, -1), Point(1, 1)))
+        n.A.x = 7
+        self.assertEqual(l.normal.A, Point(-1, -1))
+
+    def testLineDistance(self):
+        l = Line(Point(0, 0), Point(1, 0))
+
+        self.assertEqual(l.distanceFromPoint(Point(-3, 4)), 4)
+        self.assertEqual(l.closestPoint(Point(-3, 4)), Point(-3, 0))
+        self.assertEqual(l.closestPoint((5, -1)), Point(5, 0))
+
+
 class SegmentTestCase(unittest.TestCase):
-    pass
+
+    def testSegmentCachedTerms(self):
+        s = Segment(Point(0, 0), Point(3, 4))
+
+        self.assertEqual(s.length, 5)
+        self.assertEqual(s.bounds, ((0, 0, 0), (3, 4, 0)))
+
+        s.A.x = 6
+        self.assertEqual(s.length, 5)
+        self.assertEqual(s.bounds, ((3, 0, 0), (6, 4, 0)))
+
+        s.B = Point(6, 0, 1)
+        self.assertEqual(s.length, 1)
+        self.assertEqual(s.bounds, ((6, 0, 0), (6, 0, 1)))
+
+    def testSegmentCachedTermsCopies(self):
+        s = Segment(Point(0, 0), Point(1, 0))
+        self.assertEqual(s.length, 1)
+        self.assertEqual(s.bounds, ((0, 0, 0), (1, 0, 0)))
+
+        for c in [copy.deepcopy(s), pickle.loads(pickle.dumps(s)),
+                  copy.copy(s)]:
+            c.B.x = 5
+            self.assertEqual(c.length, 5)
+            self.assertEqual(c.bounds, ((0, 0, 0), (5, 0, 0)))
+            self.assertEqual(c.findIntersection(
+                Segment(Point(4, -1), Point(4, 1))), Point(4, 0))
+            self.assertEqual(c.distanceFromPoint(Point(5, 2)), 2)
+
+    def testSegmentIntersection(self):
+        s = Segment(Point(0, 0), Point(2, 2))
+
+        self.assertEqual(s.intersection(Segment(Point(0, 2), Point(2, 0))),
+                         Point(1, 1))
+        self.assertEqual(s.findIntersection(Segment(Point(2, 2),
+                                                    Point(3, 0))),
+                         Point(2, 2))
+
+        # the lines cross at (2.5, 2.5), beyond both segments
+        t = Segment(Point(5, 0), Point(6, -1))
+        self.assertTrue(Line.fromSegment(s).findIntersection(
+            Line.fromSegment(t)) == Point(2.5, 2.5))
+        self.assertIsNone(s.findIntersection(t))
+        with self.assertRaises(ParallelLines):
+            s.intersection(t)
+
+        # the exact crossing is not representable, the rounded point
+        # is still found
+        u = Segment(Point(0, 0.1), Point(3, 0.2))
+        v = Segment(Point(0.3, -1), Point(0.7, 1))
+        self.assertIsNotNone(u.intersection(v))
+
+        with self.assertRaises(CollinearLines):
+            s.intersection(Segment(Point(1, 1), Point(2, 2)))
+
+    def testSegmentDistance(self):
+        s = Segment(Point(0, 0), Point(4, 0))
+
+        for p, d, q in [((2, 3), 3, (2, 0)),
+                        ((-3, 4), 5, (0, 0)),
+                        ((7, -4), 5, (4, 0)),
+                        ((1, 0), 0, (1, 0))]:
+            self.assertEqual(s.distanceFromPoint(Point(p)), d)
+            self.assertEqual(s.closestPoint(p), Point(q))
+
+        dot = Segment(Point(1, 1), Point(1, 1))
+        self.assertEqual(dot.distanceFromPoint(Point(4, 5)), 5)
+        self.assertEqual(dot.closestPoint((4, 5)), Point(1, 1))
 
 
 class RayTestCase(unittest.TestCase):
-    pass
+
+    def testRayFindIntersection(self):
+        r = Ray(Point(0, 0), Point(1, 0))
+
+        self.assertEqual(r.findIntersection(Segment(Point(5, -1),
+                                                    Point(5, 1))),
+                         Point(5, 0))
+        self.assertIsNone(r.findIntersection(Segment(Point(-5, -1),
+                                                     Point(-5, 1))))
+        self.assertEqual(Line(Point(-5, -1), Point(-5, 1)).findIntersection(
+            Ray(Point(0, 0), Point(-1, 0))), Point(-5, 0))
+
+    def testRayDistance(self):
+        r = Ray(Point(1, 1), Point(2, 1))
+
+        self.assertEqual(r.distanceFromPoint(Point(10, 4)), 3)
+        self.assertEqual(r.closestPoint((10, 4)), Point(10, 1))
+        self.assertEqual(r.distanceFromPoint(Point(-2, 5)), 5)
+        self.assertEqual(r.closestPoint((-2, 5)), Point(1, 1))
@@ -0,0 +1,144 @@
+import unittest
+import pickle
+
+import numpy
+
+from .. import Point, PointSequence, Polygon, PointArray
+from ..packed import PackedPointSequence, PackedPolygon
+from ..pointarray import PointView
+
+
+class PackedTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.xy = [(0, 0), (3, 0), (3, 3), (2, 3),
+                   (2, 1), (1, 1), (1, 3), (0, 3)]
+        self.u = Polygon([Point(x, y) for x, y in self.xy])
+        self.packed = PackedPolygon(self.xy)
+
+    def testPackedPointSequence(self):
+        '''
+        '''
+        xyz = numpy.arange(300.0).reshape(100, 3)
+        s = PackedPointSequence(xyz)
+
+        self.assertEqual(len(s), 100)
+        self.assertEqual(s.labels, '')
+        self.assertIsInstance(s[50], PointView)
+        self.assertEqual(s[50], Point(150, 151, 152))
+        self.assertEqual(s[-1], Point(297, 298, 299))
+        self.assertEqual(s[1:3], [Point(3, 4, 5), Point(6, 7, 8)])
+        self.assertEqual(list(s), list(PointArray(xyz)))
+        self.assertEqual(next(reversed(s)), s[-1])
+        self.assertTrue(Point(3, 4, 5) in s)
+        self.assertFalse(Point(3, 4) in s)
+
+        with self.assertRaises(IndexError):
+            s[100]
+        with self.assertRaises(TypeError):
+            s['A']
+        with self.assertRaises(AttributeError):
+            s.A
+
+        # plain attributes are not mistaken for labels
+        s.ABC = 1
+        self.assertEqual(s.ABC, 1)
+        self.assertEqual(s[0], Point(0, 1, 2))
+
+    def testPackedEquality(self):
+        '''
+        '''
+        points = PointSequence([Point(x, y) for x, y in self.xy])
+        packed = PackedPointSequence(self.xy)
+
+        self.assertTrue(packed == points)
+        self.assertTrue(points == packed)
+        self.assertEqual(hash(packed), hash(points))
+        self.assertTrue(self.packed == self.u)
+        self.assertEqual(hash(self.packed), hash(self.u))
+        self.assertFalse(packed == PackedPointSequence(self.xy[1:]))
+
+        # a subset of the vertices is not equal either way round
+        for fewer in (PackedPointSequence(self.xy[1:]),
+                      PointSequence([Point(x, y) for x, y in self.xy[1:]])):
+            self.assertFalse(fewer == packed)
+            self.assertFalse(packed == fewer)
+            self.assertTrue(fewer != packed)
+
+        self.assertFalse(packed == Point(0, 0))
+        self.assertFalse(Point(0, 0) == packed)
+        self.assertTrue(packed != Point(0, 0))
+
+        # repeated vertices are ignored, as they are by the hash
+        again = PackedPointSequence(self.xy + self.xy[:2])
+        self.assertTrue(again == packed)
+        self.assertTrue(points == again)
+        self.assertEqual(hash(again), hash(points))
+
+    def testPackedPolygon(self):
+        '''
+        '''
+        self.assertEqual(self.packed.area, self.u.area)
+        self.assertEqual(self.packed.centroid, self.u.centroid)
+        self.assertEqual(self.packed.perimeter, self.u.perimeter)
+        self.assertEqual(self.packed.bounds, self.u.bounds)
+        self.assertEqual(self.packed.xy, self.u.xy)
+        self.assertFalse(self.packed.isConvex)
+
+        queries = [Point(0.5, 2), Point(1.5, 2), Point(1.5, 0.5),
+                   Point(3, 3), Point(-1, 0)]
+        self.assertEqual([q in self.packed for q in queries],
+                         [q in self.u for q in queries])
+        self.assertEqual(self.packed.containsPoints(queries).tolist(),
+                         [True, False, True, True, False])
+
+        self.assertEqual(len(self.packed.triangulate()), 6)
+        self.assertEqual(self.packed.convexHull().area, 9)
+        self.assertEqual(sum(p.area for p in
+                             self.packed.intersection(self.u)), 7)
+
+        simple = PackedPolygon([(0, 0), (1, 0), (2, 0), (2, 2), (0, 2)])
+        result = simple.simplify(0.1)
+        self.assertIsInstance(result, PackedPolygon)
+        self.assertEqual(len(result), 4)
+
+        rotated = self.packed.rotate(0, 0, 90, origin=[1, 1])
+        self.assertIsInstance(rotated, PackedPolygon)
+        self.assertAlmostEqual(rotated.area, self.u.area)
+        self.assertEqual(len(rotated), len(self.packed))
+
+    def testPackedInvalidation(self):
+        '''
+        '''
+        self.assertEqual(self.packed.area, 7)
+        self.assertFalse(Point(4, 1) in self.packed)
+        h = hash(self.packed)
+
+        self.packed[1].x = 5
+        self.assertEqual(self.packed.bounds, ((0, 0, 0), (5, 3, 0)))
+        self.assertEqual(self.packed.area, 10)
+        self.assertTrue(Point(4, 1) in self.packed)
+        self.assertNotEqual(hash(self.packed), h)
+
+        self.packed.array.x[1] = 3
+        self.packed._invalidate()
+        self.assertEqual(self.packed.area, 7)
+
+        # a view kept across several changes reports each of them
+        v = self.packed[0]
+        for x in (-5, -10, -2):
+            h = hash(self.packed)
+            v.x = x
+            self.assertEqual(self.packed.bounds[0][0], x)
+            self.assertEqual(self.packed.xy[0], (x, 0))
+            self.assertNotEqual(hash(self.packed), h)
+
+    def testPackedPickle(self):
+        '''
+        '''
+        self.assertTrue(self.packed.bounds)
+        copy = pickle.loads(pickle.dumps(self.packed))
+        self.assertIsInstance(copy, PackedPolygon)
+        self.assertTrue(numpy.array_equal(copy.array.xyz,
+                                          self.packed.array.xyz))
+        self.assertEqual(copy.area, 7)
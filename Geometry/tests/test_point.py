@@ -371,14 +371,36 @@ class PointTestCase(unittest.TestCase):
         '''
         '''
 
-        # MAGIC NUMBER: hash value for a Point(0,0,0) object
-        #               will fail if the hash calculation changes.
-        #               need a better test method.
+        v = hash(Point.origin())
 
-        v = 1553416657114974281
-
-        self.assertTrue(hash(Point.origin()) == v)
+        self.assertTrue(hash(Point()) == v)
         self.assertFalse(hash(Point(1, 1, 1)) == v)
+        self.assertTrue(hash(Point(1, 2, 3)) == hash(Point(1.0, 2.0, 3.0)))
+        self.assertTrue(hash(Point(-0.0, 0, 0)) == v)
+
+    def testPointMethod_hash_invalidation(self):
+        '''
+        '''
+        p = Point(1, 2, 3)
+        h = hash(p)
+        p.x = 4
+        self.assertNotEqual(hash(p), h)
+        p.x = 1
+        self.assertEqual(hash(p), h)
+        p.xyz = [4, 5, 6]
+        self.assertEqual(hash(p), hash(Point(4, 5, 6)))
+
+    def testPointSlots(self):
+        '''
+        '''
+        p = Point(1, 2, 3)
+        self.assertFalse(hasattr(p, '__dict__'))
+        with self.assertRaises(AttributeError, msg='p.foo = 1'):
+            p.foo = 1
+        p.x = -0.0
+        self.assertEqual(str(p.x), '0.0')
+        p.y = 7
+        self.assertIsInstance(p.y, float)
 
     def testPointMethod_len(self):
         '''
@@ -456,7 +478,9 @@ class PointTestCase(unittest.TestCase):
             self.assertFalse(c is a)
             self.assertFalse(c is b)
             self.assertCoordinatesEqual(c, [1, 1, 1])
+            c = a
             a -= b
+            self.assertTrue(a is c)
             self.assertCoordinatesEqual(a, [-1, -1, -1])
 
     def testPointMethod_multiplication(self):
@@ -569,6 +593,10 @@ class PointTestCase(unittest.TestCase):
             a **= b
             self.assertCoordinatesEqual(a, [4, 4, 4])
 
+        # complex results are not coordinates
+        with self.assertRaises(ValueError):
+            c = Point(-1, 0, 0) ** 0.5
+
     def testPointMethod_rightshift(self):
         '''
         '''
@@ -983,11 +1011,55 @@ class PointTestCase(unittest.TestCase):
     def testPointMethod_rotate2d(self):
         '''
         '''
+        p = Point(1, 0, 5)
+
+        q = p.rotate2d(90)
+        self.assertAlmostEqual(q.distance(Point(0, 1, 5)), 0)
+        self.assertEqual(p, Point(1, 0, 5))
+
+        q = p.rotate2d(math.pi, origin=[1, 1], radians=True)
+        self.assertAlmostEqual(q.distance(Point(1, 2, 5)), 0)
+
+        q = Point(0, 1, 5).rotate2d(90, axis='x')
+        self.assertAlmostEqual(q.distance(Point(0, -5, 1)), 0)
+
+        with self.assertRaises(KeyError):
+            p.rotate2d(90, axis='w')
 
     def testPointMethod_irotate2d(self):
         '''
         '''
+        p = Point(1, 0, 5)
+        q = p.irotate2d(90)
+        self.assertIs(p, q)
+        self.assertAlmostEqual(p.distance(Point(0, 1, 5)), 0)
 
-    def rotate(self, theta_x, theta_y, theta_z, origin=None, radians=False):
+    def testPointMethod_rotate(self):
         '''
         '''
+        p = Point(1, 2, 3)
+        o = Point(-1, 4, 0.5)
+
+        for angles in [(0, 0, 0), (90, 0, 0), (0, 90, 0), (0, 0, 90),
+                       (10, 20, 30), (-45, 135, 270)]:
+            tx, ty, tz = angles
+            expected = p.rotate2d(tx, o, 'x').rotate2d(ty, o, 'y')
+            expected = expected.rotate2d(tz, o, 'z')
+            q = p.rotate(tx, ty, tz, origin=o)
+            self.assertAlmostEqual(q.distance(expected), 0)
+            self.assertAlmostEqual(q.distance(o), p.distance(o))
+
+        q = p.rotate(*map(math.radians, (10, 20, 30)), radians=True)
+        self.assertAlmostEqual(q.distance(p.rotate(10, 20, 30)), 0)
+        self.assertEqual(p, Point(1, 2, 3))
+
+    def testPointMethod_irotate(self):
+        '''
+        '''
+        p = Point(1, 2, 3)
+        expected = p.rotate(10, 20, 30)
+        h = hash(p)
+        q = p.irotate(10, 20, 30)
+        self.assertIs(p, q)
+        self.assertEqual(p, expected)
+        self.assertNotEqual(hash(p), h)
@@ -0,0 +1,329 @@
+
+import unittest
+import math
+import numpy
+
+from .. import Point, PointSequence, PointArray, Segment
+from ..pointarray import (PointView, ccw, isCCW, isCollinear,
+                          intersectSegments, segmentDistances,
+                          nearestSegments, randomStreams)
+
+
+class PointArrayTestCase(unittest.TestCase):
+
+    def assertRowsEqual(self, a, rows, msg=None):
+        '''
+        '''
+        self.assertTrue(numpy.allclose(a.xyz, rows), msg)
+
+    def testPointArrayCreation(self):
+        '''
+        '''
+        self.assertEqual(len(PointArray()), 0)
+        self.assertEqual(PointArray().xyz.shape, (0, 3))
+
+        a = PointArray([[1, 2], [3, 4]])
+        self.assertRowsEqual(a, [[1, 2, 0], [3, 4, 0]])
+
+        b = PointArray([Point(1, 2, 3), {'y': 1}, [4, 5, 6]])
+        self.assertRowsEqual(b, [[1, 2, 3], [0, 1, 0], [4, 5, 6]])
+
+        c = PointArray(b)
+        self.assertFalse(c.xyz is b.xyz)
+        self.assertTrue(c == b)
+
+        s = PointSequence(Point(1, 1), Point(2, 2), Point(3, 3))
+        d = PointArray(s)
+        self.assertEqual(len(d), 3)
+        self.assertTrue(d.toSequence() == s)
+
+        with self.assertRaises(ValueError):
+            PointArray(numpy.zeros((3, 4)))
+
+    def testPointArrayIndexing(self):
+        '''
+        '''
+        a = PointArray([[1, 2, 3], [4, 5, 6]])
+
+        p = a[1]
+        self.assertIsInstance(p, PointView)
+        self.assertIsInstance(p, Point)
+        self.assertEqual(p, Point(4, 5, 6))
+        self.assertEqual(a[-1], p)
+
+        p.x = 10
+        self.assertEqual(a.xyz[1, 0], 10)
+        a.xyz[1, 1] = 20
+        self.assertEqual(p.y, 20)
+
+        q = p + 1
+        self.assertIs(type(q), Point)
+        self.assertEqual(q, Point(11, 21, 7))
+        self.assertEqual(hash(p), hash(Point(10, 20, 6)))
+
+        s = a[0:1]
+        self.assertIsInstance(s, PointArray)
+        s.x = 99
+        self.assertEqual(a[0].x, 99)
+
+        with self.assertRaises(IndexError):
+            a[2]
+
+        self.assertEqual([v.xyz for v in a], a.xyz.tolist())
+        self.assertTrue([99, 2, 3] in a)
+        self.assertFalse([1, 2, 3] in a)
+
+    def testPointArrayOperators(self):
+        '''
+        '''
+        a = PointArray([[1, 2, 3], [4, 5, 6]])
+        b = PointArray([[2, 2, 2], [3, 3, 3]])
+
+        for op in ['+', '-', '*', '/', '//', '%', '**']:
+            for other in [b, Point(2, 3, 4), 2, [1, 2, 3]]:
+                c = eval('a {} other'.format(op))
+                for i, p in enumerate(a.points()):
+                    q = other[i] if isinstance(other, PointArray) else other
+                    msg = '{!r} {} {!r}'.format(p, op, q)
+                    expected = eval('p {} q'.format(op))
+                    self.assertEqual(c[i], expected, msg)
+
+        c = 2 - a
+        self.assertRowsEqual(c, [[1, 0, -1], [-2, -3, -4]])
+
+        c = PointArray(a)
+        c += 1
+        self.assertRowsEqual(c, a.xyz + 1)
+        c *= b
+        self.assertRowsEqual(c, (a.xyz + 1) * b.xyz)
+
+        self.assertRowsEqual(-a, -a.xyz)
+
+        # numpy scalars are scalars on either side
+        for scalar in [numpy.int64(2), numpy.float32(2), numpy.float64(2)]:
+            self.assertRowsEqual(a * scalar, a.xyz * 2)
+            self.assertRowsEqual(a + scalar, a.xyz + 2)
+            self.assertRowsEqual(scalar * a, a.xyz * 2)
+            self.assertRowsEqual(scalar - a, 2 - a.xyz)
+
+        # None is not an empty array
+        self.assertFalse(PointArray() == None)
+        self.assertTrue(PointArray() != None)
+        self.assertFalse(a == 'xyz')
+
+        for other in [0, Point(1, 0, 1)]:
+            with self.assertRaises(ZeroDivisionError):
+                a / other
+            with self.assertRaises(ZeroDivisionError):
+                a // other
+            with self.assertRaises(ZeroDivisionError):
+                a % other
+
+    def testPointArrayMethods(self):
+        '''
+        '''
+        a = PointArray(Point.gaussian() for _ in range(10))
+        b = PointArray(Point.gaussian() for _ in range(10))
+
+        for i, (p, q) in enumerate(zip(a.points(), b.points())):
+            self.assertAlmostEqual(a.dot(b)[i], p.dot(q))
+            self.assertAlmostEqual(a.cross(b)[i], p.cross(q))
+            self.assertAlmostEqual(a.distance(b)[i], p.distance(q))
+            self.assertAlmostEqual(a.distanceSquared(b)[i],
+                                   p.distanceSquared(q))
+            self.assertAlmostEqual(a.distance()[i], p.distance())
+            self.assertAlmostEqual(a.midpoint(b)[i].distance(p.midpoint(q)),
+                                   0)
+
+    def testPointArrayRotate2d(self):
+        '''
+        '''
+        a = PointArray([[1, 0, 0], [0, 1, 0]])
+        b = a.rotate2d(90)
+        self.assertRowsEqual(b, [[0, 1, 0], [-1, 0, 0]])
+        self.assertRowsEqual(a, [[1, 0, 0], [0, 1, 0]])
+
+        a.irotate2d(math.pi, origin=[1, 1], radians=True)
+        self.assertRowsEqual(a, [[1, 2, 0], [2, 1, 0]])
+
+        b = PointArray([[0, 1, 5]]).rotate2d(90, axis='x')
+        self.assertRowsEqual(b, [[0, -5, 1]])
+
+        with self.assertRaises(KeyError):
+            a.rotate2d(90, axis='w')
+
+    def testPointArrayRotate(self):
+        '''
+        '''
+        points = [Point.gaussian() for _ in range(20)]
+        a = PointArray(points)
+        o = Point(1, -2, 3)
+
+        b = a.rotate(10, 20, 30, origin=o)
+        for i, p in enumerate(points):
+            q = p.rotate(10, 20, 30, origin=o)
+            self.assertAlmostEqual(b[i].distance(q), 0)
+            self.assertAlmostEqual(a[i].distance(p), 0)
+
+        c = a[5:10]
+        self.assertIs(a.irotate(10, 20, 30, origin=o), a)
+        self.assertRowsEqual(a, b.xyz)
+        self.assertRowsEqual(c, b[5:10].xyz)
+
+    def testPointArrayRandom(self):
+        '''
+        '''
+        o = Point(1, 2, 3)
+
+        a = PointArray.randomInSphere(1000, origin=o, radius=2, rng=1)
+        self.assertEqual(len(a), 1000)
+        self.assertTrue((a.distance(o) <= 2).all())
+        self.assertTrue((a.distance(o) > 1.5).any())
+
+        a = PointArray.randomInDisc(1000, origin=o, radius=2, rng=1)
+        self.assertTrue((a.z == 3).all())
+        self.assertTrue((a.distance(o) <= 2).all())
+
+        a = PointArray.randomInBox(1000, [-1, 0, 5], [1, 2, 5], rng=1)
+        self.assertTrue((a.xyz >= [-1, 0, 5]).all())
+        self.assertTrue((a.xyz <= [1, 2, 5]).all())
+
+        a = PointArray.gaussian(10000, mu=o, sigma=0.5, rng=1)
+        self.assertTrue(numpy.allclose(a.xyz.mean(axis=0), o.xyz, atol=0.05))
+        self.assertTrue(numpy.allclose(a.xyz.std(axis=0), 0.5, atol=0.05))
+
+    def testPointArrayRandomSeeds(self):
+        '''
+        '''
+        a = PointArray.randomInSphere(100, rng=42)
+        b = PointArray.randomInSphere(100, rng=numpy.random.default_rng(42))
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, PointArray.randomInSphere(100, rng=43))
+
+        streams = randomStreams(3, seed=42)
+        again = randomStreams(3, seed=numpy.random.SeedSequence(42))
+        samples = [PointArray.gaussian(100, rng=g) for g in streams]
+        for sample, g in zip(samples, again):
+            self.assertEqual(sample, PointArray.gaussian(100, rng=g))
+        self.assertNotEqual(samples[0], samples[1])
+        self.assertNotEqual(samples[1], samples[2])
+
+    def testPointArrayCCW(self):
+        '''
+        '''
+        a = PointArray(Point.gaussian() for _ in range(20))
+        b = PointArray(Point.gaussian() for _ in range(20))
+        c = PointArray(Point.gaussian() for _ in range(20))
+
+        for axis in ['x', 'y', 'z', 0, 1, 2]:
+            r = a.ccw(b, c, axis)
+            for i in range(len(a)):
+                self.assertAlmostEqual(r[i], a[i].ccw(b[i], c[i], axis))
+
+        o = Point.origin()
+        i, j, k = Point.units()
+        q = PointArray([j, -j, i * 2, [1, 1, 0]])
+
+        self.assertEqual(ccw(o, i, q).tolist(), [1, -1, 0, 1])
+        self.assertEqual(isCCW(o, i, q).tolist(), [True, False, False, True])
+        self.assertEqual(isCollinear(o, i, q).tolist(),
+                         [False, False, True, False])
+        self.assertEqual(ccw(o, i, q.xy).tolist(), [1, -1, 0, 1])
+
+        for junk in [-1, 'foo', {}, 13.0, None]:
+            with self.assertRaises(ValueError,
+                                   msg='junk is {}'.format(junk)):
+                ccw(o, i, q, axis=junk)
+
+    def testIntersectSegments(self):
+        '''
+        '''
+        s = Segment(Point(0, 0), Point(2, 2))
+        others = [((0, 2), (2, 0)),     # crossing
+                  ((5, 0), (6, -1)),    # lines cross beyond both
+                  ((0, 1), (1, 2)),     # parallel
+                  ((3, 3), (4, 4)),     # collinear, apart
+                  ((3, 3), (1, 1)),     # collinear, overlapping
+                  ((1, 1), (1, 1)),     # a point on s
+                  ((2, 2), (2, 5))]     # touching at an end
+
+        mask, points, t, u = intersectSegments(s, others)
+        self.assertEqual(mask.tolist(),
+                         [True, False, False, False, True, True, True])
+        self.assertEqual(points[mask].tolist(),
+                         [[1, 1], [1, 1], [1, 1], [2, 2]])
+        self.assertEqual(t[mask].tolist(), [0.5, 0.5, 0.5, 1])
+        self.assertEqual(u[mask].tolist(), [0.5, 1, 0, 0])
+        self.assertTrue(numpy.isnan(points[~mask]).all())
+        self.assertEqual((t[1], u[1]), (1.25, -2.5))
+        self.assertTrue(numpy.isnan([t[2], u[2], t[3], u[3]]).all())
+
+        # pairwise rows, in either order and with Z coordinates
+        first = numpy.array(others, dtype=float)
+        second = numpy.broadcast_to([[0, 0, 1], [2, 2, 1]], (7, 2, 3))
+        self.assertEqual(intersectSegments(second, first)[0].tolist(),
+                         mask.tolist())
+        m, p, t2, u2 = intersectSegments(first, second)
+        self.assertEqual(m.tolist(), mask.tolist())
+        # the overlap is reported nearest the start of the first
+        self.assertEqual(p[4].tolist(), [2, 2])
+        p[4] = points[4]
+        self.assertTrue(numpy.allclose(p[m], points[mask]))
+
+        # each point is at t along the first and u along the second
+        rng = numpy.random.default_rng(22)
+        a, b = rng.random((1000, 2, 2)), rng.random((1000, 2, 2))
+        m, p, t, u = intersectSegments(a, b)
+        self.assertTrue(m.any() and not m.all())
+        for i in range(len(a)):
+            r = Segment(Point(*a[i, 0]), Point(*a[i, 1]))
+            q = Segment(Point(*b[i, 0]), Point(*b[i, 1]))
+            self.assertEqual(m[i], r.doesIntersect(q))
+        self.assertTrue(numpy.allclose(
+            p[m], a[m, 0] + (t[m, numpy.newaxis] * (a[m, 1] - a[m, 0]))))
+        self.assertTrue(numpy.allclose(
+            p[m], b[m, 0] + (u[m, numpy.newaxis] * (b[m, 1] - b[m, 0]))))
+
+        with self.assertRaises(ValueError):
+            intersectSegments(numpy.zeros((4, 3, 2)), s)
+
+    def testSegmentDistances(self):
+        '''
+        '''
+        segments = [Segment(Point(0, 0), Point(4, 0)),
+                    Segment(Point(0, 0), Point(0, 4)),
+                    Segment(Point(5, 5), Point(5, 5))]
+        points = PointArray([[2, 1], [-3, 4], [5, 7], [1, 3]])
+
+        d = segmentDistances(points, segments)
+        self.assertEqual(d.shape, (4, 3))
+        self.assertEqual(d[:, 0].tolist(), [1, 5, math.hypot(1, 7), 3])
+        self.assertEqual(d[:, 2].tolist(), [5, math.hypot(8, 1), 2,
+                                            math.hypot(4, 2)])
+
+        index, distance, closest = nearestSegments(points, segments)
+        self.assertEqual(index.tolist(), [0, 1, 2, 1])
+        self.assertEqual(distance.tolist(), [1, 3, 2, 1])
+        self.assertEqual(closest.tolist(), [[2, 0], [0, 4], [5, 5], [0, 3]])
+
+        # blocks of points give the same answer as one pass, which
+        # agrees with Segment.distanceFromPoint
+        rng = numpy.random.default_rng(24)
+        ends = rng.random((40, 2, 2))
+        queries = (rng.random((500, 2)) * 1.4) - 0.2
+        index, distance, closest = nearestSegments(queries, ends)
+        blocked = nearestSegments(queries, ends, chunk=37)
+        self.assertEqual(index.tolist(), blocked[0].tolist())
+        self.assertTrue(numpy.array_equal(closest, blocked[2]))
+
+        d = segmentDistances(queries, ends)
+        self.assertTrue(numpy.allclose(distance, d.min(axis=1)))
+        for i in range(0, 500, 50):
+            s = Segment(Point(*ends[index[i], 0]), Point(*ends[index[i], 1]))
+            q = Point(*queries[i])
+            self.assertAlmostEqual(s.distanceFromPoint(q), distance[i])
+            self.assertTrue(numpy.allclose(s.closestPoint(q).xy,
+                                           closest[i]))
+
+        with self.assertRaises(ValueError):
+            nearestSegments(queries, numpy.zeros((0, 2, 2)))
@@ -0,0 +1,160 @@
+
+import unittest
+import copy
+import pickle
+
+from .. import Point, PointSequence, MutablePointSequence, Polygon
+
+
+class PointSequenceTestCase(unittest.TestCase):
+
+    def testPointSequenceHash(self):
+        '''
+        '''
+        p = [Point(1, 2), Point(3, 4), Point(5, 6)]
+        a = PointSequence(p)
+        b = PointSequence(list(reversed(p)))
+
+        self.assertTrue(a == b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len({a, b}), 1)
+        self.assertNotEqual(hash(a), hash(PointSequence(p[:2])))
+
+    def testPointSequenceEquality(self):
+        '''
+        '''
+        p = [Point(1, 2), Point(3, 4), Point(5, 6)]
+        a = PointSequence(p)
+        b = PointSequence(p[:2])
+
+        # equality is symmetric, a subset of the vertices is not equal
+        self.assertFalse(a == b)
+        self.assertFalse(b == a)
+        self.assertTrue(b != a)
+
+        # and agrees with the hash, which ignores repeated vertices
+        c = Polygon(p + [Point(1, 2)])
+        self.assertTrue(a == c)
+        self.assertTrue(c == a)
+        self.assertEqual(hash(a), hash(c))
+
+        self.assertFalse(a == p)
+        self.assertTrue(a != None)
+        self.assertFalse(a == Point(1, 2))
+        self.assertFalse(Point(1, 2) == a)
+
+    def testMutablePointSequenceHashInvalidation(self):
+        '''
+        '''
+        s = MutablePointSequence([Point(1, 2), Point(3, 4)])
+
+        h = hash(s)
+        s.append(Point(5, 6))
+        self.assertNotEqual(hash(s), h)
+
+        h = hash(s)
+        s[0] = Point(7, 8)
+        self.assertNotEqual(hash(s), h)
+
+        h = hash(s)
+        s.pop()
+        self.assertNotEqual(hash(s), h)
+
+        h = hash(s)
+        s *= 2
+        self.assertNotEqual(hash(s), h)
+
+        h = hash(s)
+        s.A = Point(9, 9)
+        self.assertNotEqual(hash(s), h)
+        self.assertEqual(hash(s), hash(PointSequence(list(s))))
+
+    def testPointSequenceBounds(self):
+        '''
+        '''
+        s = MutablePointSequence([Point(1, 2, 3), Point(-1, 5, 0)])
+        self.assertEqual(s.bounds, ((-1, 2, 0), (1, 5, 3)))
+        self.assertIs(s.bounds, s.bounds)
+        self.assertIsNone(PointSequence().bounds)
+
+        s.append(Point(4, 0, 0))
+        self.assertEqual(s.bounds, ((-1, 0, 0), (4, 5, 3)))
+
+        s.insert(0, Point(0, -3, 0))
+        self.assertEqual(s.bounds, ((-1, -3, 0), (4, 5, 3)))
+
+        s[0] = Point(0, 9, 0)
+        self.assertEqual(s.bounds, ((-1, 0, 0), (4, 9, 3)))
+
+        s.pop()
+        self.assertEqual(s.bounds, ((-1, 2, 0), (1, 9, 3)))
+
+        s *= 2
+        self.assertEqual(s.bounds, ((-2, 4, 0), (2, 18, 6)))
+
+    def testPointSequenceBoundsVertexChanges(self):
+        '''
+        '''
+        p = [Point(0, 0), Point(1, 1)]
+        a = PointSequence(p)
+        b = PointSequence(p)
+        self.assertEqual(a.bounds, ((0, 0, 0), (1, 1, 0)))
+        self.assertEqual(b.bounds, a.bounds)
+        h = hash(a)
+
+        p[1].x = 5
+        self.assertEqual(a.bounds, ((0, 0, 0), (5, 1, 0)))
+        self.assertEqual(b.bounds, a.bounds)
+        self.assertNotEqual(hash(a), h)
+
+        p[0].xyz = Point(-1, -1, -1)
+        self.assertEqual(a.bounds, ((-1, -1, -1), (5, 1, 0)))
+
+        p[0] += 10
+        self.assertEqual(a.bounds, ((5, 1, 0), (9, 9, 9)))
+
+        # a point removed from a sequence may still invalidate it,
+        # which costs a recomputation but is never wrong.
+        q = Point(p[1])
+        self.assertEqual(q, p[1])
+        q.y = 100
+        self.assertEqual(a.bounds, ((5, 1, 0), (9, 9, 9)))
+
+    def testPointSequenceBoundsCopies(self):
+        '''
+        '''
+        a = Polygon([Point(0, 0), Point(1, 0), Point(1, 1)])
+        self.assertEqual(a.bounds, ((0, 0, 0), (1, 1, 0)))
+        hash(a)
+
+        for b in [copy.deepcopy(a), pickle.loads(pickle.dumps(a)),
+                  copy.copy(a)]:
+            b.vertices[1].x = 9
+            self.assertEqual(b.bounds, ((0, 0, 0), (9, 1, 0)))
+            self.assertIn(Point(5, 0.1), b)
+            self.assertEqual(hash(b), hash(Polygon(list(b.vertices))))
+
+    def testPointSequenceRotate(self):
+        '''
+        '''
+        p = [Point(1, 2, 3), Point(3, 4, 5), Point(5, 6, 7)]
+        a = PointSequence(p)
+
+        r = a.rotate(10, 20, 30, origin=Point(1, 1, 1))
+        self.assertIsInstance(r, PointSequence)
+        self.assertEqual(len(r), 3)
+        for q, v in zip(r, p):
+            self.assertEqual(q, v.rotate(10, 20, 30, origin=Point(1, 1, 1)))
+        self.assertEqual(a[0], Point(1, 2, 3))
+
+        m = MutablePointSequence([Point(v) for v in p])
+        h = hash(m)
+        self.assertIs(m.irotate(10, 20, 30, origin=[1, 1, 1]), m)
+        self.assertEqual(list(m), list(r))
+        self.assertNotEqual(hash(m), h)
+
+        square = Polygon([[0, 0], [1, 0], [1, 1], [0, 1]])
+        r = square.rotate(0, 0, 90)
+        self.assertIsInstance(r, Polygon)
+        self.assertAlmostEqual(r.area, 1)
+        self.assertAlmostEqual(r.C.distance(Point(-1, 1)), 0)
@@ -0,0 +1,253 @@
+import unittest
+import numpy
+
+from .. import (Point, Polygon, MutablePolygon, PreparedPolygon, PointArray,
+                Triangle)
+from ..pointarray import shoelace
+
+
+class PolygonTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # a 'U' shape, concave with the notch open to the top
+        self.u = Polygon([Point(0, 0), Point(3, 0), Point(3, 3),
+                          Point(2, 3), Point(2, 1), Point(1, 1),
+                          Point(1, 3), Point(0, 3)])
+
+    def testPolygonContains(self):
+        '''
+        '''
+        square = Polygon([Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)])
+
+        self.assertTrue(Point(0.5, 0.5) in square)
+        self.assertFalse(Point(1.5, 0.5) in square)
+        self.assertTrue((0.25, 0.75) in square)
+
+        reversed_square = Polygon(list(reversed(square.vertices)))
+        self.assertTrue(Point(0.5, 0.5) in reversed_square)
+        self.assertFalse(Point(-0.5, 0.5) in reversed_square)
+
+    def testPolygonContainsConcave(self):
+        '''
+        '''
+        self.assertTrue(Point(0.5, 2) in self.u)
+        self.assertTrue(Point(2.5, 2) in self.u)
+        self.assertTrue(Point(1.5, 0.5) in self.u)
+        self.assertFalse(Point(1.5, 2) in self.u)
+        self.assertFalse(Point(1.5, 3.5) in self.u)
+        self.assertFalse(Point(-1, 2) in self.u)
+
+    def testPolygonContainsBoundary(self):
+        '''
+        '''
+        for p in self.u.vertices:
+            self.assertTrue(p in self.u)
+
+        for a, b in self.u.pairs():
+            self.assertTrue(a.midpoint(b) in self.u)
+
+        self.assertFalse(Point(1.5, 3) in self.u)
+        self.assertFalse(Point(4, 0) in self.u)
+
+    def testPolygonContainsPoints(self):
+        '''
+        '''
+        rng = numpy.random.default_rng(5)
+        xy = rng.uniform(-1, 4, (2000, 2))
+        xy[:8] = [p.xy for p in self.u.vertices]
+        xy[8:16] = [a.midpoint(b).xy for a, b in self.u.pairs()]
+
+        expected = [Point(x, y) in self.u for x, y in xy]
+
+        self.assertEqual(self.u.containsPoints(xy).tolist(), expected)
+        self.assertEqual(self.u.containsPoints(PointArray(xy)).tolist(),
+                         expected)
+        points = [Point(x, y) for x, y in xy[:10]]
+        self.assertEqual(self.u.containsPoints(points).tolist(), expected[:10])
+        self.assertTrue(all(expected[:16]))
+
+    def testPolygonContainsMutable(self):
+        '''
+        '''
+        triangle = MutablePolygon([Point(0, 0), Point(1, 0), Point(0, 1)])
+        self.assertFalse(Point(0.9, 0.9) in triangle)
+
+        triangle.insert(2, Point(1, 1))
+        self.assertTrue(Point(0.9, 0.9) in triangle)
+        self.assertTrue(triangle.containsPoints([Point(0.9, 0.9)])[0])
+
+    def testPolygonContainsBounds(self):
+        '''
+        '''
+        self.assertEqual(self.u.bounds, ((0, 0, 0), (3, 3, 0)))
+        self.assertFalse(Point(-1, 1) in self.u)
+        self.assertFalse(Point(1, 3.5) in self.u)
+        self.assertTrue(Point(3, 3) in self.u)
+        self.assertFalse(Point(0, 0) in Polygon())
+
+        u = Polygon([Point(v) for v in self.u.vertices])
+        self.assertFalse(Point(4, 1) in u)
+        u.vertices[1].x = 5
+        self.assertTrue(Point(4, 0.5) in u)
+
+    def testPolygonArea(self):
+        '''
+        '''
+        # the U is a 3 x 3 square less a 1 x 2 notch
+        self.assertEqual(self.u.signedArea, 7)
+        self.assertEqual(self.u.area, 7)
+        self.assertTrue(self.u.isCCW)
+
+        cw = Polygon(list(reversed(self.u.vertices)))
+        self.assertEqual(cw.signedArea, -7)
+        self.assertEqual(cw.area, 7)
+        self.assertFalse(cw.isCCW)
+
+        far = Polygon([p + Point(1e9, -1e9) for p in self.u.vertices])
+        self.assertEqual(far.signedArea, 7)
+
+        self.assertEqual(Polygon([Point(0, 0), Point(1, 1)]).area, 0)
+
+    def testPolygonCentroid(self):
+        '''
+        '''
+        # moments of the square less the notch, divided by the area
+        cx = ((9 * 1.5) - (2 * 1.5)) / 7
+        cy = ((9 * 1.5) - (2 * 2)) / 7
+        self.assertAlmostEqual(self.u.centroid.distance(Point(cx, cy)), 0)
+
+        cw = Polygon(list(reversed(self.u.vertices)))
+        self.assertAlmostEqual(cw.centroid.distance(Point(cx, cy)), 0)
+
+        line = Polygon([Point(0, 0), Point(2, 2)])
+        self.assertEqual(line.centroid, Point(1, 1))
+
+    def testPolygonAreaInvalidation(self):
+        '''
+        '''
+        square = MutablePolygon([Point(0, 0), Point(1, 0),
+                                 Point(1, 1), Point(0, 1)])
+        self.assertEqual(square.area, 1)
+        self.assertEqual(square.centroid, Point(0.5, 0.5))
+
+        square *= 2
+        self.assertEqual(square.area, 4)
+        self.assertEqual(square.centroid, Point(1, 1))
+
+        square.pop()
+        self.assertEqual(square.area, 2)
+
+        # vertices changed directly, before and after the bounds
+        square = Polygon([Point(0, 0), Point(4, 0),
+                          Point(4, 4), Point(0, 4)])
+        for x, area in ((8, 24), (6, 20)):
+            h = hash(square)
+            self.assertTrue(square.area)
+            square.vertices[2].x = x
+            self.assertEqual(square.area, area)
+            self.assertEqual(square.xy[2], (x, 4))
+            self.assertNotEqual(hash(square), h)
+            self.assertEqual(hash(square), hash(Polygon(list(square))))
+        self.assertEqual(square.bounds, ((0, 0, 0), (6, 4, 0)))
+
+    def testPolygonSides(self):
+        '''
+        '''
+        self.assertEqual(self.u.sides, [3, 3, 1, 2, 1, 2, 1, 3])
+        self.assertEqual(self.u.perimeter, 16)
+        self.assertEqual(self.u.midpoints[0], Point(1.5, 0))
+
+        t = Triangle(Point(0, 0), Point(4, 0), Point(0, 3))
+        self.assertEqual(t.incenter(), Point(1, 1))
+
+        # each vertex is weighted by the side opposite it, whichever
+        # vertex comes first
+        for i in range(3):
+            p = Polygon(t.vertices[i:] + t.vertices[:i])
+            self.assertEqual(p.incenter(), Point(1, 1))
+        p = Polygon([Point(1, 1), Point(7, 1), Point(1, 9)])
+        self.assertEqual(p.incenter(), Point(3, 3))
+
+        with self.assertRaises(ValueError):
+            self.u.incenter()
+
+    def testShoelace(self):
+        '''
+        '''
+        rng = numpy.random.default_rng(7)
+        polygons = [self.u, Polygon([Point(5, 5)])]
+        for n in rng.integers(3, 12, 50):
+            xy = rng.uniform(-10, 10, (n, 2))
+            polygons.append(Polygon([Point(x, y) for x, y in xy]))
+
+        vertices = numpy.array([xy for p in polygons for xy in p.xy])
+        offsets = numpy.cumsum([0] + [len(p) for p in polygons])
+
+        areas, centroids = shoelace(vertices, offsets)
+        self.assertEqual(areas.shape, (len(polygons),))
+        self.assertEqual(centroids.shape, (len(polygons), 2))
+        for p, area, centroid in zip(polygons, areas, centroids):
+            self.assertAlmostEqual(area, p.signedArea)
+            self.assertAlmostEqual(p.centroid.distance(centroid), 0)
+
+        areas, centroids = shoelace(PointArray(vertices), offsets)
+        self.assertAlmostEqual(areas[0], 7)
+
+        with self.assertRaises(ValueError):
+            shoelace(vertices, [0, 0, len(vertices)])
+
+
+class PreparedPolygonTestCase(unittest.TestCase):
+
+    def polygons(self):
+        '''
+        '''
+        rng = numpy.random.default_rng(11)
+
+        # a rectilinear comb, lots of horizontal edges and shared Ys
+        comb = [Point(0, 0), Point(9, 0)]
+        for i in range(9, 0, -2):
+            comb.extend([Point(i, 5), Point(i - 1, 5),
+                         Point(i - 1, 1), Point(i - 2, 1)])
+        yield Polygon(comb)
+
+        # star shaped polygons with random radii, usually concave
+        for n in [3, 5, 17, 100]:
+            t = numpy.sort(rng.uniform(0, 2 * numpy.pi, n))
+            r = rng.uniform(0.2, 1, n)
+            yield Polygon([Point(x, y) for x, y in
+                           zip(r * numpy.cos(t), r * numpy.sin(t))])
+
+    def queries(self, polygon, rng):
+        '''
+        '''
+        xy = numpy.array(polygon.xy)
+        lo, hi = xy.min(axis=0) - 0.5, xy.max(axis=0) + 0.5
+        q = rng.uniform(lo, hi, (500, 2))
+        q[:50] = numpy.round(q[:50])
+        midpoints = (xy + numpy.roll(xy, -1, axis=0)) / 2
+        return numpy.concatenate([q, xy, midpoints])
+
+    def testPreparedPolygonContains(self):
+        '''
+        '''
+        rng = numpy.random.default_rng(3)
+        for polygon in self.polygons():
+            prepared = polygon.prepare()
+            self.assertIsInstance(prepared, PreparedPolygon)
+            q = self.queries(polygon, rng)
+            expected = [Point(x, y) in polygon for x, y in q]
+            self.assertEqual([prepared.contains((x, y)) for x, y in q],
+                             expected)
+            self.assertEqual([Point(x, y) in prepared for x, y in q],
+                             expected)
+            self.assertEqual(prepared.containsPoints(q).tolist(), expected)
+
+    def testPreparedPolygonStatistics(self):
+        '''
+        '''
+        polygon = Polygon([Point(0, 0), Point(2, 0), Point(1, 2)])
+        prepared = PreparedPolygon(polygon)
+        self.assertGreaterEqual(prepared.buildTime, 0)
+        self.assertGreater(prepared.memory, 0)
+        self.assertEqual(prepared.slabEntries, 2)
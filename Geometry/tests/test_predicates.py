@@ -0,0 +1,129 @@
+import unittest
+from fractions import Fraction
+
+from .. import Point
+from ..point import (orient2d, orient3d, incircle,
+                     predicateCounts, resetPredicateCounts)
+
+
+def _sign(value):
+    return (value > 0) - (value < 0)
+
+
+def _exactOrient2d(a, b, c):
+    ax, ay, bx, by, cx, cy = map(Fraction, a + b + c)
+    return _sign(((ax - cx) * (by - cy)) - ((ay - cy) * (bx - cx)))
+
+
+def _exactIncircle(a, b, c, d):
+    ax, ay, bx, by, cx, cy, dx, dy = map(Fraction, a + b + c + d)
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+    return _sign((((adx * adx) + (ady * ady)) * ((bdx * cdy) - (cdx * bdy))) +
+                 (((bdx * bdx) + (bdy * bdy)) * ((cdx * ady) - (adx * cdy))) +
+                 (((cdx * cdx) + (cdy * cdy)) * ((adx * bdy) - (bdx * ady))))
+
+
+class PredicatesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        resetPredicateCounts()
+
+    def testOrient2dSimple(self):
+        self.assertGreater(orient2d((0, 0), (1, 0), (0, 1)), 0)
+        self.assertLess(orient2d((0, 0), (0, 1), (1, 0)), 0)
+        self.assertEqual(orient2d((0, 0), (1, 1), (2, 2)), 0)
+
+        a, b, c = Point(0, 0), Point(2, 0), Point(1, 1)
+        self.assertEqual(_sign(orient2d(a, b, c)), _sign(a.ccw(b, c)))
+
+        # only the collinear case is too close to call with floats
+        self.assertEqual(predicateCounts['orient2d'], 4)
+        self.assertEqual(predicateCounts['orient2d.exact'], 1)
+
+    def testOrient2dNearlyCollinear(self):
+        # points marching across the line y = x in steps of one ulp,
+        # the float determinant gets most of these signs wrong.
+        b, c = (24.0, 24.0), (12.0, 12.0)
+        ulp = 2.0 ** -53
+        for i in range(64):
+            for j in range(64):
+                a = (0.5 + i * ulp, 0.5 + j * ulp)
+                self.assertEqual(_sign(orient2d(a, b, c)),
+                                 _exactOrient2d(a, b, c), (i, j))
+
+        self.assertEqual(predicateCounts['orient2d'], 64 * 64)
+        self.assertGreater(predicateCounts['orient2d.exact'], 0)
+
+    def testOrient2dTinyDeterminant(self):
+        # the exact determinant underflows a float, the sign must not
+        a, b, c = (0.0, 0.0), (2.0 ** -600, 2.0 ** -600), (1.0, 1.0 + 2 ** -52)
+        self.assertEqual(_sign(orient2d(a, b, c)), _exactOrient2d(a, b, c))
+
+    def testPointCCWRobust(self):
+        a = Point(0.5 + 2.0 ** -52, 0.5)
+        b = Point(12, 12)
+        c = Point(24, 24)
+
+        expected = _exactOrient2d((a.x, a.y), (b.x, b.y), (c.x, c.y))
+        self.assertEqual(_sign(a.ccw(b, c, robust=True)), expected)
+
+        a = Point(0, 0.5 + 2.0 ** -52, 0.5)
+        b = Point(0, 12, 12)
+        c = Point(0, 24, 24)
+        self.assertEqual(_sign(a.ccw(b, c, 'x', robust=True)), expected)
+
+        self.assertFalse(Point(0, 0).isCollinear(a, b, robust=True))
+        self.assertTrue(Point(0, 1, 1).isCollinear(b, c, robust=True))
+
+    def testOrient3d(self):
+        a, b, c = (0, 0, 0), (1, 0, 0), (0, 1, 0)
+
+        self.assertGreater(orient3d(a, b, c, (0, 0, -1)), 0)
+        self.assertLess(orient3d(a, b, c, (0, 0, 1)), 0)
+        self.assertEqual(orient3d(a, b, c, (5, 7, 0)), 0)
+        self.assertEqual(orient3d(a, b, c, (0, 0, -1)), 6 * (1 / 6))
+
+        d = (0.5, 0.5, 2.0 ** -80)
+        self.assertLess(orient3d(a, b, c, d), 0)
+
+        self.assertEqual(predicateCounts['orient3d'], 5)
+
+    def testOrient3dDegenerate(self):
+        # four points on a tilted plane, nudged by an ulp
+        a = Point(0.1, 0.2, 0.3)
+        b = Point(1.1, 0.7, 0.3)
+        c = Point(0.3, 1.9, 0.3)
+        for k in range(-3, 4):
+            d = Point(0.7, 0.9, 0.3 + k * 2.0 ** -54)
+            self.assertEqual(_sign(orient3d(a, b, c, d)), -_sign(k))
+
+        self.assertGreater(predicateCounts['orient3d.exact'], 0)
+
+    def testIncircle(self):
+        a, b, c = (1, 0), (0, 1), (-1, 0)
+
+        self.assertGreater(incircle(a, b, c, (0, 0)), 0)
+        self.assertLess(incircle(a, b, c, (2, 2)), 0)
+        self.assertEqual(incircle(a, b, c, (0, -1)), 0)
+
+        self.assertEqual(predicateCounts['incircle'], 3)
+        self.assertEqual(predicateCounts['incircle.exact'], 1)
+
+    def testIncircleNearlyCocircular(self):
+        a, b, c = (1.0, 0.0), (0.0, 1.0), (-1.0, 0.0)
+        ulp = 2.0 ** -52
+        for i in range(-8, 9):
+            for j in range(-8, 9):
+                d = (0.6 + i * ulp, -0.8 + j * ulp)
+                self.assertEqual(_sign(incircle(a, b, c, d)),
+                                 _exactIncircle(a, b, c, d), (i, j))
+
+        self.assertGreater(predicateCounts['incircle.exact'], 0)
+
+    def testResetPredicateCounts(self):
+        orient2d((0, 0), (1, 0), (0, 1))
+        self.assertEqual(predicateCounts['orient2d'], 1)
+        resetPredicateCounts()
+        self.assertEqual(predicateCounts['orient2d'], 0)
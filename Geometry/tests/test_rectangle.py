@@ -1,9 +1,129 @@
 
 import unittest
+import math
+import random
 
-from .. import Point, Triangle
+from .. import Point, Triangle, Rectangle, Line, Segment, Ray
 from ..exceptions import *
 
 
 class RectangleTestCase(unittest.TestCase):
-    pass
+
+    def testRectangleUnion(self):
+        a = Rectangle(Point(0, 0), 2, 1)
+        b = Rectangle(Point(1, -1), 3, 1)
+
+        u = a.union(b)
+        self.assertEqual(u, Rectangle(Point(0, -1), 4, 2))
+        self.assertEqual(b.union(a), u)
+        self.assertEqual(a.union(a), a)
+
+    def testRectangleIntersect(self):
+        a = Rectangle(Point(0, 0), 2, 2)
+
+        self.assertEqual(a.intersect(Rectangle(Point(1, 1), 2, 2)),
+                         Rectangle(Point(1, 1), 1, 1))
+        self.assertEqual(a.intersect(Rectangle(Point(2, 0), 1, 1)),
+                         Rectangle(Point(2, 0), 0, 1))
+        self.assertIsNone(a.intersect(Rectangle(Point(3, 3), 1, 1)))
+
+    def testRectangleTheta(self):
+        a = Rectangle(Point(1, 1), 2, 1, 90)
+        self.assertEqual(a.theta, 90)
+        self.assertEqual(a.area, 2)
+
+        for corner, expected in zip(a.vertices, [(1, 1), (1, 3),
+                                                 (0, 3), (0, 1)]):
+            self.assertAlmostEqual(corner.distance(Point(expected)), 0)
+        self.assertAlmostEqual(a.center.distance(Point(0.5, 2)), 0)
+        self.assertAlmostEqual(a.minX, 0)
+        self.assertAlmostEqual(a.maxY, 3)
+
+        self.assertTrue(a.containsPoint(Point(0.5, 2.5)))
+        self.assertFalse(a.containsPoint(Point(1.5, 1.5)))
+        self.assertNotEqual(a, Rectangle(Point(1, 1), 2, 1))
+        self.assertIn('theta=90.0', str(a))
+
+        a.center = Point(0, 0)
+        self.assertAlmostEqual(a.center.distance(Point(0, 0)), 0)
+        self.assertAlmostEqual(a.origin.distance(Point(0.5, -1)), 0)
+
+    def testRectangleCorners(self):
+        a = Rectangle(Point(0, 0), 2, 1)
+        self.assertEqual(a.vertices, [Point(0, 0), Point(2, 0),
+                                      Point(2, 1), Point(0, 1)])
+        self.assertEqual(a.midAB, Point(1, 0))
+        self.assertEqual(a.midCD, Point(1, 1))
+        self.assertTrue(a.containsPoint(Point(2, 1)))
+        self.assertFalse(a.containsPoint(Point(2.5, 1)))
+
+        a.C = Point(5, 5)
+        self.assertEqual(a.A, Point(3, 4))
+
+        b = Rectangle(Point(0, 0), 2, 2, 45)
+        self.assertAlmostEqual(b.maxY, math.sqrt(8))
+        self.assertAlmostEqual(b.midX, 0)
+
+    def testRectangleClip(self):
+        a = Rectangle(Point(0, 0), 4, 2)
+
+        self.assertEqual(a.clip(Segment(Point(-1, 1), Point(5, 1))),
+                         Segment(Point(0, 1), Point(4, 1)))
+        self.assertEqual(a.clip(Segment(Point(1, 1), Point(2, 1))),
+                         Segment(Point(1, 1), Point(2, 1)))
+        self.assertEqual(a.clip(Line(Point(0, -1), Point(1, 0))),
+                         Segment(Point(1, 0), Point(3, 2)))
+        self.assertEqual(a.clip(Ray(Point(2, 1), Point(3, 1))),
+                         Segment(Point(2, 1), Point(4, 1)))
+
+        # touching a corner or an edge is visible
+        c = a.clip(Segment(Point(4, 0), Point(5, -1)))
+        self.assertEqual((c.A, c.B), (Point(4, 0), Point(4, 0)))
+        self.assertEqual(a.clip(Segment(Point(-1, 2), Point(5, 2))),
+                         Segment(Point(0, 2), Point(4, 2)))
+
+        for missing in [Segment(Point(5, 5), Point(6, 6)),
+                        Segment(Point(-1, 3), Point(5, 3)),
+                        Ray(Point(5, 1), Point(6, 1)),
+                        Line(Point(0, 3), Point(1, 4))]:
+            self.assertIsNone(a.clip(missing))
+
+        # rotated by 90 degrees the rectangle covers x in [-2, 0]
+        b = Rectangle(Point(0, 0), 4, 2, 90)
+        c = b.clip(Segment(Point(-3, 1), Point(1, 1)))
+        self.assertAlmostEqual(c.A.distance(Point(-2, 1)), 0)
+        self.assertAlmostEqual(c.B.distance(Point(0, 1)), 0)
+
+        # lines without a direction are a single point
+        for cls in (Line, Ray, Segment):
+            c = a.clip(cls(Point(1, 1), Point(1, 1)))
+            self.assertEqual((c.A, c.B), (Point(1, 1), Point(1, 1)))
+            self.assertIsNone(a.clip(cls(Point(5, 1), Point(5, 1))))
+        c = a.clip(Line(Point(4, 2), Point(4, 2)))
+        self.assertEqual((c.A, c.B), (Point(4, 2), Point(4, 2)))
+
+        mask, ends = a.clipSegments([((1, 1), (1, 1)), ((5, 1), (5, 1))])
+        self.assertEqual(mask.tolist(), [True, False])
+        self.assertEqual(ends[0].tolist(), [[1, 1], [1, 1]])
+
+    def testRectangleClipSegments(self):
+        rng = random.Random(25)
+        ends = [((rng.uniform(-1, 2), rng.uniform(-1, 2)),
+                 (rng.uniform(-1, 2), rng.uniform(-1, 2)))
+                for _ in range(500)]
+
+        for a in [Rectangle(Point(0, 0), 1, 1),
+                  Rectangle(Point(0.2, 0.3), 0.5, -0.3, 30)]:
+            mask, clipped = a.clipSegments(ends)
+            self.assertEqual(clipped.shape, (500, 2, 2))
+            self.assertTrue(mask.any() and not mask.all())
+            for i, (p, q) in enumerate(ends):
+                c = a.clip(Segment(Point(p), Point(q)))
+                self.assertEqual(c is not None, mask[i])
+                if c is None:
+                    self.assertTrue(math.isnan(clipped[i, 0, 0]))
+                    continue
+                for point, xy in zip((c.A, c.B), clipped[i].tolist()):
+                    self.assertAlmostEqual(point.distance(Point(xy)), 0)
+                if a.containsPoint(Point(p)):
+                    self.assertEqual(tuple(clipped[i, 0]), p)
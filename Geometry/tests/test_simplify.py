@@ -0,0 +1,165 @@
+import unittest
+import itertools
+import math
+
+import numpy
+
+from .. import Point, PointSequence, Polygon, PointArray
+from ..simplify import (douglasPeucker, visvalingamWhyatt, simplify,
+                        crossingSegments)
+from ..pointarray import intersectSegments
+
+
+class SimplifyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # a line with a small bump which doubles back underneath
+        # itself, dropping the bump makes the line cross itself.
+        self.fold = numpy.array([(0, 0), (5, 0.4), (10, 0), (10, -1),
+                                 (5, 0.3), (0, -1)])
+
+        self.square = Polygon([Point(0, 0), Point(1, 0), Point(2, 0),
+                               Point(2, 1), Point(2, 2), Point(1, 2.01),
+                               Point(0, 2), Point(0, 1)])
+
+    def testDouglasPeucker(self):
+        zigzag = numpy.array([(x, 0.01 * (x % 2)) for x in range(11)])
+
+        self.assertEqual(douglasPeucker(zigzag, 0.1).tolist(), [0, 10])
+        self.assertEqual(douglasPeucker(zigzag, 0.001).tolist(),
+                         list(range(11)))
+
+        corner = numpy.array([(0, 0), (1, 0.05), (2, 0), (2, 1), (2, 2)])
+        self.assertEqual(douglasPeucker(corner, 0.1).tolist(), [0, 2, 4])
+
+    def testDouglasPeuckerClosed(self):
+        keep = douglasPeucker(self.square, 0.1, closed=True)
+        self.assertEqual(keep.tolist(), [0, 2, 4, 6])
+
+        keep = douglasPeucker(self.square, 0.001, closed=True)
+        self.assertEqual(keep.tolist(), [0, 2, 4, 5, 6])
+
+        # rings keep a triangle however large the tolerance
+        self.assertEqual(len(douglasPeucker(self.square, 10, closed=True)), 3)
+
+        # even when all the vertices coincide
+        for count in (3, 7):
+            ring = Polygon([Point(1, 1)] * count)
+            for method in ('douglas-peucker', 'visvalingam-whyatt'):
+                for preserve in (False, True):
+                    result = ring.simplify(0.5, method,
+                                           preserveTopology=preserve)
+                    self.assertEqual(result.vertices, [Point(1, 1)] * 3)
+
+    def testVisvalingamWhyatt(self):
+        line = numpy.array([(0, 0), (1, 0.1), (2, 0), (3, 2), (4, 0)])
+
+        self.assertEqual(visvalingamWhyatt(line, 0.5).tolist(), [0, 2, 3, 4])
+        self.assertEqual(visvalingamWhyatt(line, 0.01).tolist(),
+                         list(range(5)))
+        self.assertEqual(visvalingamWhyatt(line, 100).tolist(), [0, 4])
+
+        keep = visvalingamWhyatt(self.square, 0.1, closed=True)
+        self.assertEqual(keep.tolist(), [0, 2, 4, 6])
+        self.assertEqual(len(visvalingamWhyatt(self.square, 10,
+                                               closed=True)), 3)
+
+    def testVisvalingamWhyattRuns(self):
+        # long runs of equal areas go a few at a time, not one by one
+        count = 100001
+        bump = numpy.column_stack([numpy.arange(count, dtype=float),
+                                   numpy.zeros(count)])
+        bump[50000, 1] = 5
+        self.assertEqual(visvalingamWhyatt(bump, 1).tolist(),
+                         [0, 49999, 50000, 50001, 100000])
+        self.assertEqual(visvalingamWhyatt(bump, 1, closed=True).tolist(),
+                         [49999, 50000, 50001])
+
+        angles = numpy.linspace(0, 2 * math.pi, 1000, endpoint=False)
+        circle = numpy.column_stack([numpy.cos(angles), numpy.sin(angles)])
+        for tolerance, expected in ((1e-9, 1000), (1e-4, 79), (10, 3)):
+            keep = visvalingamWhyatt(circle, tolerance, closed=True)
+            self.assertEqual(len(keep), expected)
+
+    def testPreserveTopology(self):
+        for method, tolerance in ((douglasPeucker, 0.5),
+                                  (visvalingamWhyatt, 2.2)):
+            keep = method(self.fold, tolerance).tolist()
+            self.assertEqual(keep, [0, 2, 3, 4, 5])
+            self.assertTrue(crossingSegments(self.fold, keep))
+
+            keep = method(self.fold, tolerance, preserveTopology=True)
+            self.assertEqual(keep.tolist(), [0, 1, 2, 3, 4, 5])
+
+    def testPreserveTopologySelfCrossing(self):
+        # a bumpy line which loops back across itself, followed by
+        # the fold
+        loop = numpy.array([(0, 5), (2, 5.05), (4, 5), (6, 5.05), (8, 5),
+                            (10, 5), (10, 10), (5, 10), (5, 7), (5, 3),
+                            (5, 0)])
+        xy = numpy.concatenate([loop, self.fold + (20, 0)])
+
+        for method, tolerance in ((douglasPeucker, 0.5),
+                                  (visvalingamWhyatt, 2.2)):
+            keep = method(loop, tolerance, preserveTopology=True).tolist()
+            self.assertEqual(keep, [0, 5, 6, 7, 10])
+            self.assertEqual(crossingSegments(loop, keep), {(0, 5), (7, 10)})
+
+            # the crossing the fold gains is still repaired
+            keep = method(xy, tolerance, preserveTopology=True).tolist()
+            self.assertEqual(keep[:5], [0, 5, 6, 7, 10])
+            self.assertIn(12, keep)
+            self.assertEqual(crossingSegments(xy, keep), {(0, 5), (7, 10)})
+
+    def testCrossingSegments(self):
+        rng = numpy.random.default_rng(3)
+        for trial in range(20):
+            # small integer grids give many touching and collinear
+            # segments
+            xy = rng.integers(0, 4 + trial, (30, 2)).astype(float)
+            keep = list(range(30))
+            expected = set()
+            for i, j in itertools.combinations(range(29), 2):
+                if j == i + 1:
+                    continue
+                mask, p, t, u = intersectSegments([xy[i:i + 2]],
+                                                  [xy[j:j + 2]])
+                if mask[0]:
+                    expected |= {(i, i + 1), (j, j + 1)}
+            self.assertEqual(crossingSegments(xy, keep), expected)
+
+    def testPreserveTopologyRandom(self):
+        rng = numpy.random.default_rng(17)
+        count = 200
+        angles = numpy.linspace(0, 2 * math.pi, count, endpoint=False)
+        for trial in range(10):
+            r = rng.uniform(0.2, 1, count)
+            xy = numpy.column_stack([r * numpy.cos(angles),
+                                     r * numpy.sin(angles)])
+            # spiral the ring inwards so that its turns nest
+            xy *= numpy.linspace(1, 0.3, count)[:, numpy.newaxis]
+            self.assertFalse(crossingSegments(xy, list(range(count))))
+            for method, tolerance in ((douglasPeucker, 0.2),
+                                      (visvalingamWhyatt, 0.02)):
+                keep = method(xy, tolerance, preserveTopology=True)
+                self.assertFalse(crossingSegments(xy, keep.tolist()))
+
+    def testSimplifyMethods(self):
+        line = PointSequence([Point(x, 0.01 * (x % 2)) for x in range(11)])
+
+        result = line.simplify(0.1)
+        self.assertIsInstance(result, PointSequence)
+        self.assertEqual(result.vertices, [Point(0, 0), Point(10, 0)])
+        self.assertFalse(result.vertices[0] is line.vertices[0])
+
+        result = self.square.simplify(0.1, 'visvalingam-whyatt')
+        self.assertIsInstance(result, Polygon)
+        self.assertEqual(len(result.vertices), 4)
+        self.assertEqual(result.area, 4)
+
+        array = PointArray(self.square.vertices)
+        self.assertEqual(len(array.simplify(0.1, closed=True)), 4)
+        self.assertEqual(len(array.simplify(0.1)), 5)
+
+        with self.assertRaises(ValueError):
+            simplify(line, 0.1, 'nearest')
@@ -0,0 +1,152 @@
+import unittest
+import itertools
+import random
+
+from .. import Point, Segment
+from .. import sweep
+from ..sweep import segmentIntersections, _endpoints, _cross, _meet, _Blocks
+
+
+def _bruteForce(segments, endpoints=True):
+    '''
+    The pairs of segments which meet, testing every pair.
+    '''
+    ends = _endpoints(segments)
+    pairs = set()
+    for i, j in itertools.combinations(range(len(ends)), 2):
+        (a, b), (c, d) = ends[i], ends[j]
+        d1, d2 = _cross(a, b, c), _cross(a, b, d)
+        d3, d4 = _cross(c, d, a), _cross(c, d, b)
+        if (d1 * d2) > 0 or (d3 * d4) > 0:
+            continue
+        if d1 == 0 and d2 == 0:
+            first, last = max(a, c), min(b, d)
+            if first > last:
+                continue
+            if not endpoints and first == last and first in (a, b) and \
+               first in (c, d):
+                continue
+        elif not endpoints:
+            q = _meet(ends[i], ends[j])
+            if q is not None and q in (a, b) and q in (c, d):
+                continue
+        pairs.add((i, j))
+    return pairs
+
+
+class SweepTestCase(unittest.TestCase):
+
+    def assertSweep(self, segments, endpoints=True):
+        found = segmentIntersections(segments, endpoints)
+        pairs = [(i, j) for i, j, p in found]
+        self.assertEqual(len(pairs), len(set(pairs)))
+        self.assertEqual(set(pairs), _bruteForce(segments, endpoints))
+        return found
+
+    def testCross(self):
+        segments = [Segment(Point(0, 0), Point(2, 2)),
+                    Segment(Point(0, 2), Point(2, 0)),
+                    Segment(Point(3, 0), Point(4, 0))]
+        found = segmentIntersections(segments)
+        self.assertEqual(len(found), 1)
+        i, j, p = found[0]
+        self.assertEqual((i, j), (0, 1))
+        self.assertEqual(p, Point(1, 1))
+
+    def testInputs(self):
+        import numpy
+        xy = [((0, 0), (2, 2)), ((0, 2), (2, 0)), ((1, -1), (1, 3))]
+        expected = {(0, 1), (0, 2), (1, 2)}
+        for segments in (xy, numpy.array(xy),
+                         [Segment(Point(a), Point(b)) for a, b in xy]):
+            found = segmentIntersections(segments)
+            self.assertEqual({(i, j) for i, j, p in found}, expected)
+            for i, j, p in found:
+                self.assertEqual(p, Point(1, 1))
+
+        self.assertEqual(segmentIntersections([]), [])
+        self.assertEqual(segmentIntersections(xy[:1]), [])
+
+    def testEndpoints(self):
+        # a path and two segments meeting at their ends
+        xy = [((0, 0), (1, 0)), ((1, 0), (1, 1)), ((1, 1), (0, 0)),
+              ((5, 5), (6, 5)), ((6, 5), (7, 5))]
+        self.assertEqual(len(segmentIntersections(xy)), 4)
+        self.assertEqual(segmentIntersections(xy, endpoints=False), [])
+
+        # a segment ending on another counts either way
+        tee = [((0, 0), (2, 0)), ((1, 0), (1, 1))]
+        self.assertEqual(len(segmentIntersections(tee, False)), 1)
+
+    def testOverlapping(self):
+        xy = [((0, 0), (2, 0)), ((1, 0), (3, 0)), ((0, 0), (2, 0)),
+              ((4, 0), (5, 0)), ((2, 0), (4, 0))]
+        self.assertSweep(xy)
+        found = self.assertSweep(xy, endpoints=False)
+        self.assertIn((0, 2), {(i, j) for i, j, p in found})
+
+    def testVertical(self):
+        xy = [((1, 0), (1, 4)), ((1, 2), (1, 6)), ((0, 3), (2, 3)),
+              ((0, 0), (2, 4)), ((1, 5), (3, 5))]
+        self.assertSweep(xy)
+        self.assertSweep(xy, endpoints=False)
+
+    def testRoundedSharedEnd(self):
+        # the crossing of these two rounds to just past their shared end
+        xy = [((-26.26393828566996, -3.963152102335123),
+               (-24.939393312218435, -4.874093112305366)),
+              ((-24.939393312218435, -4.874093112305366),
+               (-27.22226107235033, -3.576972424393192))]
+        found = segmentIntersections(xy)
+        self.assertEqual([(i, j) for i, j, p in found], [(0, 1)])
+        self.assertEqual(found[0][2], Point(*xy[0][1]))
+
+    def testRandomAgainstBruteForce(self):
+        rng = random.Random(21)
+        for trial in range(60):
+            count = rng.randint(1, 40)
+            if trial % 3 == 0:
+                xy = [((rng.random(), rng.random()),
+                       (rng.random(), rng.random()))
+                      for _ in range(count)]
+            else:
+                # small integer grids give many shared and collinear points
+                g = 4 if trial % 3 == 1 else 2
+                xy = [((rng.randint(0, g), rng.randint(0, g)),
+                       (rng.randint(0, g), rng.randint(0, g)))
+                      for _ in range(count)]
+            self.assertSweep(xy)
+            self.assertSweep(xy, endpoints=False)
+
+    def testBlocks(self):
+        # small blocks, so that segments move between many of them
+        load, sweep._Load = sweep._Load, 4
+        try:
+            items = _Blocks()
+            for value in range(50):
+                end = (len(items.blocks) - 1, len(items.blocks[-1]))
+                items.replace(end, end, [value])
+            self.assertTrue(len(items.blocks) > 5)
+            for value in range(0, 50, 3):
+                items.remove(value)
+            end = (len(items.blocks) - 1, len(items.blocks[-1]))
+            self.assertEqual(items.entries((0, 0), end),
+                             [v for v in range(50) if v % 3])
+            with self.assertRaises(ValueError):
+                items.remove(3)
+
+            rng = random.Random(8)
+            for trial in range(20):
+                count = rng.randint(20, 80)
+                g = 6 + trial
+                xy = [((rng.randint(0, g), rng.randint(0, g)),
+                       (rng.randint(0, g), rng.randint(0, g)))
+                      for _ in range(count)]
+                self.assertSweep(xy)
+                self.assertSweep(xy, endpoints=False)
+
+            # many segments through one point span several blocks
+            star = [((-i - 1, -1), (i + 1, 1)) for i in range(30)]
+            self.assertEqual(len(self.assertSweep(star)), 30 * 29 // 2)
+        finally:
+            sweep._Load = load
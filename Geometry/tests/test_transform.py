@@ -0,0 +1,228 @@
+import unittest
+import math
+import numpy
+
+from .. import (Point, PointSequence, PointArray, Polygon, Triangle,
+                Rectangle, Ellipse, Circle, Segment, Transform)
+from ..graph import Node
+from ..packed import PackedPointSequence, PackedPolygon
+
+
+class TransformTestCase(unittest.TestCase):
+
+    def assertPointsEqual(self, a, b, places=7):
+        '''
+        '''
+        self.assertAlmostEqual(Point(a).distance(b), 0, places)
+
+    def testTransformCreation(self):
+        '''
+        '''
+        t = Transform()
+        self.assertTrue(t.isAffine)
+        self.assertEqual(t, Transform([[1, 0, 0, 0], [0, 1, 0, 0],
+                                       [0, 0, 1, 0], [0, 0, 0, 1]]))
+        self.assertEqual(Transform(t), t)
+        self.assertIsNot(Transform(t).matrix, t.matrix)
+
+        with self.assertRaises(ValueError):
+            Transform([[1, 0], [0, 1]])
+
+    def testTransformTranslation(self):
+        '''
+        '''
+        p = Point(1, 2, 3)
+        self.assertEqual(Transform.translation(1, 2, 3)(p), Point(2, 4, 6))
+        self.assertEqual(Transform.translation(p)(p), Point(2, 4, 6))
+        self.assertEqual(p, Point(1, 2, 3))
+
+    def testTransformScaling(self):
+        '''
+        '''
+        p = Point(1, 2, 3)
+        self.assertEqual(Transform.scaling(2)(p), Point(2, 4, 6))
+        self.assertEqual(Transform.scaling(2, 3, 4)(p), Point(2, 6, 12))
+        self.assertEqual(Transform.scaling(2, origin=[1, 1, 1])(p),
+                         Point(1, 3, 5))
+
+    def testTransformRotation(self):
+        '''
+        '''
+        p = Point(1, 2, 3)
+        o = Point(-1, 0, 2)
+        t = Transform.rotation(10, 20, 30, origin=o)
+        self.assertPointsEqual(t(p), p.rotate(10, 20, 30, origin=o))
+
+        t = Transform.rotation(0, 0, math.pi / 2, radians=True)
+        self.assertPointsEqual(t(Point(1, 0, 5)), Point(0, 1, 5))
+
+    def testTransformShearing(self):
+        '''
+        '''
+        t = Transform.shearing(xy=2, zx=1)
+        self.assertEqual(t(Point(1, 1, 1)), Point(3, 1, 2))
+
+    def testTransformComposition(self):
+        '''
+        '''
+        p = Point(1, 0)
+        a = Transform.translation(1, 0)
+        b = Transform.rotation(0, 0, 90)
+
+        self.assertPointsEqual((b * a)(p), Point(0, 2))
+        self.assertPointsEqual((a * b)(p), Point(1, 1))
+        self.assertEqual(a.then(b), b * a)
+        self.assertEqual(a @ b, a * b)
+
+        t = Transform().translate(1, 0).rotate(0, 0, 90).scale(2).shear(xy=1)
+        expected = p + Point(1, 0)
+        expected = expected.rotate(0, 0, 90) * 2
+        expected.x += expected.y
+        self.assertPointsEqual(t(p), expected)
+
+    def testTransformInverse(self):
+        '''
+        '''
+        t = Transform().translate(1, 2, 3).rotate(10, 20, 30).scale(2, 3, 4)
+        p = Point(5, -6, 7)
+        self.assertPointsEqual(t.inverse()(t(p)), p)
+        self.assertTrue(numpy.allclose((t * t.inverse()).matrix,
+                                       numpy.identity(4)))
+
+        with self.assertRaises(ValueError):
+            Transform.scaling(0).inverse()
+
+    def testTransformProjective(self):
+        '''
+        '''
+        t = Transform([[1, 0, 0, 0], [0, 1, 0, 0],
+                       [0, 0, 1, 0], [0, 0, 1, 0]])
+        self.assertFalse(t.isAffine)
+        self.assertPointsEqual(t(Point(2, 4, 2)), Point(1, 2, 1))
+
+    def testTransformShapes(self):
+        '''
+        '''
+        t = Transform.translation(1, 2)
+
+        a = PointArray([[0, 0, 0], [1, 1, 1]])
+        b = t(a)
+        self.assertEqual(b[1], Point(2, 3, 1))
+        self.assertEqual(a[1], Point(1, 1, 1))
+        self.assertIs(t.iapply(a), a)
+        self.assertEqual(a, b)
+
+        s = PointSequence([(0, 0), Point(1, 1)])
+        r = t(s)
+        self.assertIsInstance(r, PointSequence)
+        self.assertEqual(list(r), [Point(1, 2), Point(2, 3)])
+        self.assertEqual(s[0], (0, 0))
+
+        empty = t(PointSequence())
+        self.assertIsInstance(empty, PointSequence)
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(len(t(PointArray())), 0)
+
+        for cls in (PackedPointSequence, PackedPolygon):
+            packed = cls([(0, 0), (1, 0), (1, 1)])
+            expected = cls([(1, 2), (2, 2), (2, 3)])
+            moved = t(packed)
+            self.assertIsInstance(moved, cls)
+            self.assertEqual(moved, expected)
+            self.assertEqual(packed[0], Point(0, 0))
+            bounds = packed.bounds
+            self.assertIs(t.iapply(packed), packed)
+            self.assertEqual(packed, expected)
+            self.assertNotEqual(packed.bounds, bounds)
+        self.assertEqual(packed.area, 0.5)
+        self.assertEqual(len(t(PackedPolygon())), 0)
+
+        p = Polygon([Point(0, 0), Point(1, 0), Point(1, 1)])
+        h = hash(p)
+        self.assertIs(t.iapply(p), p)
+        self.assertEqual(p.B, Point(2, 2))
+        self.assertNotEqual(hash(p), h)
+
+        triangle = t(Triangle())
+        self.assertIsInstance(triangle, Triangle)
+        self.assertEqual(triangle.C, Point(1, 3))
+
+        segment = t(Segment([0, 0], [1, 1]))
+        self.assertEqual(segment.A, Point(1, 2))
+        self.assertEqual(segment.B, Point(2, 3))
+
+        circle = t(Circle([1, 1], 3))
+        self.assertEqual(circle.center, Point(2, 3))
+        self.assertEqual(circle.radius, 3)
+
+        rectangle = t(Rectangle([1, 1]))
+        self.assertEqual(rectangle.origin, Point(2, 3))
+
+        points = [Point(0, 0), (1, 1)]
+        self.assertIs(t.iapply(points), points)
+        self.assertEqual(points, [Point(1, 2), Point(2, 3)])
+
+        node = t(Node(1, 1))
+        self.assertIsInstance(node, Node)
+        self.assertEqual(node, Point(2, 3))
+
+        view = a[0]
+        moved = t(view)
+        self.assertEqual(type(moved), Point)
+        self.assertEqual(view, Point(1, 2, 0))
+
+    def testTransformRectangle(self):
+        '''
+        '''
+        for t in [Transform.rotation(0, 0, 30, origin=[1, 1]),
+                  Transform.rotation(0, 0, 90).translate(5, -2, 1),
+                  Transform.scaling(2, origin=[3, 0]).rotate(0, 0, -45),
+                  Transform.scaling(1, -1).translate(1, 2),
+                  Transform.rotation(180, 0, 0).scale(0.5)]:
+            r = Rectangle([1, 2, 3], 4, 1, 20)
+            corners = [t(v) for v in r.vertices]
+            self.assertIs(t.iapply(r), r)
+
+            # the same corners, in some order
+            for v in r.vertices:
+                self.assertAlmostEqual(min(v.distance(c) for c in corners),
+                                       0)
+            self.assertAlmostEqual(r.width * r.height,
+                                   4 * abs(numpy.linalg.det(t.matrix[:2, :2])))
+            self.assertPointsEqual(r.origin, corners[0])
+
+        r = Rectangle([1, 1], 4, 1)
+        moved = Transform.scaling(2).rotate(0, 0, 90)(r)
+        self.assertPointsEqual(moved.origin, Point(-2, 2))
+        self.assertAlmostEqual(moved.width, 8)
+        self.assertAlmostEqual(moved.height, 2)
+        self.assertAlmostEqual(moved.theta, 90)
+        self.assertEqual(r.origin, Point(1, 1))
+
+        for t in [Transform.scaling(2, 1), Transform.shearing(xy=1),
+                  Transform.rotation(30, 0, 0), Transform.scaling(0),
+                  Transform([[1, 0, 0, 0], [0, 1, 0, 0],
+                             [0, 0, 1, 0], [0, 0, 1, 1]])]:
+            with self.assertRaises(ValueError):
+                t(Rectangle())
+
+    def testTransformEllipse(self):
+        '''
+        '''
+        e = Transform.scaling(2).translate(1, 0)(Ellipse([1, 1], 3, 1))
+        self.assertEqual(e.center, Point(3, 2))
+        self.assertEqual(e.radius, Point(6, 2))
+
+        e = Transform.rotation(0, 0, 90)(Ellipse([1, 0], 3, 1))
+        self.assertPointsEqual(e.center, Point(0, 1))
+        self.assertEqual(e.radius, Point(1, 3))
+
+        c = Transform.rotation(0, 0, 30).scale(0.5)(Circle([2, 0], 4))
+        self.assertIsInstance(c, Circle)
+        self.assertPointsEqual(c.center, Point(math.sqrt(3), 1) / 2)
+        self.assertEqual(c.radius, 2)
+
+        with self.assertRaises(ValueError):
+            Transform.rotation(0, 0, 30)(Ellipse([1, 0], 3, 1))
+        with self.assertRaises(ValueError):
+            Transform.scaling(1, 2)(Circle())
@@ -0,0 +1,90 @@
+import unittest
+import math
+import random
+
+from .. import Point, Polygon, Triangle
+from ..triangulation import triangulate
+
+
+def _star(count, rng):
+    points = []
+    for i in range(count):
+        angle = 2 * math.pi * i / count
+        r = rng.uniform(0.2, 1.0)
+        points.append(Point(r * math.cos(angle), r * math.sin(angle)))
+    return Polygon(points)
+
+
+class TriangulationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # a 'U' shape, concave with the notch open to the top
+        self.u = Polygon([Point(0, 0), Point(3, 0), Point(3, 3),
+                          Point(2, 3), Point(2, 1), Point(1, 1),
+                          Point(1, 3), Point(0, 3)])
+
+        # a comb with its teeth pointing up, the bottom of every gap
+        # is a merge vertex of the sweep
+        teeth = []
+        for i in range(9, 0, -1):
+            teeth.extend([Point(i + 0.5, 5), Point(i, 1)])
+        self.comb = Polygon([Point(0, 0), Point(10, 0)] + teeth +
+                            [Point(0, 5)])
+
+    def assertTriangulates(self, polygon):
+        xy = polygon.xy
+        rows = triangulate(polygon, indices=True)
+
+        distinct = len([i for i in range(len(xy)) if xy[i] != xy[i - 1]])
+        self.assertEqual(rows.shape, (distinct - 2, 3))
+
+        area = 0
+        for a, b, c in rows.tolist():
+            t = Polygon([polygon.vertices[i] for i in (a, b, c)])
+            self.assertGreaterEqual(t.signedArea, 0)
+            self.assertIn(t.centroid, polygon)
+            area += t.area
+        self.assertAlmostEqual(area, polygon.area)
+
+    def testTriangulateTriangles(self):
+        square = Polygon([Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)])
+        triangles = square.triangulate()
+
+        self.assertEqual(len(triangles), 2)
+        for t in triangles:
+            self.assertIsInstance(t, Triangle)
+            self.assertEqual(t.area, 0.5)
+            for p in t.vertices:
+                self.assertIn(p, square.vertices)
+                self.assertFalse(any(p is v for v in square.vertices))
+
+    def testTriangulateIndices(self):
+        rows = self.u.triangulate(indices=True)
+        self.assertEqual(rows.shape, (6, 3))
+        self.assertEqual(set(rows.flatten().tolist()), set(range(8)))
+
+    def testTriangulateConcave(self):
+        self.assertTriangulates(self.u)
+        self.assertTriangulates(self.comb)
+        self.assertTriangulates(Polygon([Point(y, x) for x, y in self.comb.xy]))
+
+    def testTriangulateClockwise(self):
+        self.assertTriangulates(Polygon(list(reversed(self.u.vertices))))
+        self.assertTriangulates(Polygon(list(reversed(self.comb.vertices))))
+
+    def testTriangulateDegenerate(self):
+        self.assertEqual(triangulate([]), [])
+        self.assertEqual(triangulate([(0, 0), (1, 1), (2, 2)]), [])
+        self.assertEqual(triangulate([(0, 0), (1, 0), (0, 1)],
+                                     indices=True).tolist(), [[0, 1, 2]])
+
+        # repeated and collinear vertices
+        self.assertTriangulates(Polygon([Point(0, 0), Point(1, 0),
+                                         Point(1, 0), Point(2, 0),
+                                         Point(2, 2), Point(0, 2),
+                                         Point(0, 1)]))
+
+    def testTriangulateRandom(self):
+        rng = random.Random(15)
+        for trial in range(20):
+            self.assertTriangulates(_star(rng.randint(3, 60), rng))
@@ -0,0 +1,425 @@
+'''affine transforms in homogeneous coordinates
+
+A Transform is a 4 x 4 matrix which maps the homogeneous coordinates
+[x, y, z, w] of a point, see Point.xyzw, to new coordinates. Simple
+transforms are composed into one matrix and then applied to every
+point of a shape in a single matrix multiply:
+
+>>> t = Transform.rotation(0, 0, 90).translate(1, 2).scale(2)
+>>> t(Point(1, 0))
+Point(x=2.0, y=6.0, z=0.0)
+>>> t.inverse()(Point(2, 6)).distance(Point(1, 0)) < 1e-12
+True
+'''
+
+import copy
+import math
+import numpy
+
+from .point import Point, PointSequence, rotationMatrix
+from .pointarray import PointArray
+
+
+class Transform(object):
+    '''
+    A 4 x 4 affine transform in homogeneous coordinates.
+
+    Transforms are immutable; the composing methods return a new
+    Transform which applies the original first and the new operation
+    second:
+
+    >>> t = Transform().translate(1, 0).rotate(0, 0, 90)
+
+    translates by (1,0,0) and then rotates around the Z axis.
+
+    Operations
+    ==========
+
+    a * b    - composition, applies b first and then a
+    a == b   - True if the matrices are equal
+    t(shape) - a transformed copy of shape, see apply
+
+    Shapes
+    ======
+
+    Point, PointArray, PointSequence and subclasses such as Polygon,
+    Triangle and the packed sequences, Line and subclasses (both endpoints), Ellipse and
+    subclasses (center and radii), Rectangle (corners) and lists of
+    Points.
+
+    Rectangles and Ellipses keep their shape, so they can only be
+    moved by similarities: transforms which rotate, reflect, scale
+    uniformly and translate the XY plane. Since an Ellipse has no
+    angle, only Circles may be turned other than by quarter turns.
+    '''
+
+    @classmethod
+    def translation(cls, dx=0, dy=0, dz=0):
+        '''
+        :dx: float or Point equivalent
+        :dy: optional float
+        :dz: optional float
+        :return: Transform
+
+        A transform which moves points by (dx, dy, dz). If dx is
+        a Point equivalent, it is the whole offset.
+        '''
+        try:
+            dx, dy, dz = Point._convert(dx, ignoreScalars=True).xyz
+        except TypeError:
+            pass
+
+        m = numpy.identity(4)
+        m[:3, 3] = dx, dy, dz
+        return cls(m)
+
+    @classmethod
+    def scaling(cls, sx, sy=None, sz=None, origin=None):
+        '''
+        :sx: float scale factor for X
+        :sy: optional float scale factor for Y, defaults to sx
+        :sz: optional float scale factor for Z, defaults to sx
+        :origin: optional Point, fixed point of the scaling
+        :return: Transform
+        '''
+        if sy is None:
+            sy = sx
+        if sz is None:
+            sz = sx
+
+        return cls(numpy.diag([sx, sy, sz, 1.0]))._around(origin)
+
+    @classmethod
+    def rotation(cls, theta_x, theta_y, theta_z, origin=None, radians=False):
+        '''
+        :theta_x: float angle to rotate around the X axis
+        :theta_y: float angle to rotate around the Y axis
+        :theta_z: float angle to rotate around the Z axis
+        :origin: optional Point, defaults to 0,0,0
+        :radians: optional boolean, angles are in degrees unless True
+        :return: Transform
+
+        The same rotation as Point.rotate.
+        '''
+        m = numpy.identity(4)
+        m[:3, :3] = rotationMatrix(theta_x, theta_y, theta_z, radians)
+        return cls(m)._around(origin)
+
+    @classmethod
+    def shearing(cls, xy=0, xz=0, yx=0, yz=0, zx=0, zy=0, origin=None):
+        '''
+        :xy: float, amount of Y added to X
+        :xz: float, amount of Z added to X
+        :yx: float, amount of X added to Y
+        :yz: float, amount of Z added to Y
+        :zx: float, amount of X added to Z
+        :zy: float, amount of Y added to Z
+        :origin: optional Point, fixed point of the shear
+        :return: Transform
+        '''
+        m = numpy.identity(4)
+        m[0, 1], m[0, 2] = xy, xz
+        m[1, 0], m[1, 2] = yx, yz
+        m[2, 0], m[2, 1] = zx, zy
+        return cls(m)._around(origin)
+
+    def __init__(self, matrix=None):
+        '''
+        :matrix: optional Transform or 4 x 4 nested sequence of floats
+        :return: Transform
+
+        Returns the identity transform by default.
+        '''
+        if matrix is None:
+            self._matrix = numpy.identity(4)
+            return
+
+        if isinstance(matrix, Transform):
+            matrix = matrix.matrix
+
+        m = numpy.array(matrix, dtype=float)
+        if m.shape != (4, 4):
+            raise ValueError('expected a 4 x 4 matrix, got {}'.format(m.shape))
+        self._matrix = m
+
+    @property
+    def matrix(self):
+        '''
+        A copy of the 4 x 4 matrix, numpy.ndarray.
+        '''
+        return self._matrix.copy()
+
+    @property
+    def isAffine(self):
+        '''
+        True if the bottom row of the matrix is [0, 0, 0, 1], boolean.
+        '''
+        return numpy.array_equal(self._matrix[3], [0, 0, 0, 1])
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__,
+                                 self._matrix.tolist())
+
+    def __eq__(self, other):
+        try:
+            return numpy.array_equal(self._matrix, other._matrix)
+        except AttributeError:
+            return False
+
+    __hash__ = None
+
+    def __mul__(self, other):
+        '''
+        a * b, composes transforms so that b is applied first.
+        '''
+        if not isinstance(other, Transform):
+            return NotImplemented
+        return self.__class__(numpy.dot(self._matrix, other._matrix))
+
+    __matmul__ = __mul__
+
+    def _around(self, origin):
+        '''
+        :origin: Point or None
+        :return: Transform
+
+        Implementation private method, conjugates self with a
+        translation so that origin becomes the fixed point.
+        '''
+        if origin is None:
+            return self
+        o = Point._convert(origin)
+        return (self.translation(o) * self) * self.translation(-o)
+
+    def then(self, other):
+        '''
+        :other: Transform
+        :return: Transform
+
+        A transform which applies self and then other.
+        '''
+        return other * self
+
+    def translate(self, dx=0, dy=0, dz=0):
+        '''
+        Returns self followed by a translation, see translation.
+        '''
+        return self.translation(dx, dy, dz) * self
+
+    def scale(self, sx, sy=None, sz=None, origin=None):
+        '''
+        Returns self followed by a scaling, see scaling.
+        '''
+        return self.scaling(sx, sy, sz, origin) * self
+
+    def rotate(self, theta_x, theta_y, theta_z, origin=None, radians=False):
+        '''
+        Returns self followed by a rotation, see rotation.
+        '''
+        return self.rotation(theta_x, theta_y, theta_z,
+                             origin, radians) * self
+
+    def shear(self, xy=0, xz=0, yx=0, yz=0, zx=0, zy=0, origin=None):
+        '''
+        Returns self followed by a shear, see shearing.
+        '''
+        return self.shearing(xy, xz, yx, yz, zx, zy, origin) * self
+
+    def inverse(self):
+        '''
+        :return: Transform
+
+        The transform which undoes self.
+
+        Raises ValueError if the matrix is singular.
+        '''
+        try:
+            return self.__class__(numpy.linalg.inv(self._matrix))
+        except numpy.linalg.LinAlgError:
+            raise ValueError('transform is not invertible') from None
+
+    def transformArray(self, xyz):
+        '''
+        :xyz: N x 3 numpy.ndarray of coordinates
+        :return: N x 3 numpy.ndarray
+
+        Returns the transformed coordinates.
+        '''
+        m = self._matrix
+        result = numpy.dot(xyz, m[:3, :3].T) + m[:3, 3]
+        if not self.isAffine:
+            result /= (numpy.dot(xyz, m[3, :3]) + m[3, 3])[:, numpy.newaxis]
+        return result
+
+    def _similarity(self):
+        '''
+        :return: tuple of (float, 2 x 2 numpy.ndarray)
+
+        Implementation private method, the scale factor of a
+        similarity in the XY plane and the rotation or reflection
+        which follows it.
+
+        Raises ValueError if the transform is not a similarity in
+        the XY plane.
+        '''
+        m = self._matrix
+        xy = m[:2, :2]
+        scale = math.sqrt(abs(numpy.linalg.det(xy)))
+        if (not self.isAffine or scale == 0 or
+                not numpy.allclose(m[2, :2], 0, atol=1e-12 * scale) or
+                not numpy.allclose(numpy.dot(xy.T, xy) / (scale * scale),
+                                   numpy.identity(2), atol=1e-9)):
+            raise ValueError('transform is not a similarity in the XY plane')
+        return scale, xy / scale
+
+    def _placeRectangle(self, rectangle):
+        '''
+        :rectangle: Rectangle, updated in place
+
+        Implementation private method, moves the origin and turns and
+        scales the sides. A reflection turns the rectangle over, so
+        the side AD becomes the side AB.
+        '''
+        scale, turn = self._similarity()
+        c, s = rectangle._axes()
+        ux, uy = numpy.dot(turn, [c, s]).tolist()
+        vx, vy = numpy.dot(turn, [-s, c]).tolist()
+        width, height = rectangle.width * scale, rectangle.height * scale
+        if numpy.linalg.det(turn) < 0:
+            ux, uy = vx, vy
+            width, height = height, width
+
+        rectangle.origin = self.transformArray(
+            numpy.array([rectangle.origin.xyz]))[0].tolist()
+        rectangle.width = width
+        rectangle.height = height
+        rectangle.theta = math.degrees(math.atan2(uy, ux))
+
+    def _placeEllipse(self, ellipse):
+        '''
+        :ellipse: Ellipse, updated in place
+
+        Implementation private method, moves the center and scales
+        the radii, swapping them for quarter turns.
+
+        Raises ValueError if the transform would turn the axes of an
+        Ellipse which is not a Circle.
+        '''
+        scale, turn = self._similarity()
+        radius = ellipse.radius
+        if not isinstance(radius, Point):
+            radius = scale * radius
+        elif radius.x == radius.y or abs(turn[0, 1]) < 1e-12:
+            radius = radius * scale
+        elif abs(turn[0, 0]) < 1e-12:
+            radius = Point(radius.y, radius.x, radius.z) * scale
+        else:
+            raise ValueError('transform turns the axes of the ellipse')
+
+        ellipse.center = self.transformArray(
+            numpy.array([ellipse.center.xyz]))[0].tolist()
+        ellipse.radius = radius
+
+    @staticmethod
+    def _points(shape):
+        '''
+        :shape: a shape, see the class documentation
+        :return: list of Points
+
+        Implementation private method, the Points which position
+        the shape. Updating these Points moves the shape; point
+        equivalents stored in PointSequences and lists are converted
+        to Points and put back by iapply.
+        '''
+        from .line import Line
+        from .triangle import Triangle
+
+        if isinstance(shape, Point):
+            return [shape]
+
+        if isinstance(shape, (PointSequence, Triangle)):
+            return [Point._convert(p) for p in shape.vertices]
+
+        if isinstance(shape, Line):
+            return [shape.A, shape.B]
+
+        return [Point._convert(p) for p in shape]
+
+    def iapply(self, shape):
+        '''
+        :shape: a shape, see the class documentation
+        :return: shape
+
+        Transforms shape in place and returns it.
+
+        Raises ValueError for a Rectangle or Ellipse the transform
+        cannot map to another, see the class documentation.
+        '''
+        from .ellipse import Ellipse
+        from .rectangle import Rectangle
+        from .packed import PackedPointSequence
+
+        if isinstance(shape, PointArray):
+            shape.xyz[...] = self.transformArray(shape.xyz)
+            return shape
+
+        if isinstance(shape, PackedPointSequence):
+            self.iapply(shape.array)
+            shape._invalidate()
+            return shape
+
+        if isinstance(shape, Rectangle):
+            self._placeRectangle(shape)
+            return shape
+
+        if isinstance(shape, Ellipse):
+            self._placeEllipse(shape)
+            return shape
+
+        points = self._points(shape)
+        if not points:
+            return shape
+
+        xyz = self.transformArray(numpy.array([p.xyz for p in points]))
+        for p, row in zip(points, xyz.tolist()):
+            p.xyz = row
+
+        if isinstance(shape, PointSequence):
+            shape.vertices[:] = points
+            shape._invalidate()
+
+        if isinstance(shape, list):
+            shape[:] = points
+
+        return shape
+
+    def apply(self, shape):
+        '''
+        :shape: a shape, see the class documentation
+        :return: transformed copy of shape
+
+        Returns a transformed copy of shape, shape is unchanged.
+        Copies of Points keep their class, points in a PointArray
+        are copied to Points.
+        '''
+        from .packed import PackedPointSequence
+
+        if isinstance(shape, PointArray):
+            return PointArray(self.transformArray(shape.xyz))
+
+        if isinstance(shape, PackedPointSequence):
+            return shape.__class__(self.transformArray(shape.array.xyz))
+
+        if isinstance(shape, Point):
+            return self.iapply(copy.copy(shape))
+
+        if isinstance(shape, PointSequence):
+            points = [Point._convert(p) for p in shape.vertices]
+            xyz = numpy.array([p.xyz for p in points]).reshape(-1, 3)
+            xyz = self.transformArray(xyz)
+            return shape.__class__([Point(row) for row in xyz.tolist()],
+                                   base=shape._base)
+
+        return self.iapply(copy.deepcopy(shape))
+
+    __call__ = apply
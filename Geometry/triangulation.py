@@ -0,0 +1,381 @@
+'''triangulation of simple polygons
+
+triangulate cuts a simple polygon into triangles in O(n log n) time
+in two steps:
+
+1. A sweep from top to bottom adds diagonals at the split and merge
+   vertices, dividing the polygon into Y-monotone pieces.
+
+2. Each monotone piece is triangulated in linear time by walking its
+   left and right chains from top to bottom with a stack.
+
+Vertices with equal Y coordinates are ordered by X, the lexicographic
+order of de Berg et al. "Computational Geometry: Algorithms and
+Applications", chapter 3, so horizontal edges need no special cases.
+'''
+
+import math
+
+from .point import Point
+
+
+def _above(p, q):
+    '''
+    :p: (x, y) tuple
+    :q: (x, y) tuple
+    :return: boolean, True if p comes before q in the sweep
+    '''
+    return p[1] > q[1] or (p[1] == q[1] and p[0] < q[0])
+
+
+def _cross(a, b, c):
+    '''
+    :a: (x, y) tuple
+    :b: (x, y) tuple
+    :c: (x, y) tuple
+    :return: float, positive if a, b, c turn counter-clockwise
+    '''
+    return ((b[0] - a[0]) * (c[1] - a[1])) - ((b[1] - a[1]) * (c[0] - a[0]))
+
+
+def _vertices(xy):
+    '''
+    :xy: list of (x, y) tuples, the polygon vertices
+    :return: tuple of (list of (x, y) tuples, list of integer indices)
+
+    Module private function, the vertices in counter-clockwise order
+    without repeated consecutive points, and the index of each one in
+    xy. Both lists are empty if the polygon has no area.
+    '''
+    keep = [i for i in range(len(xy)) if xy[i] != xy[i - 1]]
+
+    area = 0.0
+    for i in range(len(keep)):
+        (ax, ay), (bx, by) = xy[keep[i - 1]], xy[keep[i]]
+        area += (ax * by) - (bx * ay)
+
+    if area == 0:
+        return [], []
+
+    if area < 0:
+        keep.reverse()
+
+    return [xy[i] for i in keep], keep
+
+
+class _Status(object):
+    '''
+    The polygon edges crossed by the sweep line which have the
+    interior of the polygon to their right, sorted from left to right.
+
+    Implementation private class. The edges never cross, so their
+    order stays the same while the sweep moves down and the list can
+    be searched with bisection at the current Y coordinate.
+    '''
+
+    def __init__(self, xy):
+        '''
+        :xy: list of (x, y) tuples, the polygon vertices
+        '''
+        self.xy = xy
+        self.edges = []
+        self.helper = {}
+
+        # each edge as its top end, bottom end and dx/dy, horizontal
+        # edges are placed at their right end.
+        lines = []
+        for (ax, ay), (bx, by) in zip(xy, xy[1:] + xy[:1]):
+            if ay == by:
+                x = max(ax, bx)
+                lines.append((x, ay, x, by, 0.0))
+            else:
+                lines.append((ax, ay, bx, by, (bx - ax) / (by - ay)))
+        self.lines = lines
+
+    def _bisect(self, px, py):
+        '''
+        :px: float
+        :py: float
+        :return: integer, number of edges left of (px, py)
+        '''
+        edges, lines = self.edges, self.lines
+        lo, hi = 0, len(edges)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            ax, ay, bx, by, k = lines[edges[mid]]
+            if py == ay:
+                x = ax
+            elif py == by:
+                x = bx
+            else:
+                x = ax + ((py - ay) * k)
+            if x < px:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def insert(self, edge, helper):
+        '''
+        :edge: integer
+        :helper: integer vertex
+        '''
+        px, py = self.xy[edge]
+        self.edges.insert(self._bisect(px, py), edge)
+        self.helper[edge] = helper
+
+    def remove(self, edge, p):
+        '''
+        :edge: integer
+        :p: (x, y) tuple, the lower end of the edge
+        '''
+        edges = self.edges
+        i = self._bisect(*p)
+        while i < len(edges) and edges[i] != edge:
+            i += 1
+        if i == len(edges):
+            i = edges.index(edge)
+        del edges[i]
+        del self.helper[edge]
+
+    def left(self, p):
+        '''
+        :p: (x, y) tuple
+        :return: integer, the edge directly left of p
+        '''
+        return self.edges[self._bisect(*p) - 1]
+
+
+def _diagonals(xy):
+    '''
+    :xy: list of (x, y) tuples, a counter-clockwise simple polygon
+    :return: list of (integer, integer) vertex pairs
+
+    Module private function, the diagonals which split the polygon
+    into Y-monotone pieces.
+    '''
+    n = len(xy)
+    order = sorted(range(n), key=lambda i: (-xy[i][1], xy[i][0]))
+
+    merge = [False] * n
+    status = _Status(xy)
+    diagonals = []
+
+    def fixup(edge, v):
+        h = status.helper[edge]
+        if merge[h]:
+            diagonals.append((v, h))
+
+    for v in order:
+        p = xy[v]
+        prev, succ = (v - 1) % n, (v + 1) % n
+        prevAbove = _above(xy[prev], p)
+        succAbove = _above(xy[succ], p)
+        convex = _cross(xy[prev], p, xy[succ]) > 0
+
+        if not prevAbove and not succAbove:
+            if not convex:
+                # split vertex
+                edge = status.left(p)
+                diagonals.append((v, status.helper[edge]))
+                status.helper[edge] = v
+            status.insert(v, v)
+
+        elif prevAbove and succAbove:
+            fixup(prev, v)
+            status.remove(prev, p)
+            if not convex:
+                # merge vertex
+                merge[v] = True
+                edge = status.left(p)
+                fixup(edge, v)
+                status.helper[edge] = v
+
+        elif prevAbove:
+            # regular vertex with the interior to its right
+            fixup(prev, v)
+            status.remove(prev, p)
+            status.insert(v, v)
+
+        else:
+            # regular vertex with the interior to its left
+            edge = status.left(p)
+            fixup(edge, v)
+            status.helper[edge] = v
+
+    return diagonals
+
+
+def _pieces(xy, diagonals):
+    '''
+    :xy: list of (x, y) tuples, a counter-clockwise polygon
+    :diagonals: list of (integer, integer) vertex pairs
+    :return: list of lists of integer vertices
+
+    Module private function, the counter-clockwise faces of the
+    polygon cut along the diagonals.
+    '''
+    n = len(xy)
+    if not diagonals:
+        return [list(range(n))]
+
+    diagonals = set(diagonals)
+
+    fans = {}
+    for a, b in diagonals:
+        fans.setdefault(a, []).append(b)
+        fans.setdefault(b, []).append(a)
+
+    # the neighbours of each vertex with diagonals, sorted by angle
+    for v, others in fans.items():
+        vx, vy = xy[v]
+        others.extend(((v - 1) % n, (v + 1) % n))
+        others.sort(key=lambda w: math.atan2(xy[w][1] - vy, xy[w][0] - vx))
+
+    starts = [(v, (v + 1) % n) for v in range(n)]
+    starts.extend(diagonals)
+    starts.extend((b, a) for a, b in diagonals)
+
+    visited = set()
+    faces = []
+    for u, v in starts:
+        face = []
+        while (u, v) not in visited:
+            visited.add((u, v))
+            face.append(u)
+            try:
+                others = fans[v]
+            except KeyError:
+                u, v = v, (v + 1) % n
+                continue
+            # the face continues along the next edge clockwise from v->u
+            u, v = v, others[others.index(u) - 1]
+        if face:
+            faces.append(face)
+
+    return faces
+
+
+def _monotone(xy, face, triangles):
+    '''
+    :xy: list of (x, y) tuples
+    :face: list of integer vertices, a counter-clockwise Y-monotone
+           polygon
+    :triangles: list, counter-clockwise vertex triples are appended
+
+    Module private function.
+    '''
+    n = len(face)
+    if n < 3:
+        return
+    if n == 3:
+        triangles.append(tuple(face))
+        return
+
+    top = min(range(n), key=lambda i: (-xy[face[i]][1], xy[face[i]][0]))
+    bottom = min(range(n), key=lambda i: (xy[face[i]][1], -xy[face[i]][0]))
+
+    # counter-clockwise from the top runs down the left chain and
+    # the right chain comes back up, merge them from top to bottom.
+    left = []
+    i = top
+    while i != bottom:
+        left.append(face[i])
+        i = (i + 1) % n
+    right = []
+    i = (top - 1) % n
+    while i != bottom:
+        right.append(face[i])
+        i = (i - 1) % n
+
+    order = []
+    i = j = 0
+    while i < len(left) or j < len(right):
+        if j == len(right) or (i < len(left) and
+                               _above(xy[left[i]], xy[right[j]])):
+            order.append((left[i], True))
+            i += 1
+        else:
+            order.append((right[j], False))
+            j += 1
+
+    def emit(a, b, c):
+        if _cross(xy[a], xy[b], xy[c]) < 0:
+            b, c = c, b
+        triangles.append((a, b, c))
+
+    stack = order[:2]
+    for k in range(2, len(order)):
+        v, isLeft = order[k]
+        if isLeft != stack[-1][1]:
+            # v sees every vertex on the stack
+            while len(stack) > 1:
+                a = stack.pop()[0]
+                emit(v, a, stack[-1][0])
+            stack = [order[k - 1], order[k]]
+            continue
+
+        # cut off triangles while the chain on the stack is convex
+        last = stack.pop()
+        while stack:
+            a, b = xy[stack[-1][0]], xy[last[0]]
+            if isLeft:
+                turn = _cross(a, b, xy[v])
+            else:
+                turn = _cross(xy[v], b, a)
+            if turn <= 0:
+                break
+            emit(v, last[0], stack[-1][0])
+            last = stack.pop()
+        stack.append(last)
+        stack.append(order[k])
+
+    v = face[bottom]
+    while len(stack) > 1:
+        a = stack.pop()[0]
+        emit(v, a, stack[-1][0])
+
+
+def triangulate(polygon, indices=False):
+    '''
+    :polygon: Polygon or iterable of point equivalents
+    :indices: optional boolean
+    :return: list of Triangles or an N x 3 numpy.ndarray of integers
+
+    Cuts a simple polygon into triangles in the XY plane, in
+    O(n log n) time. A polygon with n distinct vertices gives n - 2
+    triangles with counter-clockwise vertices.
+
+    If indices is True the triangles are returned as rows of vertex
+    indices into the polygon instead, which avoids creating a
+    Triangle for each one.
+
+    Repeated consecutive vertices are skipped and polygons without
+    area give no triangles. The result is undefined for polygons
+    whose edges cross.
+    '''
+    try:
+        xy = polygon.xy
+        points = polygon.vertices
+    except AttributeError:
+        points = [Point._convert(v) for v in polygon]
+        xy = [(p.x, p.y) for p in points]
+
+    ccw, index = _vertices(xy)
+
+    triangles = []
+    if len(ccw) >= 3:
+        for face in _pieces(ccw, _diagonals(ccw)):
+            _monotone(ccw, face, triangles)
+
+    if indices:
+        import numpy
+        flat = [index[v] for triangle in triangles for v in triangle]
+        return numpy.array(flat, dtype=numpy.intp).reshape(-1, 3)
+
+    from .triangle2 import Triangle
+
+    points = [Point._convert(p) for p in points]
+    return [Triangle(Point(points[index[a]]),
+                     Point(points[index[b]]),
+                     Point(points[index[c]])) for a, b, c in triangles]
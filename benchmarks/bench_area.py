@@ -0,0 +1,45 @@
+'''Polygon area benchmarks
+
+Compares Polygon.signedArea and Polygon.centroid computed polygon by
+polygon against the vectorized shoelace over the same polygons packed
+into one array. Run from the top of the source tree:
+
+ $ python3 benchmarks/bench_area.py [count] [vertices]
+'''
+
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point, Polygon
+from Geometry.pointarray import shoelace
+
+
+def main(count=100000, vertices=8):
+    rng = numpy.random.default_rng(1)
+    packed = rng.uniform(-1, 1, (count * vertices, 2))
+    offsets = numpy.arange(0, len(packed) + 1, vertices)
+
+    polygons = [Polygon([Point(x, y) for x, y in packed[i:i + vertices]])
+                for i in offsets[:-1]]
+
+    start = time.perf_counter()
+    loop = [(p.signedArea, p.centroid) for p in polygons]
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format(
+        'Polygon x {}'.format(count), elapsed))
+
+    start = time.perf_counter()
+    areas, centroids = shoelace(packed, offsets)
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format('shoelace', elapsed))
+
+    assert numpy.allclose(areas, [area for area, c in loop])
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
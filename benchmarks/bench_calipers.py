@@ -0,0 +1,78 @@
+'''Rotating calipers benchmarks
+
+Finds the diameter, width and minimum area rectangle of points on a
+circle, where every point is on the hull, with the calipers and
+with the brute force search over all pairs. Then times the calipers
+on a million points in a disc, where hulling dominates. Run from the
+top of the source tree:
+
+ $ python3 benchmarks/bench_calipers.py [largest] [disc]
+'''
+
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point, PointArray
+from Geometry.calipers import diameter, minimumWidth, minimumAreaRectangle
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format(label, elapsed))
+    return result
+
+
+def bruteDiameter(points):
+    xy = [(p.x, p.y) for p in points]
+    best = 0
+    for i, (ax, ay) in enumerate(xy):
+        for bx, by in xy[i + 1:]:
+            best = max(best, ((ax - bx) ** 2) + ((ay - by) ** 2))
+    return math.sqrt(best)
+
+
+def bruteRectangle(points):
+    xy = [(p.x, p.y) for p in points]
+    n = len(xy)
+    best = math.inf
+    for i in range(n):
+        (ax, ay), (bx, by) = xy[i], xy[(i + 1) % n]
+        length = math.hypot(bx - ax, by - ay)
+        ex, ey = (bx - ax) / length, (by - ay) / length
+        along = [(x * ex) + (y * ey) for x, y in xy]
+        across = [(y * ex) - (x * ey) for x, y in xy]
+        best = min(best, (max(along) - min(along)) *
+                   (max(across) - min(across)))
+    return best
+
+
+def main(largest=4000, disc=1000000):
+    count = 1000
+    while count <= largest:
+        points = [Point(math.cos(2 * math.pi * i / count),
+                        math.sin(2 * math.pi * i / count))
+                  for i in range(count)]
+        print('{} points on a circle'.format(count))
+        d = timed('diameter', diameter, points)
+        timed('minimumWidth', minimumWidth, points)
+        r = timed('minimumAreaRectangle', minimumAreaRectangle, points)
+        assert abs(timed('brute force diameter', bruteDiameter, points) -
+                   d.length) < 1e-9
+        assert abs(timed('brute force rectangle', bruteRectangle, points) -
+                   r.area) < 1e-9
+        count *= 2
+
+    points = PointArray.randomInDisc(disc, rng=1)
+    print('{} points in a disc'.format(disc))
+    timed('diameter', diameter, points)
+    timed('minimumAreaRectangle', minimumAreaRectangle, points)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,42 @@
+'''Orientation predicate benchmarks
+
+Compares Point.ccw in a Python loop against the batch ccw over a
+PointArray for one fixed pair of points and many query points. Run
+from the top of the source tree:
+
+ $ python3 benchmarks/bench_ccw.py [count]
+'''
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point, PointArray
+from Geometry.pointarray import ccw
+
+
+def main(count=1000000):
+    a = Point(0, 0)
+    b = Point(1, 1)
+    queries = PointArray.zeros(count)
+    queries.xy = [[i, count - i] for i in range(count)]
+    points = queries.points()
+
+    start = time.perf_counter()
+    loop = [a.ccw(b, q) for q in points]
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format(
+        'Point.ccw x {}'.format(count), elapsed))
+
+    start = time.perf_counter()
+    batch = ccw(a, b, queries)
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format('batch ccw', elapsed))
+
+    assert batch.tolist() == loop
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,58 @@
+'''Viewport clipping benchmarks
+
+Clips the edges of a random graph spread over an area four times
+the size of a viewport, with Rectangle.clip in a Python loop and with
+the batch Rectangle.clipSegments. Run from the top of the source
+tree:
+
+ $ python3 benchmarks/bench_clip.py [loop] [largest]
+'''
+
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point, Segment, Rectangle
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format(label, elapsed))
+    return result
+
+
+def loop(viewport, segments):
+    return [viewport.clip(s) for s in segments]
+
+
+def randomEdges(count, rng):
+    starts = rng.random((count, 2)) * 2
+    return numpy.stack([starts, starts + rng.normal(0, 0.1, (count, 2))], 1)
+
+
+def main(count=100000, largest=1000000):
+    rng = numpy.random.default_rng(25)
+    viewport = Rectangle(Point(0.5, 0.5), 1, 1)
+
+    ends = randomEdges(count, rng)
+    segments = [Segment(Point(*a), Point(*b)) for a, b in ends.tolist()]
+    print('{} edges'.format(count))
+    clipped = timed('Rectangle.clip', loop, viewport, segments)
+    mask, clippedEnds = timed('Rectangle.clipSegments',
+                              viewport.clipSegments, ends)
+    assert mask.tolist() == [c is not None for c in clipped]
+    print('{:>28}: {:8d}'.format('visible', int(mask.sum())))
+
+    ends = randomEdges(largest, rng)
+    print('{} edges'.format(largest))
+    timed('Rectangle.clipSegments', viewport.clipSegments, ends)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,76 @@
+'''Point in polygon benchmarks
+
+Classifies random query points against a concave star shaped polygon
+with the in operator in a Python loop, the batch Polygon.containsPoints
+and the same two queries on a PreparedPolygon, whose build time and
+memory are also reported. Run from the top of the source tree:
+
+ $ python3 benchmarks/bench_contains.py [count] [vertices]
+'''
+
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point, Polygon, PointArray
+
+
+def star(vertices):
+    '''
+    :vertices: integer number of vertices
+    :return: Polygon
+
+    A concave polygon whose vertices alternate between two radii.
+    '''
+    points = []
+    for i in range(vertices):
+        r = 1.0 if i % 2 else 0.5
+        t = 2 * math.pi * i / vertices
+        points.append(Point(r * math.cos(t), r * math.sin(t)))
+    return Polygon(points)
+
+
+def main(count=100000, vertices=1000):
+    polygon = star(vertices)
+    queries = PointArray.randomInBox(count, [-1, -1, 0], [1, 1, 0], rng=1)
+
+    points = queries.points()[:count // 100]
+    start = time.perf_counter()
+    loop = [p in polygon for p in points]
+    elapsed = (time.perf_counter() - start) * 100
+    print('{:>28}: {:8.3f} sec (extrapolated)'.format(
+        'in x {}'.format(count), elapsed))
+
+    start = time.perf_counter()
+    batch = polygon.containsPoints(queries)
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format('containsPoints', elapsed))
+
+    assert batch[:len(loop)].tolist() == loop
+
+    prepared = polygon.prepare()
+    print('{:>28}: {:8.3f} sec, {} slab entries, {} KiB'.format(
+        'PreparedPolygon build', prepared.buildTime,
+        prepared.slabEntries, prepared.memory // 1024))
+
+    points = queries.points()
+    start = time.perf_counter()
+    preparedLoop = [p in prepared for p in points]
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format(
+        'prepared in x {}'.format(count), elapsed))
+
+    start = time.perf_counter()
+    preparedBatch = prepared.containsPoints(queries)
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format('prepared containsPoints', elapsed))
+
+    assert preparedBatch.tolist() == batch.tolist()
+    assert preparedLoop == batch.tolist()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,59 @@
+'''Nearest segment benchmarks
+
+Snaps random points to the nearest of a set of random segments with
+Segment.distanceFromPoint in a Python loop and with the batch
+nearestSegments, then times nearestSegments alone for many points.
+Run from the top of the source tree:
+
+ $ python3 benchmarks/bench_distance.py [loop] [largest] [segments]
+'''
+
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point, Segment
+from Geometry.pointarray import nearestSegments
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format(label, elapsed))
+    return result
+
+
+def loop(points, segments):
+    nearest = []
+    for p in points:
+        distances = [s.distanceFromPoint(p) for s in segments]
+        nearest.append(distances.index(min(distances)))
+    return nearest
+
+
+def main(count=2000, largest=1000000, edges=1000):
+    rng = numpy.random.default_rng(24)
+    starts = rng.random((edges, 2))
+    ends = numpy.stack([starts, starts + rng.normal(0, 0.05, (edges, 2))], 1)
+    segments = [Segment(Point(*a), Point(*b)) for a, b in ends.tolist()]
+
+    queries = rng.random((count, 2))
+    points = [Point(*p) for p in queries.tolist()]
+    print('{} points, {} segments'.format(count, edges))
+    nearest = timed('distanceFromPoint loop', loop, points, segments)
+    index, distance, closest = timed('nearestSegments', nearestSegments,
+                                     queries, ends)
+    assert nearest == index.tolist()
+
+    queries = rng.random((largest, 2))
+    print('{} points, {} segments'.format(largest, edges))
+    timed('nearestSegments', nearestSegments, queries, ends)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,44 @@
+'''Point and PointSequence hashing benchmarks
+
+Times building a set of Points and hashing a PointSequence. Run from
+the top of the source tree:
+
+ $ python3 benchmarks/bench_hash.py [count]
+'''
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point, MutablePointSequence
+
+
+def main(count=1000000):
+    points = [Point(i, i * 0.5, -i) for i in range(count)]
+
+    start = time.perf_counter()
+    s = set(points)
+    elapsed = time.perf_counter() - start
+    print('{:>32}: {:8.3f} sec'.format(
+        'set of {} points'.format(count), elapsed))
+
+    assert len(s) == count
+
+    start = time.perf_counter()
+    s = set(points)
+    elapsed = time.perf_counter() - start
+    print('{:>32}: {:8.3f} sec'.format('again, hashes cached', elapsed))
+
+    seq = MutablePointSequence(points[:10000])
+    start = time.perf_counter()
+    for _ in range(100):
+        hash(seq)
+    elapsed = time.perf_counter() - start
+    print('{:>32}: {:8.3f} msec'.format(
+        'hash(sequence of 10000 points)', (elapsed / 100) * 1e3))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
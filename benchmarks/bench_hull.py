@@ -0,0 +1,49 @@
+'''convex hull benchmarks
+
+Computes the hull of random points in a disc with convexHull, once
+from a list of Points and once from a PointArray, and then feeds the
+same points one at a time to an IncrementalHull. Run from the top of
+the source tree:
+
+ $ python3 benchmarks/bench_hull.py [count]
+'''
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import PointArray
+from Geometry.hull import convexHull, IncrementalHull
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format(label, elapsed))
+    return result
+
+
+def stream(points):
+    hull = IncrementalHull()
+    for p in points:
+        hull.add(p)
+    return hull.polygon
+
+
+def main(count=100000):
+    array = PointArray.randomInDisc(count, rng=1)
+    points = list(array)
+
+    expected = timed('convexHull list', convexHull, points)
+    timed('convexHull PointArray', convexHull, array)
+    hull = timed('IncrementalHull.add', stream, points)
+
+    assert hull == expected
+    print('{:>28}: {}'.format('hull vertices', len(expected.vertices)))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
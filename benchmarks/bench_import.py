@@ -0,0 +1,49 @@
+'''Import time benchmark
+
+Measures the wall clock time of 'import Geometry' in a fresh
+interpreter, less the time of an interpreter which imports nothing.
+Exits with status 1 if the median exceeds the optional limit in
+milliseconds, so it can guard against regressions. Run from the top
+of the source tree:
+
+ $ python3 benchmarks/bench_import.py [runs] [limit]
+'''
+
+import os
+import subprocess
+import statistics
+import sys
+import time
+
+_top = os.path.join(os.path.dirname(__file__), '..')
+
+
+def timeStatement(statement, runs):
+    '''
+    :statement: string of python source
+    :runs:      integer number of interpreters to start
+    :return:    float median seconds
+    '''
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.check_call([sys.executable, '-c', statement], cwd=_top)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main(runs=20, limit=None):
+    baseline = timeStatement('pass', runs)
+    elapsed = timeStatement('import Geometry', runs) - baseline
+    print('{:>28}: {:8.1f} msec'.format('import Geometry', elapsed * 1000))
+
+    full = timeStatement('from Geometry import *', runs) - baseline
+    print('{:>28}: {:8.1f} msec'.format('from Geometry import *', full * 1000))
+
+    if limit is not None and elapsed * 1000 > limit:
+        print('import Geometry exceeds {} msec'.format(limit))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
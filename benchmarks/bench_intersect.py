@@ -0,0 +1,65 @@
+'''Segment intersection kernel benchmarks
+
+Compares Segment.doesIntersect followed by Segment.intersection in a
+Python loop, catching the exceptions raised for segments which do not
+meet, against the batch intersectSegments for pairs of short random
+segments, most of which miss. Run from the top of the source tree:
+
+ $ python3 benchmarks/bench_intersect.py [count]
+'''
+
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point, Segment
+from Geometry.exceptions import ParallelLines, CollinearLines
+from Geometry.pointarray import intersectSegments
+
+
+def loop(pairs):
+    hits = 0
+    for s, t in pairs:
+        if not s.doesIntersect(t):
+            continue
+        hits += 1
+        try:
+            s.intersection(t)
+        except (ParallelLines, CollinearLines):
+            pass
+    return hits
+
+
+def main(count=100000):
+    rng = numpy.random.default_rng(22)
+    starts = rng.random((2, count, 2))
+    first = numpy.stack([starts[0], starts[0] + rng.normal(0, 0.2,
+                                                           (count, 2))], 1)
+    second = numpy.stack([starts[1], starts[1] + rng.normal(0, 0.2,
+                                                            (count, 2))], 1)
+
+    pairs = [(Segment(Point(*a[0]), Point(*a[1])),
+              Segment(Point(*b[0]), Point(*b[1])))
+             for a, b in zip(first.tolist(), second.tolist())]
+
+    start = time.perf_counter()
+    hits = loop(pairs)
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format(
+        'Segment loop x {}'.format(count), elapsed))
+
+    start = time.perf_counter()
+    mask, points, t, u = intersectSegments(first, second)
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format('intersectSegments', elapsed))
+    print('{:>28}: {:8d}'.format('hits', hits))
+
+    assert hits == mask.sum()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
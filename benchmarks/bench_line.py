@@ -0,0 +1,79 @@
+'''Line intersection benchmarks
+
+Intersects one segment against many short random segments, most of
+which it misses, with Segment.intersection catching the exceptions,
+with Segment.findIntersection, and with findIntersection after
+discarding the cached terms of both segments before each call. Run
+from the top of the source tree:
+
+ $ python3 benchmarks/bench_line.py [count]
+'''
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point, Segment
+from Geometry.exceptions import ParallelLines, CollinearLines
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format(label, elapsed))
+    return result
+
+
+def raising(segment, others):
+    found = []
+    for other in others:
+        try:
+            found.append(segment.intersection(other))
+        except (ParallelLines, CollinearLines):
+            pass
+    return found
+
+
+def returning(segment, others):
+    found = []
+    for other in others:
+        p = segment.findIntersection(other)
+        if p is not None:
+            found.append(p)
+    return found
+
+
+def uncached(segment, others):
+    found = []
+    for other in others:
+        segment._invalidate()
+        other._invalidate()
+        p = segment.findIntersection(other)
+        if p is not None:
+            found.append(p)
+    return found
+
+
+def main(count=100000):
+    rng = random.Random(23)
+    segment = Segment(Point(0, 0.5), Point(1, 0.5))
+    others = []
+    for _ in range(count):
+        x, y = rng.random(), rng.random()
+        others.append(Segment(Point(x, y), Point(x + rng.uniform(-0.1, 0.1),
+                                                 y + rng.uniform(-0.1, 0.1))))
+
+    print('one segment against {}'.format(count))
+    a = timed('intersection', raising, segment, others)
+    b = timed('findIntersection', returning, segment, others)
+    c = timed('findIntersection, uncached', uncached, segment, others)
+    assert a == b == c
+    print('{:>28}: {:8d}'.format('found', len(b)))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
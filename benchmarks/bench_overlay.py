@@ -0,0 +1,69 @@
+'''Polygon boolean operation benchmarks
+
+Overlays two wavy circles of growing size, which cross each other
+in a handful of places, then two circles with random noise that
+cross in many places, and intersects pairs of small convex
+polygons with the Sutherland-Hodgman fast path. Run from the top of
+the source tree:
+
+ $ python3 benchmarks/bench_overlay.py [largest] [convexCount]
+'''
+
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point, Polygon
+from Geometry.clipping import intersection, union, difference, xor
+
+
+def blob(count, rng, cx=0, cy=0, noise=0):
+    points = []
+    for i in range(count):
+        angle = 2 * math.pi * i / count
+        r = 1 + (0.05 * math.sin(7 * angle)) + rng.uniform(-noise, noise)
+        points.append(Point(cx + r * math.cos(angle), cy + r * math.sin(angle)))
+    return Polygon(points)
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format(label, elapsed))
+    return result
+
+
+def convexPairs(pairs):
+    return [intersection(a, b) for a, b in pairs]
+
+
+def main(largest=100000, convexCount=10000):
+    rng = random.Random(1)
+
+    count = 1000
+    while count <= largest:
+        a, b = blob(count, rng), blob(count, rng, 0.5, 0.25)
+        print('{} vertices'.format(count))
+        for operation in (intersection, union, difference, xor):
+            timed(operation.__name__, operation, a, b)
+        count *= 10
+
+    a, b = blob(10000, rng, noise=0.01), blob(10000, rng, 0.5, 0.25, 0.01)
+    print('10000 vertices with noise')
+    timed('union', union, a, b)
+
+    pairs = []
+    for i in range(convexCount):
+        x, y = rng.uniform(-1, 1), rng.uniform(-1, 1)
+        pairs.append((blob(8, rng), blob(4, rng, x, y)))
+    print('{} convex pairs'.format(convexCount))
+    timed('intersection', convexPairs, pairs)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,62 @@
+'''Packed sequence benchmarks
+
+Compares Polygon with PackedPolygon for a large polygon: building
+it, setting and missing attributes (which PointSequence checks
+against its labels), the first containment test, which computes
+the bounds and coordinate caches, the area and the bounds after a
+vertex moves.
+Run from the top of the source tree:
+
+ $ python3 benchmarks/bench_packed.py [vertices] [lookups]
+'''
+
+import math
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point, Polygon
+from Geometry.packed import PackedPolygon
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format(label, elapsed))
+    return result
+
+
+def lookups(polygon, count):
+    # an assignment and a cache miss, both resolve labels in
+    # PointSequence
+    for i in range(count):
+        polygon.tag = i
+        getattr(polygon, '_missing', None)
+
+
+def moved(polygon):
+    polygon[0].x -= 1
+    return polygon.bounds
+
+
+def main(vertices=1000000, count=1000000):
+    angles = numpy.linspace(0, 2 * math.pi, vertices, endpoint=False)
+    xy = numpy.column_stack([numpy.cos(angles), numpy.sin(angles)])
+    points = [Point(x, y) for x, y in xy.tolist()]
+
+    for cls, data in ((Polygon, points), (PackedPolygon, xy)):
+        print('{} with {} vertices'.format(cls.__name__, vertices))
+        polygon = timed('build', cls, data)
+        timed('contains', polygon.__contains__, Point(0.5, 0.5))
+        timed('{} lookups'.format(count), lookups, polygon, count)
+        timed('area', lambda: polygon.area)
+        timed('move and bounds', moved, polygon)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
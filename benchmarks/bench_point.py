@@ -0,0 +1,68 @@
+'''Point micro-benchmarks
+
+Reports the per-instance memory of Point and the cost of the most
+common coordinate operations. Run from the top of the source tree:
+
+ $ python3 benchmarks/bench_point.py
+'''
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point
+
+
+def memoryPerPoint(count=100000):
+    '''
+    :count: optional integer number of points to allocate
+    :return: float bytes per point
+    '''
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    points = [Point(i, i, i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(s.size_diff for s in after.compare_to(before, 'filename'))
+    # the list holding the points is not part of a point's footprint
+    return (size - sys.getsizeof(points)) / count
+
+
+def report(name, stmt, number=100000, setup='pass', **names):
+    '''
+    :name:   string label
+    :stmt:   string statement to time
+    :number: optional integer repetitions
+    :return: None
+
+    Prints the mean cost of 'stmt' in microseconds.
+    '''
+    names.setdefault('Point', Point)
+    t = timeit.timeit(stmt, setup, number=number, globals=names)
+    print('{:>24}: {:8.3f} usec'.format(name, (t / number) * 1e6))
+
+
+def main():
+    a = Point(1, 2, 3)
+    b = Point(4, 5, 6)
+
+    print('{:>24}: {:8.1f} bytes'.format('memory per point',
+                                         memoryPerPoint()))
+    report('Point(1, 2, 3)', 'Point(1, 2, 3)')
+    report('Point(a)', 'Point(a)', a=a)
+    report('a.x', 'a.x', a=a)
+    report('a.x = 1.5', 'a.x = 1.5', a=a)
+    report('a.xyz', 'a.xyz', a=a)
+    report('a.xyz = b', 'a.xyz = b', a=Point(), b=b)
+    report('a + b', 'a + b', a=a, b=b)
+    report('a * 2', 'a * 2', a=a)
+    report('a.distance(b)', 'a.distance(b)', a=a, b=b)
+    report('a.ccw(b, c)', 'a.ccw(b, c)', a=a, b=b, c=Point(7, 9, 1))
+    report('hash(Point)', 'hash(Point(1, 2, 3))')
+
+
+if __name__ == '__main__':
+    main()
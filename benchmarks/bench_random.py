@@ -0,0 +1,38 @@
+'''Random point generator benchmarks
+
+Compares building points one at a time with Point.random and
+Point.gaussian against the batch PointArray generators. Run from
+the top of the source tree:
+
+ $ python3 benchmarks/bench_random.py [count]
+'''
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point, PointArray
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format(label, elapsed))
+    return result
+
+
+def main(count=1000000):
+    timed('Point.random x {}'.format(count),
+          lambda: [Point.random() for _ in range(count)])
+    timed('PointArray.randomInSphere',
+          lambda: PointArray.randomInSphere(count, rng=1))
+    timed('Point.gaussian x {}'.format(count),
+          lambda: [Point.gaussian() for _ in range(count)])
+    timed('PointArray.gaussian', lambda: PointArray.gaussian(count, rng=1))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
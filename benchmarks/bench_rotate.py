@@ -0,0 +1,55 @@
+'''Rotation benchmarks
+
+Compares rotating every point of a sequence by chaining rotate2d
+about each axis against the single cached matrix of Point.rotate,
+MutablePointSequence.irotate and PointArray.irotate. Run from the
+top of the source tree:
+
+ $ python3 benchmarks/bench_rotate.py [count]
+'''
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point, MutablePointSequence, PointArray
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format(label, elapsed))
+    return result
+
+
+def main(count=100000):
+    points = [Point.gaussian() for _ in range(count)]
+    origin = Point(1, 2, 3)
+
+    def chained():
+        return [p.rotate2d(10, origin, 'x').rotate2d(20, origin, 'y')
+                 .rotate2d(30, origin, 'z') for p in points]
+
+    expected = timed('rotate2d x 3 x {}'.format(count), chained)
+
+    result = timed('Point.rotate x {}'.format(count),
+                   lambda: [p.rotate(10, 20, 30, origin) for p in points])
+
+    seq = MutablePointSequence([Point(p) for p in points])
+    timed('MutablePointSequence.irotate',
+          lambda: seq.irotate(10, 20, 30, origin))
+
+    array = PointArray(points)
+    timed('PointArray.irotate', lambda: array.irotate(10, 20, 30, origin))
+
+    for p, q, r, s in zip(expected, result, seq, array.points()):
+        assert p.distance(q) < 1e-9
+        assert p.distance(r) < 1e-9
+        assert p.distance(s) < 1e-9
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
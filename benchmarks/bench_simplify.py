@@ -0,0 +1,61 @@
+'''Polyline simplification benchmarks
+
+Simplifies a random walk and a slowly widening spiral track of
+growing size with both methods, with and without topology
+preservation. The random walk crosses itself everywhere, its own
+crossings are kept and only those the simplification adds are
+repaired. Run from the top of the source tree:
+
+ $ python3 benchmarks/bench_simplify.py [largest]
+'''
+
+import math
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry.simplify import douglasPeucker, visvalingamWhyatt
+
+
+def walk(count, rng):
+    return numpy.cumsum(rng.normal(size=(count, 2)), axis=0)
+
+
+def spiral(count, rng):
+    t = numpy.linspace(0, 40 * math.pi, count)
+    r = 1 + t + rng.normal(scale=0.05, size=count)
+    return numpy.column_stack([r * numpy.cos(t), r * numpy.sin(t)])
+
+
+def timed(label, func, *args, **kwds):
+    start = time.perf_counter()
+    result = func(*args, **kwds)
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec {:>8} kept'.format(label, elapsed,
+                                                   len(result)))
+    return result
+
+
+def main(largest=1000000):
+    rng = numpy.random.default_rng(1)
+
+    count = 10000
+    while count <= largest:
+        for name, xy in (('walk', walk(count, rng)),
+                         ('spiral', spiral(count, rng))):
+            print('{} vertices, {}'.format(count, name))
+            timed('douglasPeucker', douglasPeucker, xy, 1.0)
+            timed('douglasPeucker topology', douglasPeucker, xy, 1.0,
+                  preserveTopology=True)
+            timed('visvalingamWhyatt', visvalingamWhyatt, xy, 1.0)
+            timed('visvalingamWhyatt topology', visvalingamWhyatt, xy, 1.0,
+                  preserveTopology=True)
+        count *= 10
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
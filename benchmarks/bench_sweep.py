@@ -0,0 +1,87 @@
+'''Segment intersection benchmarks
+
+Finds every intersecting pair among short random segments in the
+unit square with the sweep and with Segment.doesIntersect on all
+pairs, then times the sweep alone on larger sets, and on long
+segments stacked up the square which the sweep line crosses all at
+once. Run from the top of the source tree:
+
+ $ python3 benchmarks/bench_sweep.py [brute] [largest]
+'''
+
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point, Segment
+from Geometry.sweep import segmentIntersections
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format(label, elapsed))
+    return result
+
+
+def randomSegments(count, length, rng):
+    segments = []
+    for _ in range(count):
+        x, y = rng.random(), rng.random()
+        a = rng.uniform(0, 2 * math.pi)
+        r = rng.uniform(0, length)
+        segments.append(((x, y), (x + (r * math.cos(a)),
+                                  y + (r * math.sin(a)))))
+    return segments
+
+
+def stackedSegments(count, rng):
+    segments = []
+    for i in range(count):
+        ay = (i + rng.uniform(0, 0.5)) / count
+        by = (i + rng.uniform(0, 0.5)) / count
+        segments.append(((rng.uniform(0, 0.1), ay),
+                         (rng.uniform(0.9, 1), by)))
+    return segments
+
+
+def bruteForce(segments):
+    pairs = []
+    for i, s in enumerate(segments):
+        for j in range(i + 1, len(segments)):
+            if s.doesIntersect(segments[j]):
+                pairs.append((i, j))
+    return pairs
+
+
+def main(brute=1000, largest=250000):
+    rng = random.Random(21)
+
+    count = 250
+    while count <= brute:
+        xy = randomSegments(count, 0.1, rng)
+        segments = [Segment(Point(a), Point(b)) for a, b in xy]
+        print('{} segments'.format(count))
+        found = timed('segmentIntersections', segmentIntersections, xy)
+        pairs = timed('brute force', bruteForce, segments)
+        assert len(found) == len(pairs)
+        count *= 2
+
+    count = 10000
+    while count <= largest:
+        # keep the number of crossings proportional to the segments
+        xy = randomSegments(count, 10 / math.sqrt(count), rng)
+        print('{} segments'.format(count))
+        found = timed('segmentIntersections', segmentIntersections, xy)
+        print('{:>28}: {:8d}'.format('pairs', len(found)))
+        timed('stacked', segmentIntersections, stackedSegments(count, rng))
+        count *= 5
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,50 @@
+'''Transform benchmarks
+
+Compares moving every vertex of a polygon with a chain of rotate2d,
++= and *= calls against composing one Transform and applying it in
+a single matrix multiply. Run from the top of the source tree:
+
+ $ python3 benchmarks/bench_transform.py [count]
+'''
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point, Polygon, Transform
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format(label, elapsed))
+    return result
+
+
+def main(count=100000):
+    polygon = Polygon([Point.gaussian() for _ in range(count)])
+    offset = Point(1, 2, 3)
+
+    def chained():
+        result = []
+        for p in polygon:
+            q = p.rotate2d(30)
+            q += offset
+            q *= 2
+            result.append(q)
+        return result
+
+    expected = timed('chained x {}'.format(count), chained)
+
+    t = Transform.rotation(0, 0, 30).translate(offset).scale(2)
+    result = timed('Transform.apply', lambda: t(polygon))
+
+    for p, q in zip(expected, result):
+        assert p.distance(q) < 1e-9
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
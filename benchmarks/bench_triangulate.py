@@ -0,0 +1,81 @@
+'''Polygon triangulation benchmarks
+
+Triangulates random star shaped polygons of growing size, returning
+Triangles and index rows, and compares a naive O(n**2) ear clipping
+on the smaller polygons. Run from the top of the source tree:
+
+ $ python3 benchmarks/bench_triangulate.py [largest] [earLimit]
+'''
+
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from Geometry import Point, Polygon
+from Geometry.triangulation import triangulate
+
+
+def star(count, rng):
+    points = []
+    for i in range(count):
+        angle = 2 * math.pi * i / count
+        r = rng.uniform(0.2, 1.0)
+        points.append(Point(r * math.cos(angle), r * math.sin(angle)))
+    return Polygon(points)
+
+
+def cross(a, b, c):
+    return ((b[0] - a[0]) * (c[1] - a[1])) - ((b[1] - a[1]) * (c[0] - a[0]))
+
+
+def earClipping(polygon):
+    xy = polygon.xy
+    if polygon.signedArea < 0:
+        xy = xy[::-1]
+    remaining = list(range(len(xy)))
+    triangles = []
+    while len(remaining) > 3:
+        n = len(remaining)
+        for i in range(n):
+            a, b, c = remaining[i - 1], remaining[i], remaining[(i + 1) % n]
+            if cross(xy[a], xy[b], xy[c]) <= 0:
+                continue
+            if any(cross(xy[a], xy[b], xy[p]) >= 0 and
+                   cross(xy[b], xy[c], xy[p]) >= 0 and
+                   cross(xy[c], xy[a], xy[p]) >= 0
+                   for p in remaining if p not in (a, b, c)):
+                continue
+            triangles.append((a, b, c))
+            del remaining[i]
+            break
+    triangles.append(tuple(remaining))
+    return triangles
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print('{:>28}: {:8.3f} sec'.format(label, elapsed))
+    return result
+
+
+def main(largest=100000, earLimit=1000):
+    rng = random.Random(1)
+    count = 100
+    while count <= largest:
+        polygon = star(count, rng)
+        print('{} vertices'.format(count))
+        timed('triangulate', triangulate, polygon)
+        timed('triangulate indices', triangulate, polygon, True)
+        if count <= earLimit:
+            timed('ear clipping', earClipping, polygon)
+        count *= 10
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -10,6 +10,7 @@ long_description = '''
 Geometry is python3 package which implements a variety of geometric objects:
 
 - point
+- point array
 - ellipse
 - circle
 - line
@@ -59,7 +60,7 @@ setup(name='Geometry',
       keywords='geometry point circle line segment triangle rectangle graph',
       packages=find_packages(exclude=['contrib']),
       test_suite='Geometry.tests',
-      install_requires=[],
+      install_requires=['numpy'],
       extras_require={},
       package_data={},
       data_files=[],